@@ -1,8 +1,13 @@
 from __future__ import annotations
 
+import json
 import os
+import queue
+import threading
 
-from typing_extensions import Any
+from typing_extensions import Any, Iterable, Iterator, TypeVar
+
+T = TypeVar("T")
 
 
 def update_dict_values(obj: dict[str, Any], /, **kwargs: Any) -> None:
@@ -64,3 +69,197 @@ def is_connect_cloud() -> bool:
 def is_local() -> bool:
     """Returns true if called from a piece of content running locally."""
     return not is_connect() and not is_connect_cloud() and not is_workbench()
+
+
+class _Raised:
+    """An exception raised by the producer of `in_background`."""
+
+    def __init__(self, error: Exception) -> None:
+        self.error = error
+
+
+# Marks the end of the items produced by `in_background`.
+_DONE = object()
+
+
+class InBackground(Iterator[T]):
+    """The items of an iterator, consumed on a background thread; see `in_background`."""
+
+    def __init__(self, items: Iterator[T], ahead: int, name: str) -> None:
+        # Each permit allows one item to be produced ahead of the caller.
+        self._permits = threading.Semaphore(ahead)
+        self._produced: queue.Queue = queue.Queue()
+        self._stopped = threading.Event()
+        self._done = False
+        # The thread does not reference the instance, so that dropping it stops the thread.
+        threading.Thread(
+            target=_produce,
+            args=(items, self._permits, self._produced, self._stopped),
+            name=name,
+            daemon=True,
+        ).start()
+
+    def __next__(self) -> T:
+        if self._done:
+            raise StopIteration
+        item = self._produced.get()
+        if item is _DONE or isinstance(item, _Raised):
+            self._done = True
+            self.close()
+            if item is _DONE:
+                raise StopIteration
+            raise item.error
+        self._permits.release()
+        return item
+
+    def close(self) -> None:
+        """Stop the background thread once it has produced the item it is working on."""
+        if not self._stopped.is_set():
+            # Wake the producer so it observes the stop instead of producing another item.
+            self._stopped.set()
+            self._permits.release()
+
+    def __del__(self) -> None:
+        self.close()
+
+
+def _produce(
+    items: Iterator[Any],
+    permits: threading.Semaphore,
+    produced: queue.Queue,
+    stopped: threading.Event,
+) -> None:
+    try:
+        while True:
+            permits.acquire()
+            if stopped.is_set():
+                return
+            item = next(items, _DONE)
+            if item is _DONE:
+                return
+            produced.put(item)
+    except Exception as e:
+        # Raised to the consumer by `InBackground.__next__`.
+        produced.put(_Raised(e))
+    finally:
+        produced.put(_DONE)
+
+
+def in_background(items: Iterator[T], ahead: int, *, name: str) -> InBackground[T]:
+    """Consume an iterator on a background thread, at most `ahead` items ahead of the caller.
+
+    The thread starts right away rather than on the first `next()`, so that several iterators
+    can be consumed concurrently, e.g. before merging them. Exceptions raised by the iterator are
+    raised to the caller. Closing the returned iterator, or dropping it, stops the background
+    thread once it has produced the item it is working on.
+
+    Parameters
+    ----------
+    items : Iterator[T]
+        The iterator to consume.
+    ahead : int
+        The maximum number of items produced ahead of the caller.
+    name : str
+        The name of the background thread.
+
+    Returns
+    -------
+    InBackground[T]
+    """
+    return InBackground(items, ahead, name)
+
+
+# Whitespace and the commas between array elements.
+_SEPARATORS = frozenset(" \t\n\r,")
+
+
+def count_json_array(chunks: Iterable[str]) -> int:
+    """Count the elements of a JSON array read in chunks of text.
+
+    Each element is decoded on its own and discarded, so the array is never held in memory.
+
+    Parameters
+    ----------
+    chunks : Iterable[str]
+        The text of the array, in consecutive chunks.
+
+    Returns
+    -------
+    int
+
+    Raises
+    ------
+    ValueError
+        If the text is not a JSON array.
+    """
+    counter = JsonArrayCounter()
+    for chunk in chunks:
+        if counter.feed(chunk):
+            break
+    return counter.end()
+
+
+class JsonArrayCounter:
+    """Count the elements of a JSON array fed in chunks of text.
+
+    The incremental form of `count_json_array`, for text that arrives asynchronously.
+    """
+
+    def __init__(self) -> None:
+        self._decoder = json.JSONDecoder()
+        self._text = ""
+        self._opened = False
+        self._closed = False
+        self._count = 0
+
+    def feed(self, chunk: str) -> bool:
+        """Parse the next chunk of text, and return whether the array has ended."""
+        self._parse(chunk)
+        return self._closed
+
+    def end(self) -> int:
+        """Parse the rest of the text, and return the number of elements.
+
+        Raises
+        ------
+        ValueError
+            If the text is not a JSON array.
+        """
+        self._parse(None)
+        if not self._closed:
+            raise ValueError("Expected a JSON array.")
+        return self._count
+
+    def _parse(self, chunk: str | None) -> None:
+        # `None` marks the end of the text.
+        if self._closed:
+            return
+        text = self._text + (chunk or "")
+        position = 0
+        while True:
+            while position < len(text) and text[position] in _SEPARATORS:
+                position += 1
+            if position == len(text):
+                break
+            if not self._opened:
+                if text[position] != "[":
+                    raise ValueError("Expected a JSON array.")
+                self._opened = True
+                position += 1
+                continue
+            if text[position] == "]":
+                self._closed = True
+                break
+            try:
+                _, end = self._decoder.raw_decode(text, position)
+            except json.JSONDecodeError:
+                if chunk is None:
+                    raise
+                # The element continues in the next chunk.
+                break
+            if end == len(text) and chunk is not None:
+                # A number may continue in the next chunk.
+                break
+            self._count += 1
+            position = end
+        self._text = text[position:]
@@ -0,0 +1,6 @@
+"""Asynchronous client for Posit Connect.
+
+Requires the `httpx` package.
+"""
+
+from .client import AsyncClient as AsyncClient
@@ -0,0 +1,233 @@
+"""Asynchronous client connection for Posit Connect."""
+
+from __future__ import annotations
+
+import weakref
+from contextlib import asynccontextmanager
+
+from typing_extensions import TYPE_CHECKING, Any, AsyncIterator, Self
+
+from ..config import Config
+from ..hooks import raise_for_error, warn_if_deprecated
+from .content import AsyncContent
+from .groups import AsyncGroups
+from .metrics import AsyncMetrics
+from .oauth import AsyncOAuth
+from .tasks import AsyncTasks
+from .users import AsyncUsers
+
+try:
+    import httpx
+except ImportError as e:
+    raise ImportError("The 'httpx' package is required to use this module.") from e
+
+if TYPE_CHECKING:
+    from types import TracebackType
+
+
+class AsyncContext:
+    def __init__(self, client: AsyncClient):
+        # Since this is a child object of the client, we use a weak reference to avoid circular
+        # references (which would prevent garbage collection)
+        self.client: AsyncClient = weakref.proxy(client)
+
+
+class AsyncClient:
+    """
+    Asynchronous client connection for Posit Connect.
+
+    Mirrors the read operations of [](`posit.connect.Client`) on an `httpx.AsyncClient`, so that
+    many requests can run concurrently on a single event loop. Requires the `httpx` package.
+
+    Records are returned as dictionaries. Changing a record does not change the resource on the
+    server; use [](`posit.connect.Client`) to modify resources.
+
+    Parameters
+    ----------
+    url : str, optional
+        The Connect server URL. Read from `CONNECT_SERVER` when not provided.
+    api_key : str, optional
+        The API key credential for client authentication. Read from `CONNECT_API_KEY` when not
+        provided.
+    max_connections : int, optional
+        The maximum number of concurrent connections, by default 100
+    max_keepalive_connections : int, optional
+        The maximum number of idle connections kept alive for reuse, by default 20
+    timeout : float, optional
+        The request timeout in seconds, by default None (no timeout)
+    transport : httpx.AsyncBaseTransport, optional
+        A custom transport, by default None
+
+    Attributes
+    ----------
+    content: AsyncContent
+        Content resource.
+    groups: AsyncGroups
+        Groups resource.
+    metrics: AsyncMetrics
+        Metrics resource.
+    oauth: AsyncOAuth
+        OAuth resource.
+    tasks: AsyncTasks
+        Tasks resource.
+    users: AsyncUsers
+        Users resource.
+
+    Examples
+    --------
+    ```python
+    import asyncio
+
+    from posit.connect.aio import AsyncClient
+
+
+    async def main():
+        async with AsyncClient() as client:
+            guids = ["GUID_1", "GUID_2", "GUID_3"]
+            items = await asyncio.gather(*(client.content.get(guid) for guid in guids))
+            async for user in client.users.iter_find():
+                print(user["username"])
+
+
+    asyncio.run(main())
+    ```
+    """
+
+    def __init__(
+        self,
+        url: str | None = None,
+        api_key: str | None = None,
+        *,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        timeout: float | None = None,
+        transport: httpx.AsyncBaseTransport | None = None,
+    ) -> None:
+        self.cfg = Config(api_key=api_key, url=url)
+        self.session = httpx.AsyncClient(
+            headers={"Authorization": f"Key {self.cfg.api_key}"},
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections,
+            ),
+            timeout=timeout,
+            transport=transport,
+        )
+        self._ctx = AsyncContext(self)
+
+    @property
+    def content(self) -> AsyncContent:
+        return AsyncContent(self._ctx)
+
+    @property
+    def groups(self) -> AsyncGroups:
+        return AsyncGroups(self._ctx)
+
+    @property
+    def metrics(self) -> AsyncMetrics:
+        return AsyncMetrics(self._ctx)
+
+    @property
+    def oauth(self) -> AsyncOAuth:
+        return AsyncOAuth(self._ctx)
+
+    @property
+    def tasks(self) -> AsyncTasks:
+        return AsyncTasks(self._ctx)
+
+    @property
+    def users(self) -> AsyncUsers:
+        return AsyncUsers(self._ctx)
+
+    async def aclose(self) -> None:
+        """Close the underlying connections."""
+        await self.session.aclose()
+
+    async def __aenter__(self) -> Self:
+        """Enter method for using the client as an asynchronous context manager."""
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        """Close the underlying connections."""
+        await self.aclose()
+
+    async def request(self, method: str, path: str, **kwargs: Any) -> httpx.Response:
+        """
+        Send an HTTP request.
+
+        A facade for [](`httpx.AsyncClient.request`) configured for the target server.
+
+        Parameters
+        ----------
+        method : str
+            The HTTP method to use for the request.
+        path : str
+            Appended to the configured base url.
+        **kwargs
+            Additional keyword arguments passed to [](`httpx.AsyncClient.request`).
+
+        Returns
+        -------
+        httpx.Response
+
+        Raises
+        ------
+        ClientError
+            If Connect responds with an error.
+        httpx.HTTPStatusError
+            If the server responds with an error that is not from Connect.
+        """
+        url = self.cfg.url + path
+        response = await self.session.request(method, url, **kwargs)
+        warn_if_deprecated(response, stacklevel=3)
+        raise_for_error(response)
+        return response
+
+    @asynccontextmanager
+    async def stream(self, method: str, path: str, **kwargs: Any) -> AsyncIterator[httpx.Response]:
+        """
+        Send an HTTP request, and read its response body as it arrives.
+
+        A facade for [](`httpx.AsyncClient.stream`) configured for the target server. Errors are
+        raised as by `request`.
+
+        Parameters
+        ----------
+        method : str
+            The HTTP method to use for the request.
+        path : str
+            Appended to the configured base url.
+        **kwargs
+            Additional keyword arguments passed to [](`httpx.AsyncClient.stream`).
+
+        Yields
+        ------
+        httpx.Response
+        """
+        url = self.cfg.url + path
+        async with self.session.stream(method, url, **kwargs) as response:
+            warn_if_deprecated(response, stacklevel=4)
+            if response.is_error:
+                await response.aread()
+                raise_for_error(response)
+            yield response
+
+    async def get(self, path: str, **kwargs: Any) -> httpx.Response:
+        return await self.request("GET", path, **kwargs)
+
+    async def post(self, path: str, **kwargs: Any) -> httpx.Response:
+        return await self.request("POST", path, **kwargs)
+
+    async def put(self, path: str, **kwargs: Any) -> httpx.Response:
+        return await self.request("PUT", path, **kwargs)
+
+    async def patch(self, path: str, **kwargs: Any) -> httpx.Response:
+        return await self.request("PATCH", path, **kwargs)
+
+    async def delete(self, path: str, **kwargs: Any) -> httpx.Response:
+        return await self.request("DELETE", path, **kwargs)
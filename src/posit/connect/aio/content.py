@@ -0,0 +1,102 @@
+"""Asynchronous content resources."""
+
+from __future__ import annotations
+
+import os
+
+from typing_extensions import TYPE_CHECKING, Any, List
+
+from .._utils import JsonArrayCounter
+from .resources import AsyncBaseResource, AsyncResources
+
+if TYPE_CHECKING:
+    from .client import AsyncContext
+
+
+class AsyncContentItem(AsyncBaseResource):
+    """Asynchronous counterpart of [](`posit.connect.content.ContentItem`)."""
+
+
+class AsyncContent(AsyncResources):
+    """Asynchronous counterpart of [](`posit.connect.content.Content`)."""
+
+    def __init__(self, ctx: AsyncContext, *, owner_guid: str | None = None) -> None:
+        super().__init__(ctx)
+        self.owner_guid = owner_guid
+
+    async def count(self) -> int:
+        """Count the number of content items.
+
+        The content list is streamed and its entries are counted one at a time, as in
+        [](`posit.connect.content.Content.count`).
+
+        Returns
+        -------
+        int
+        """
+        params = {"owner_guid": self.owner_guid} if self.owner_guid else None
+        counter = JsonArrayCounter()
+        async with self._ctx.client.stream("GET", "v1/content", params=params) as response:
+            async for chunk in response.aiter_text():
+                if counter.feed(chunk):
+                    break
+        return counter.end()
+
+    async def find(
+        self, include: str | list[Any] | None = None, **conditions
+    ) -> List[AsyncContentItem]:
+        """Find content matching the specified conditions.
+
+        See [](`posit.connect.content.Content.find`) for the supported conditions.
+
+        Returns
+        -------
+        List[AsyncContentItem]
+        """
+        if isinstance(include, list):
+            include = ",".join(include)
+
+        if include is not None:
+            conditions["include"] = include
+
+        if self.owner_guid:
+            conditions["owner_guid"] = self.owner_guid
+
+        response = await self._ctx.client.get("v1/content", params=conditions)
+        return [AsyncContentItem(self._ctx, **result) for result in response.json()]
+
+    async def find_one(self, **conditions) -> AsyncContentItem | None:
+        """Find first content result matching the specified conditions.
+
+        Returns
+        -------
+        AsyncContentItem | None
+        """
+        items = await self.find(**conditions)
+        return next(iter(items), None)
+
+    async def get(self, guid: str | None = None) -> AsyncContentItem:
+        """Get a content item.
+
+        If `guid` is None, attempts to get the content item for the current context using the
+        CONNECT_CONTENT_GUID environment variable, which is automatically set when running on Connect.
+
+        Parameters
+        ----------
+        guid : str, optional
+            The unique identifier of the content item.
+
+        Returns
+        -------
+        AsyncContentItem
+        """
+        if guid is None:
+            guid = os.getenv("CONNECT_CONTENT_GUID")
+            if not guid:
+                raise RuntimeError("CONNECT_CONTENT_GUID environment variable is not set.")
+
+        # Always request all available optional fields for the content item
+        params = {"include": "owner,tags,vanity_url"}
+
+        response = await self._ctx.client.get(f"v1/content/{guid}", params=params)
+        return AsyncContentItem(self._ctx, **response.json())
@@ -0,0 +1,154 @@
+"""Asynchronous group resources."""
+
+from __future__ import annotations
+
+from typing_extensions import TYPE_CHECKING, AsyncGenerator, List
+
+from .paginator import AsyncPaginator
+from .resources import AsyncBaseResource, AsyncResources
+from .users import AsyncUser
+
+if TYPE_CHECKING:
+    from .client import AsyncContext
+
+
+class AsyncGroup(AsyncBaseResource):
+    """Asynchronous counterpart of [](`posit.connect.groups.Group`)."""
+
+    @property
+    def members(self) -> AsyncGroupMembers:
+        """The group members.
+
+        Returns
+        -------
+        AsyncGroupMembers
+        """
+        return AsyncGroupMembers(self._ctx, self["guid"])
+
+
+class AsyncGroupMembers(AsyncResources):
+    """Asynchronous counterpart of [](`posit.connect.groups.GroupMembers`)."""
+
+    def __init__(self, ctx: AsyncContext, group_guid: str) -> None:
+        super().__init__(ctx)
+        self._group_guid = group_guid
+
+    async def find(self) -> List[AsyncUser]:
+        """Find group members.
+
+        Returns
+        -------
+        List[AsyncUser]
+            All the users in the group.
+        """
+        return [user async for user in self.iter_find()]
+
+    async def iter_find(self) -> AsyncGenerator[AsyncUser, None]:
+        """Lazily find group members.
+
+        Yields
+        ------
+        AsyncUser
+        """
+        path = f"v1/groups/{self._group_guid}/members"
+        paginator = AsyncPaginator(self._ctx, path)
+        async for page in paginator.fetch_pages():
+            for result in page.results:
+                yield AsyncUser(self._ctx, **result)
+
+    async def count(self) -> int:
+        """Count the number of group members.
+
+        Returns
+        -------
+        int
+        """
+        response = await self._ctx.client.get(
+            f"v1/groups/{self._group_guid}/members",
+            params={"page_size": 1},
+        )
+        return response.json()["total"]
+
+
+class AsyncGroups(AsyncResources):
+    """Asynchronous counterpart of [](`posit.connect.groups.Groups`)."""
+
+    def members(self, guid: str) -> AsyncGroupMembers:
+        """The members of a group.
+
+        Parameters
+        ----------
+        guid : str
+            The group guid.
+
+        Returns
+        -------
+        AsyncGroupMembers
+        """
+        return AsyncGroupMembers(self._ctx, guid)
+
+    async def find(self, **kwargs) -> List[AsyncGroup]:
+        """Find groups.
+
+        Parameters
+        ----------
+        prefix: str
+            Filter by group name prefix. Casing is ignored.
+
+        Returns
+        -------
+        List[AsyncGroup]
+        """
+        return [group async for group in self.iter_find(**kwargs)]
+
+    async def iter_find(self, **kwargs) -> AsyncGenerator[AsyncGroup, None]:
+        """Lazily find groups.
+
+        Parameters
+        ----------
+        prefix: str
+            Filter by group name prefix. Casing is ignored.
+
+        Yields
+        ------
+        AsyncGroup
+        """
+        paginator = AsyncPaginator(self._ctx, "v1/groups", params=kwargs)
+        async for page in paginator.fetch_pages():
+            for result in page.results:
+                yield AsyncGroup(self._ctx, **result)
+
+    async def find_one(self, **kwargs) -> AsyncGroup | None:
+        """Find one group.
+
+        Returns
+        -------
+        AsyncGroup | None
+        """
+        groups = self.iter_find(**kwargs)
+        try:
+            return await groups.__anext__()
+        except StopAsyncIteration:
+            return None
+        finally:
+            await groups.aclose()
+
+    async def get(self, guid: str) -> AsyncGroup:
+        """Get group.
+
+        Returns
+        -------
+        AsyncGroup
+        """
+        response = await self._ctx.client.get(f"v1/groups/{guid}")
+        return AsyncGroup(self._ctx, **response.json())
+
+    async def count(self) -> int:
+        """Count the number of groups.
+
+        Returns
+        -------
+        int
+        """
+        response = await self._ctx.client.get("v1/groups", params={"page_size": 1})
+        return response.json()["total"]
@@ -0,0 +1,181 @@
+"""Asynchronous metric resources."""
+
+from __future__ import annotations
+
+import heapq
+
+from typing_extensions import TYPE_CHECKING, AsyncGenerator, List, Tuple
+
+from ..metrics.rename_params import rename_params
+from ..metrics.shiny_usage import _ShinyUsageEventFields
+from ..metrics.usage import _started, _UsageEventFields
+from ..metrics.visits import _VisitEventFields
+from .paginator import AsyncCursorPaginator
+from .resources import AsyncBaseResource, AsyncResources
+
+if TYPE_CHECKING:
+    from datetime import datetime
+
+
+class AsyncVisitEvent(AsyncBaseResource, _VisitEventFields):
+    """Asynchronous counterpart of [](`posit.connect.metrics.visits.VisitEvent`)."""
+
+
+class AsyncShinyUsageEvent(AsyncBaseResource, _ShinyUsageEventFields):
+    """Asynchronous counterpart of [](`posit.connect.metrics.shiny_usage.ShinyUsageEvent`)."""
+
+
+class AsyncUsageEvent(AsyncBaseResource, _UsageEventFields):
+    """Asynchronous counterpart of [](`posit.connect.metrics.usage.UsageEvent`)."""
+
+    @staticmethod
+    def from_event(event: AsyncVisitEvent | AsyncShinyUsageEvent) -> AsyncUsageEvent:
+        if isinstance(event, AsyncVisitEvent):
+            return AsyncUsageEvent(event._ctx, **AsyncUsageEvent._visit_fields(event))
+
+        if isinstance(event, AsyncShinyUsageEvent):
+            return AsyncUsageEvent(event._ctx, **AsyncUsageEvent._shiny_usage_fields(event))
+
+        raise TypeError
+
+
+class AsyncVisits(AsyncResources):
+    """Asynchronous counterpart of [](`posit.connect.metrics.visits.Visits`)."""
+
+    async def find(self, **kwargs) -> List[AsyncVisitEvent]:
+        """Find visits.
+
+        Returns
+        -------
+        List[AsyncVisitEvent]
+        """
+        return [event async for event in self.iter_find(**kwargs)]
+
+    async def iter_find(self, **kwargs) -> AsyncGenerator[AsyncVisitEvent, None]:
+        """Lazily find visits.
+
+        Yields
+        ------
+        AsyncVisitEvent
+        """
+        params = rename_params(kwargs)
+        path = "/v1/instrumentation/content/visits"
+        paginator = AsyncCursorPaginator(self._ctx, path, params=params)
+        async for page in paginator.fetch_pages():
+            for result in page.results:
+                yield AsyncVisitEvent(self._ctx, **result)
+
+
+class AsyncShinyUsage(AsyncResources):
+    """Asynchronous counterpart of [](`posit.connect.metrics.shiny_usage.ShinyUsage`)."""
+
+    async def find(self, **kwargs) -> List[AsyncShinyUsageEvent]:
+        """Find usage.
+
+        Returns
+        -------
+        List[AsyncShinyUsageEvent]
+        """
+        return [event async for event in self.iter_find(**kwargs)]
+
+    async def iter_find(self, **kwargs) -> AsyncGenerator[AsyncShinyUsageEvent, None]:
+        """Lazily find usage.
+
+        Yields
+        ------
+        AsyncShinyUsageEvent
+        """
+        params = rename_params(kwargs)
+        path = "/v1/instrumentation/shiny/usage"
+        paginator = AsyncCursorPaginator(self._ctx, path, params=params)
+        async for page in paginator.fetch_pages():
+            for result in page.results:
+                yield AsyncShinyUsageEvent(self._ctx, **result)
+
+
+class AsyncUsage(AsyncResources):
+    """Asynchronous counterpart of [](`posit.connect.metrics.usage.Usage`)."""
+
+    async def find(self, **kwargs) -> List[AsyncUsageEvent]:
+        """Find view events.
+
+        Parameters
+        ----------
+        content_guid : str, optional
+            Filter by an associated unique content identifer.
+        min_data_version : int, optional
+            Filter by a minimum data version.
+        start : str, optional
+            Filter by the start time.
+        end : str, optional
+            Filter by the end time.
+
+        Returns
+        -------
+        List[AsyncUsageEvent]
+        """
+        return [event async for event in self.iter_find(**kwargs)]
+
+    async def iter_find(self, **kwargs) -> AsyncGenerator[AsyncUsageEvent, None]:
+        """Lazily find view events.
+
+        Visit events and Shiny usage events are merged in order of start time, as in
+        [](`posit.connect.metrics.usage.Usage.iter_find`).
+
+        Yields
+        ------
+        AsyncUsageEvent
+        """
+        sources = [
+            finder(self._ctx).iter_find(**kwargs) for finder in (AsyncVisits, AsyncShinyUsage)
+        ]
+        # The next event of each source that is not exhausted, by start time and then source.
+        heads: List[Tuple[datetime, int, AsyncUsageEvent]] = []
+        try:
+            for index, source in enumerate(sources):
+                async for event in source:
+                    usage = AsyncUsageEvent.from_event(event)
+                    heads.append((_started(usage), index, usage))
+                    break
+            heapq.heapify(heads)
+            while heads:
+                _, index, usage = heads[0]
+                yield usage
+                async for event in sources[index]:
+                    usage = AsyncUsageEvent.from_event(event)
+                    heapq.heapreplace(heads, (_started(usage), index, usage))
+                    break
+                else:
+                    heapq.heappop(heads)
+        finally:
+            for source in sources:
+                await source.aclose()
+
+    async def find_one(self, **kwargs) -> AsyncUsageEvent | None:
+        """Find a view event.
+
+        Returns
+        -------
+        AsyncUsageEvent | None
+        """
+        events = self.iter_find(**kwargs)
+        try:
+            return await events.__anext__()
+        except StopAsyncIteration:
+            return None
+        finally:
+            await events.aclose()
+
+
+class AsyncMetrics(AsyncResources):
+    """Asynchronous counterpart of [](`posit.connect.metrics.Metrics`).
+
+    Attributes
+    ----------
+    usage: AsyncUsage
+        Usage resource.
+    """
+
+    @property
+    def usage(self) -> AsyncUsage:
+        return AsyncUsage(self._ctx)
@@ -0,0 +1,89 @@
+"""Asynchronous OAuth resources."""
+
+from __future__ import annotations
+
+from ..oauth import types
+from ..oauth.oauth import Credentials, _get_content_session_token
+from .resources import AsyncResources
+
+
+class AsyncOAuth(AsyncResources):
+    """Asynchronous counterpart of [](`posit.connect.oauth.OAuth`)."""
+
+    _path = "v1/oauth/integrations/credentials"
+
+    async def get_credentials(
+        self,
+        user_session_token: str,
+        requested_token_type: str | types.OAuthTokenType | None = None,
+        audience: str | None = None,
+    ) -> Credentials:
+        """Perform an oauth credential exchange with a user-session-token.
+
+        See [](`posit.connect.oauth.OAuth.get_credentials`).
+
+        Returns
+        -------
+        Credentials
+        """
+        return await self._exchange(
+            types.OAuthTokenType.USER_SESSION_TOKEN,
+            user_session_token,
+            requested_token_type,
+            audience,
+        )
+
+    def has_content_credentials(self) -> bool:
+        """Check whether OAuth content credentials are available.
+
+        Returns
+        -------
+        bool
+        """
+        return _get_content_session_token() is not None
+
+    async def get_content_credentials(
+        self,
+        content_session_token: str | None = None,
+        requested_token_type: str | types.OAuthTokenType | None = None,
+        audience: str | None = None,
+    ) -> Credentials | None:
+        """Perform an oauth credential exchange with a content-session-token.
+
+        See [](`posit.connect.oauth.OAuth.get_content_credentials`).
+
+        Returns
+        -------
+        Credentials | None
+            The credentials obtained from the exchange, or None if no content
+            session token is available.
+        """
+        token = content_session_token or _get_content_session_token()
+        if token is None:
+            return None
+        return await self._exchange(
+            types.OAuthTokenType.CONTENT_SESSION_TOKEN,
+            token,
+            requested_token_type,
+            audience,
+        )
+
+    async def _exchange(
+        self,
+        subject_token_type: str,
+        subject_token: str,
+        requested_token_type: str | types.OAuthTokenType | None,
+        audience: str | None,
+    ) -> Credentials:
+        # craft a credential exchange request
+        data = {}
+        data["grant_type"] = types.GRANT_TYPE
+        data["subject_token_type"] = subject_token_type
+        data["subject_token"] = subject_token
+        if requested_token_type:
+            data["requested_token_type"] = requested_token_type
+        if audience:
+            data["audience"] = audience
+
+        response = await self._ctx.client.post(self._path, data=data)
+        return Credentials(**response.json())
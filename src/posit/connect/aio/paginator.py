@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+from typing_extensions import TYPE_CHECKING, Any, AsyncGenerator
+
+from ..cursors import _MAX_PAGE_SIZE as _MAX_CURSOR_PAGE_SIZE
+from ..cursors import CursorPage
+from ..paginator import _MAX_PAGE_SIZE, Page
+
+if TYPE_CHECKING:
+    from .client import AsyncContext
+
+
+class AsyncPaginator:
+    """Asynchronous counterpart of [](`posit.connect.paginator.Paginator`)."""
+
+    def __init__(
+        self,
+        ctx: AsyncContext,
+        path: str,
+        params: dict | None = None,
+        page_size: int | None = None,
+    ) -> None:
+        self._ctx = ctx
+        self._path = path
+        self._params = params or {}
+        self._page_size = page_size or _MAX_PAGE_SIZE
+
+    async def fetch_pages(self) -> AsyncGenerator[Page, None]:
+        """
+        Fetch pages of results from the API.
+
+        Yields
+        ------
+            Page: A page of results from the API.
+        """
+        count = 0
+        page_number = 1
+        while True:
+            page = await self.fetch_page(page_number)
+            page_number += 1
+            if len(page.results) == 0:
+                # stop if the result set is empty
+                return
+            yield page
+
+            count += len(page.results)
+            # The total may change between pages; see `Paginator.fetch_pages`.
+            if count >= page.total:
+                return
+
+    async def fetch_page(self, page_number: int) -> Page:
+        params = {
+            **self._params,
+            "page_number": page_number,
+            "page_size": self._page_size,
+        }
+        response = await self._ctx.client.get(self._path, params=params)
+        return Page(**response.json())
+
+
+class AsyncCursorPaginator:
+    """Asynchronous counterpart of [](`posit.connect.cursors.CursorPaginator`)."""
+
+    def __init__(
+        self,
+        ctx: AsyncContext,
+        path: str,
+        params: dict[str, Any] | None = None,
+    ) -> None:
+        self._ctx = ctx
+        self._path = path
+        self._params = params or {}
+
+    async def fetch_pages(self) -> AsyncGenerator[CursorPage, None]:
+        """Fetch pages.
+
+        Yields
+        ------
+        CursorPage
+        """
+        next_page = None
+        while True:
+            page = await self.fetch_page(next_page)
+            yield page
+            cursors: dict = page.paging.get("cursors", {})
+            next_page = cursors.get("next")
+            if not next_page:
+                # stop if a next page is not defined
+                return
+
+    async def fetch_page(self, next_page: str | None = None) -> CursorPage:
+        params = {
+            **self._params,
+            "limit": _MAX_CURSOR_PAGE_SIZE,
+        }
+        if next_page:
+            params["next"] = next_page
+        response = await self._ctx.client.get(self._path, params=params)
+        return CursorPage(**response.json())
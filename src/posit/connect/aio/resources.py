@@ -0,0 +1,22 @@
+from __future__ import annotations
+
+from typing_extensions import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .client import AsyncContext
+
+
+class AsyncBaseResource(dict):
+    """A record bound to an asynchronous client.
+
+    The asynchronous counterpart of [](`posit.connect.resources.BaseResource`).
+    """
+
+    def __init__(self, ctx: AsyncContext, /, **kwargs) -> None:
+        super().__init__(**kwargs)
+        self._ctx = ctx
+
+
+class AsyncResources:
+    def __init__(self, ctx: AsyncContext) -> None:
+        self._ctx = ctx
@@ -0,0 +1,33 @@
+"""Asynchronous task resources."""
+
+from __future__ import annotations
+
+from ..tasks import _TaskFields
+from .resources import AsyncBaseResource, AsyncResources
+
+
+class AsyncTask(AsyncBaseResource, _TaskFields):
+    """Asynchronous counterpart of [](`posit.connect.tasks.Task`)."""
+
+
+class AsyncTasks(AsyncResources):
+    """Asynchronous counterpart of [](`posit.connect.tasks.Tasks`)."""
+
+    async def get(self, uid: str, **kwargs) -> AsyncTask:
+        """Get a task.
+
+        Parameters
+        ----------
+        uid : str
+            Task identifier.
+        first : int, default 0
+            Line to start output on.
+        wait : int, default 0
+            Maximum number of seconds to wait for the task to complete.
+
+        Returns
+        -------
+        AsyncTask
+        """
+        response = await self._ctx.client.get(f"v1/tasks/{uid}", params=kwargs)
+        return AsyncTask(self._ctx, **response.json())
@@ -0,0 +1,94 @@
+"""Asynchronous user resources."""
+
+from __future__ import annotations
+
+from typing_extensions import TYPE_CHECKING, AsyncGenerator, List, Unpack
+
+from .content import AsyncContent
+from .paginator import AsyncPaginator
+from .resources import AsyncBaseResource, AsyncResources
+
+if TYPE_CHECKING:
+    from ..users import Users
+
+
+class AsyncUser(AsyncBaseResource):
+    """Asynchronous counterpart of [](`posit.connect.users.User`)."""
+
+    @property
+    def content(self) -> AsyncContent:
+        return AsyncContent(self._ctx, owner_guid=self["guid"])
+
+
+class AsyncUsers(AsyncResources):
+    """Asynchronous counterpart of [](`posit.connect.users.Users`)."""
+
+    async def find(self, **conditions: Unpack[Users.FindUser]) -> List[AsyncUser]:
+        """
+        Find users matching the specified conditions.
+
+        See [](`posit.connect.users.Users.find`) for the supported conditions.
+
+        Returns
+        -------
+        List[AsyncUser]
+        """
+        return [user async for user in self.iter_find(**conditions)]
+
+    async def iter_find(
+        self, **conditions: Unpack[Users.FindUser]
+    ) -> AsyncGenerator[AsyncUser, None]:
+        """
+        Lazily find users matching the specified conditions.
+
+        Yields
+        ------
+        AsyncUser
+
+        Examples
+        --------
+        >>> async for user in client.users.iter_find(account_status="licensed"):
+        ...     print(user["username"])
+        """
+        paginator = AsyncPaginator(self._ctx, "v1/users", params={**conditions})
+        async for page in paginator.fetch_pages():
+            for result in page.results:
+                yield AsyncUser(self._ctx, **result)
+
+    async def find_one(self, **conditions: Unpack[Users.FindUser]) -> AsyncUser | None:
+        """
+        Find the first user matching the specified conditions.
+
+        Returns
+        -------
+        AsyncUser | None
+        """
+        users = self.iter_find(**conditions)
+        try:
+            return await users.__anext__()
+        except StopAsyncIteration:
+            return None
+        finally:
+            await users.aclose()
+
+    async def get(self, uid: str) -> AsyncUser:
+        """
+        Retrieve a user by their unique identifier (guid).
+
+        Returns
+        -------
+        AsyncUser
+        """
+        response = await self._ctx.client.get(f"v1/users/{uid}")
+        return AsyncUser(self._ctx, **response.json())
+
+    async def count(self) -> int:
+        """
+        Return the total number of users.
+
+        Returns
+        -------
+        int
+        """
+        response = await self._ctx.client.get("v1/users", params={"page_size": 1})
+        return response.json()["total"]
@@ -0,0 +1,242 @@
+"""Conditional GET caching for responses sent by Connect."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+
+from requests.structures import CaseInsensitiveDict
+from typing_extensions import TYPE_CHECKING, Mapping
+
+if TYPE_CHECKING:
+    import requests
+
+# Headers describing the body of a response, which a 304 response does not have.
+_BODY_HEADERS = frozenset({"content-encoding", "content-length", "transfer-encoding"})
+
+# Request headers which do not change the response, and are left out of cache keys.
+_UNKEYED_HEADERS = frozenset(
+    {
+        "accept-encoding",
+        "connection",
+        "content-length",
+        "if-modified-since",
+        "if-none-match",
+        "user-agent",
+    }
+)
+
+
+def cache_key(url: str, headers: Mapping[str, str | bytes]) -> str:
+    """
+    Return the cache key of a GET request.
+
+    The key is the URL followed by a digest of the request headers which may change the
+    response, e.g. ``Accept`` or ``Authorization``, so that a response is never returned for a
+    request with other headers. The digest keeps credentials out of the cache.
+
+    Parameters
+    ----------
+    url : str
+        The request URL, including query parameters.
+    headers : Mapping[str, str | bytes]
+        The request headers.
+
+    Returns
+    -------
+    str
+    """
+    keyed = sorted(
+        (name.lower(), value if isinstance(value, str) else value.decode("latin-1"))
+        for name, value in headers.items()
+        if name.lower() not in _UNKEYED_HEADERS
+    )
+    digest = hashlib.sha256(json.dumps(keyed).encode()).hexdigest()
+    return f"{url}#{digest}"
+
+
+@dataclass(frozen=True)
+class _Entry:
+    etag: str | None
+    last_modified: str | None
+    status_code: int
+    reason: str
+    headers: Mapping[str, str]
+    content: bytes
+    encoding: str | None
+    expires_at: float
+
+
+class ResponseCache:
+    """
+    In-memory cache of GET responses, revalidated with conditional requests.
+
+    Successful responses that carry an ``ETag`` or ``Last-Modified`` header are stored, keyed by
+    their URL (including query parameters) and request headers; see `cache_key`. Responses with
+    ``Vary: *`` are not stored. Subsequent requests with the same key send the stored
+    validators as ``If-None-Match`` and ``If-Modified-Since``. When the server responds with
+    ``304 Not Modified``, the stored response body is returned instead of being downloaded again.
+
+    Every request is still sent to the server, so a cached response is never returned after the
+    resource has changed.
+
+    Parameters
+    ----------
+    maxsize : int, optional
+        The maximum number of responses to keep; the least recently used response is evicted
+        first, by default 256
+    ttl : float, optional
+        The number of seconds a response is kept before it is discarded and fetched in full
+        again, by default 300
+
+    Attributes
+    ----------
+    hits : int
+        The number of requests answered from the cache after a ``304 Not Modified`` response.
+    misses : int
+        The number of cacheable requests whose response body was downloaded.
+
+    Examples
+    --------
+    >>> from posit.connect import Client
+    >>> client = Client(cache=True)
+
+    Keep up to 1,000 responses for 10 minutes:
+
+    >>> from posit.connect.caches import ResponseCache
+    >>> client = Client(cache=ResponseCache(maxsize=1000, ttl=600))
+    """
+
+    def __init__(self, maxsize: int = 256, ttl: float = 300) -> None:
+        if maxsize < 1:
+            raise ValueError("maxsize must be greater than or equal to 1")
+        if ttl <= 0:
+            raise ValueError("ttl must be greater than 0")
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[str, _Entry] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def clear(self) -> None:
+        """Remove all cached responses."""
+        with self._lock:
+            self._entries.clear()
+
+    def validators(self, key: str) -> dict[str, str]:
+        """
+        Return the conditional request headers for a cached response.
+
+        Parameters
+        ----------
+        key : str
+            The key of the request; see `cache_key`.
+
+        Returns
+        -------
+        dict[str, str]
+            The ``If-None-Match`` and ``If-Modified-Since`` headers, or an empty dictionary when
+            the request is not cached.
+        """
+        entry = self._get(key)
+        if entry is None:
+            return {}
+        headers = {}
+        if entry.etag is not None:
+            headers["If-None-Match"] = entry.etag
+        if entry.last_modified is not None:
+            headers["If-Modified-Since"] = entry.last_modified
+        return headers
+
+    def update(self, key: str, response: requests.Response) -> requests.Response:
+        """
+        Update the cache with a response to a conditional request.
+
+        Parameters
+        ----------
+        key : str
+            The key of the request; see `cache_key`.
+        response : requests.Response
+            The response received from the server.
+
+        Returns
+        -------
+        requests.Response
+            The cached response when the server responded with ``304 Not Modified``, otherwise
+            the given response.
+        """
+        if response.status_code == 304:
+            entry = self._get(key)
+            if entry is not None:
+                with self._lock:
+                    self.hits += 1
+                return _rebuild(entry, response)
+            return response
+
+        if response.status_code != 200:
+            with self._lock:
+                self._entries.pop(key, None)
+            return response
+
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        with self._lock:
+            self.misses += 1
+            if (etag is None and last_modified is None) or response.headers.get("Vary") == "*":
+                self._entries.pop(key, None)
+                return response
+            self._entries[key] = _Entry(
+                etag=etag,
+                last_modified=last_modified,
+                status_code=response.status_code,
+                reason=response.reason,
+                headers=dict(response.headers),
+                content=response.content,
+                encoding=response.encoding,
+                expires_at=time.monotonic() + self.ttl,
+            )
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return response
+
+    def _get(self, key: str) -> _Entry | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry.expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry
+
+
+def _rebuild(entry: _Entry, not_modified: requests.Response) -> requests.Response:
+    """Restore a cache entry into the ``304 Not Modified`` response that revalidated it.
+
+    The 304 response keeps its request, url, timing, history and connection.
+    """
+    headers = CaseInsensitiveDict(entry.headers)
+    # A 304 response may carry updated metadata for the stored response, but not its body.
+    headers.update(
+        (name, value)
+        for name, value in not_modified.headers.items()
+        if name.lower() not in _BODY_HEADERS
+    )
+    response = not_modified
+    response.status_code = entry.status_code
+    response.reason = entry.reason
+    response.headers = headers
+    response._content = entry.content
+    response.encoding = entry.encoding
+    return response
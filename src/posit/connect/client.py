@@ -6,6 +6,7 @@ from typing_extensions import TYPE_CHECKING, Optional, overload
 
 from . import hooks, me
 from .auth import Auth
+from .caches import ResponseCache
 from .config import Config
 from .content import Content
 from .context import Context, ContextManager, requires
@@ -25,7 +26,10 @@ if TYPE_CHECKING:
     from requests import Response
 
     from .environments import Environments
+    from .instrumentation import Instrumentation
     from .packages import Packages
+    from .rate_limits import RateLimiter
+    from .retries import Retry
 
 
 class Client(ContextManager):
@@ -50,6 +54,8 @@ class Client(ContextManager):
         Environments resource.
     groups: Groups
         Groups resource.
+    instrumentation: Instrumentation | None
+        Request statistics, when enabled.
     me: User
         Current user resource.
     metrics: Metrics
@@ -73,7 +79,19 @@ class Client(ContextManager):
     """
 
     @overload
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        *,
+        pool_connections: int = ...,
+        pool_maxsize: int = ...,
+        pool_block: bool = ...,
+        retry: Retry | bool = ...,
+        cache: ResponseCache | bool = ...,
+        single_flight: bool = ...,
+        rate_limit: RateLimiter | float | None = ...,
+        write_rate_limit: RateLimiter | float | None = ...,
+        instrumentation: Instrumentation | None = ...,
+    ) -> None:
         """Initialize a Client instance.
 
         Creates a client instance using credentials read from the environment.
@@ -89,7 +107,20 @@ class Client(ContextManager):
         """
 
     @overload
-    def __init__(self, url: str) -> None:
+    def __init__(
+        self,
+        url: str,
+        *,
+        pool_connections: int = ...,
+        pool_maxsize: int = ...,
+        pool_block: bool = ...,
+        retry: Retry | bool = ...,
+        cache: ResponseCache | bool = ...,
+        single_flight: bool = ...,
+        rate_limit: RateLimiter | float | None = ...,
+        write_rate_limit: RateLimiter | float | None = ...,
+        instrumentation: Instrumentation | None = ...,
+    ) -> None:
         """Initialize a Client instance.
 
         Creates a client instance using a provided URL and API key credential read from the environment.
@@ -109,7 +140,21 @@ class Client(ContextManager):
         """
 
     @overload
-    def __init__(self, url: str, api_key: str) -> None:
+    def __init__(
+        self,
+        url: str,
+        api_key: str,
+        *,
+        pool_connections: int = ...,
+        pool_maxsize: int = ...,
+        pool_block: bool = ...,
+        retry: Retry | bool = ...,
+        cache: ResponseCache | bool = ...,
+        single_flight: bool = ...,
+        rate_limit: RateLimiter | float | None = ...,
+        write_rate_limit: RateLimiter | float | None = ...,
+        instrumentation: Instrumentation | None = ...,
+    ) -> None:
         """Initialize a Client instance.
 
         Parameters
@@ -146,7 +191,33 @@ class Client(ContextManager):
                     The API key credential for client authentication.
 
         **kwargs
-            Keyword arguments. Can include 'url' and 'api_key'.
+            Keyword arguments. Can include 'url' and 'api_key', and the connection pool options:
+            - pool_connections: int
+                The number of hosts to keep connection pools for. Default is 10.
+            - pool_maxsize: int
+                The maximum number of connections to keep alive per host. Default is 10.
+            - pool_block: bool
+                If True, wait for a free connection when the pool is exhausted instead of opening
+                a connection that is discarded after use. Default is False.
+            - retry: Retry | bool
+                The retry policy for transient errors (429, 502, 503 and 504) on idempotent
+                requests. Default is `Retry()`. Set to False to disable retries.
+            - cache: ResponseCache | bool
+                Cache GET responses and revalidate them with conditional requests, so that
+                unchanged responses are not downloaded again. Default is False. Set to True to
+                use `ResponseCache()`.
+            - single_flight: bool
+                If True, concurrent GET requests for the same path and parameters share a single
+                request to the server. Default is False.
+            - rate_limit: RateLimiter | float | None
+                The maximum number of requests per second, shared by all threads using the
+                client. Default is None (unlimited).
+            - write_rate_limit: RateLimiter | float | None
+                The maximum number of POST, PUT, PATCH and DELETE requests per second, in
+                addition to `rate_limit`. Default is None (unlimited).
+            - instrumentation: Instrumentation | None
+                Records the count, latency, status codes and response size of requests for
+                each route. Default is None.
 
         Examples
         --------
@@ -154,6 +225,34 @@ class Client(ContextManager):
         >>> Client("https://connect.example.com")
         >>> Client("https://connect.example.com", os.getenv("CONNECT_API_KEY"))
         >>> Client(api_key=os.getenv("CONNECT_API_KEY"), url="https://connect.example.com")
+
+        Share one client across 32 worker threads without reconnecting:
+
+        >>> client = Client(pool_maxsize=32, pool_block=True)
+        >>> client.session.pool_stats()
+
+        Retry up to 5 times with a longer backoff:
+
+        >>> from posit.connect.retries import Retry
+        >>> client = Client(retry=Retry(total=5, backoff_factor=2))
+
+        Avoid downloading unchanged responses again:
+
+        >>> client = Client(cache=True)
+
+        Share identical in-flight requests between threads:
+
+        >>> client = Client(single_flight=True)
+
+        Stay below a server-side limit of 10 requests per second:
+
+        >>> client = Client(rate_limit=10)
+
+        Find the endpoints that dominate a job's runtime:
+
+        >>> from posit.connect.instrumentation import Instrumentation
+        >>> client = Client(instrumentation=Instrumentation())
+        >>> client.instrumentation.snapshot()
         """
         api_key = None
         url = None
@@ -168,9 +267,29 @@ class Client(ContextManager):
             if "url" in kwargs and isinstance(kwargs["url"], str):
                 url = kwargs["url"]
 
+        self._session_options = {
+            key: kwargs[key]
+            for key in (
+                "pool_connections",
+                "pool_maxsize",
+                "pool_block",
+                "retry",
+                "cache",
+                "single_flight",
+                "rate_limit",
+                "write_rate_limit",
+            )
+            if key in kwargs
+        }
+
+        self.instrumentation: Instrumentation | None = kwargs.get("instrumentation")
+
         self.cfg = Config(api_key=api_key, url=url)
-        session = Session()
+        session = Session(**self._session_options)
         session.auth = Auth(config=self.cfg)
+        if self.instrumentation is not None:
+            # Installed first so that error responses are recorded before they are raised.
+            session.hooks["response"].append(self.instrumentation.hook)
         session.hooks["response"].append(hooks.check_for_deprecation_header)
         session.hooks["response"].append(hooks.handle_errors)
         self.session = session
@@ -286,7 +405,18 @@ class Client(ContextManager):
         if visitor_api_key == "":
             raise ValueError("Unable to retrieve token.")
 
-        return Client(url=self.cfg.url, api_key=visitor_api_key)
+        options = dict(self._session_options)
+        cache = options.get("cache")
+        if isinstance(cache, ResponseCache):
+            # Responses cached for this client's credentials must not be served to the visitor.
+            options["cache"] = ResponseCache(maxsize=cache.maxsize, ttl=cache.ttl)
+
+        return Client(
+            url=self.cfg.url,
+            api_key=visitor_api_key,
+            instrumentation=self.instrumentation,
+            **options,
+        )
 
     @property
     def content(self) -> Content:
@@ -2,29 +2,36 @@
 
 from __future__ import annotations
 
+import codecs
 import os
 import posixpath
 import re
+import threading
 import time
 from dataclasses import dataclass
 
 from typing_extensions import (
     TYPE_CHECKING,
     Any,
+    Dict,
+    Generator,
     List,
     Literal,
     NotRequired,
     Optional,
     Required,
+    Tuple,
     TypedDict,
     Unpack,
     overload,
 )
 
 from . import tasks
+from ._utils import count_json_array
 from .bundles import Bundles
 from .context import requires
 from .env import EnvVars
+from .frames import FrameExportMixin
 from .oauth.associations import ContentItemAssociations
 from .permissions import Permissions
 from .repository import ContentItemRepositoryMixin
@@ -497,6 +504,7 @@ class ContentItem(Active, ContentItemRepositoryMixin, VanityMixin, BaseResource)
         """Delete the content item."""
         path = f"v1/content/{self['guid']}"
         self._ctx.client.delete(path)
+        self._ctx.content_counts.clear()
 
     def deploy(self) -> tasks.Task:
         """Deploy the content.
@@ -766,7 +774,50 @@ class ContentItem(Active, ContentItemRepositoryMixin, VanityMixin, BaseResource)
         return Lockfile._from_response(generated_by, response.text)
 
 
-class Content(Resources):
+class ContentCounts:
+    """
+    Thread-safe store of recent content counts, keyed by owner guid.
+
+    Counts fetched before the last `clear` are not stored, so a count that raced with content
+    being created or deleted is not reused.
+    """
+
+    def __init__(self) -> None:
+        # The time each count was fetched, and the count.
+        self._counts: Dict[Optional[str], Tuple[float, int]] = {}
+        self._generation = 0
+        self._lock = threading.Lock()
+
+    @property
+    def generation(self) -> int:
+        """The number of times the counts were cleared."""
+        with self._lock:
+            return self._generation
+
+    def get(self, owner_guid: Optional[str], max_age: float) -> Optional[int]:
+        """Return the count of an owner's content, if it was fetched within `max_age` seconds."""
+        with self._lock:
+            counted = self._counts.get(owner_guid)
+        if counted is None or time.monotonic() - counted[0] >= max_age:
+            return None
+        return counted[1]
+
+    def put(
+        self, owner_guid: Optional[str], count: int, *, fetched: float, generation: int
+    ) -> None:
+        """Store a count fetched at `fetched`, unless the counts were cleared since `generation`."""
+        with self._lock:
+            if generation == self._generation:
+                self._counts[owner_guid] = (fetched, count)
+
+    def clear(self) -> None:
+        """Discard all counts, e.g. after content is created or deleted."""
+        with self._lock:
+            self._counts.clear()
+            self._generation += 1
+
+
+class Content(FrameExportMixin, Resources):
     """Content resource.
 
     Parameters
@@ -779,6 +830,8 @@ class Content(Resources):
         Content item owner identifier. Filters results to those owned by a specific user (the default is None, which implies not filtering results on owner identifier).
     """
 
+    _timestamps = ("created_time", "last_deployed_time")
+
     def __init__(
         self,
         ctx: Context,
@@ -789,14 +842,36 @@ class Content(Resources):
         self.owner_guid = owner_guid
         self._ctx = ctx
 
-    def count(self) -> int:
+    def count(self, *, max_age: float = 0) -> int:
         """Count the number of content items.
 
+        Connect does not report a total for content, so the content list is streamed and its
+        entries are counted one at a time, without holding the list in memory or creating a
+        `ContentItem` for each. With `max_age`, a previous
+        count is reused for up to `max_age` seconds, unless content is created or deleted through
+        this client; changes made elsewhere are not seen until it expires.
+
+        Parameters
+        ----------
+        max_age : float, optional
+            The maximum age in seconds of a previous count to reuse, by default 0 (always fetch a
+            new count).
+
         Returns
         -------
         int
         """
-        return len(self.find())
+        counts = self._ctx.content_counts
+        count = counts.get(self.owner_guid, max_age)
+        if count is not None:
+            return count
+
+        fetched, generation = time.monotonic(), counts.generation
+        params = {"owner_guid": self.owner_guid} if self.owner_guid else None
+        with self._ctx.client.get("v1/content", params=params, stream=True) as response:
+            count = count_json_array(codecs.iterdecode(response.iter_content(65536), "utf-8"))
+        counts.put(self.owner_guid, count, fetched=fetched, generation=generation)
+        return count
 
     def create(
         self,
@@ -862,6 +937,7 @@ class Content(Resources):
         ContentItem
         """
         response = self._ctx.client.post("v1/content", json=attrs)
+        self._ctx.content_counts.clear()
         return ContentItem(self._ctx, **response.json())
 
     @overload
@@ -938,6 +1014,17 @@ class Content(Resources):
         -------
         List[ContentItem]
         """
+        return [
+            ContentItem(
+                self._ctx,
+                **result,
+            )
+            for result in self._iter_results(include, **conditions)
+        ]
+
+    def _iter_results(
+        self, include: Optional[str | list[Any]] = None, **conditions
+    ) -> Generator[dict, None, None]:
         if isinstance(include, list):
             include = ",".join(include)
 
@@ -948,13 +1035,7 @@ class Content(Resources):
             conditions["owner_guid"] = self.owner_guid
 
         response = self._ctx.client.get("v1/content", params=conditions)
-        return [
-            ContentItem(
-                self._ctx,
-                **result,
-            )
-            for result in response.json()
-        ]
+        yield from response.json()
 
     def find_by(
         self,
@@ -8,6 +8,9 @@ from typing_extensions import TYPE_CHECKING, Protocol
 
 if TYPE_CHECKING:
     from .client import Client
+    from .content import ContentCounts
+    from .groups import GroupMemberships
+    from .oauth.cache import CredentialsCache
 
 
 def requires(version: str):
@@ -32,6 +35,16 @@ class Context:
         # references (which would prevent garbage collection)
         self.client: Client = weakref.proxy(client)
 
+        # Avoid circular import
+        from .content import ContentCounts
+        from .groups import GroupMemberships
+        from .oauth.cache import CredentialsCache
+
+        # Shared state is created up front, so that concurrent requests share one instance.
+        self._group_memberships = GroupMemberships(self)
+        self._content_counts = ContentCounts()
+        self._oauth_credentials = CredentialsCache()
+
     @property
     def version(self) -> str | None:
         if not hasattr(self, "_version"):
@@ -45,6 +58,19 @@ class Context:
     def version(self, value: str | None):
         self._version = value
 
+    @property
+    def group_memberships(self) -> GroupMemberships:
+        return self._group_memberships
+
+    @property
+    def oauth_credentials(self) -> CredentialsCache:
+        return self._oauth_credentials
+
+    @property
+    def content_counts(self) -> ContentCounts:
+        """Recent content counts, keyed by owner guid."""
+        return self._content_counts
+
 
 class ContextManager(Protocol):
     _ctx: Context
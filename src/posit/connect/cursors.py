@@ -2,7 +2,9 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 
-from typing_extensions import TYPE_CHECKING, Any, Generator, List
+from typing_extensions import TYPE_CHECKING, Any, Generator, Iterator, List
+
+from ._utils import in_background
 
 if TYPE_CHECKING:
     from .context import Context
@@ -23,13 +25,30 @@ class CursorPaginator:
         ctx: Context,
         path: str,
         params: dict[str, Any] | None = None,
+        *,
+        prefetch: int = 0,
     ) -> None:
+        """Paginate through a cursor based endpoint.
+
+        Parameters
+        ----------
+        ctx : Context
+        path : str
+            The path of the paginated endpoint.
+        params : dict[str, Any] | None, optional
+            Query parameters sent with every page request, by default None
+        prefetch : int, optional
+            The number of pages to fetch ahead of the consumer on a background thread, by default 0 (fetch each page on demand)
+        """
         if params is None:
             params = {}
+        if prefetch < 0:
+            raise ValueError("`prefetch=` must be greater than or equal to 0.")
 
         self._ctx = ctx
         self._path = path
         self._params = params
+        self._prefetch = prefetch
 
     def fetch_results(self) -> List[dict]:
         """Fetch results.
@@ -49,10 +68,19 @@ class CursorPaginator:
     def fetch_pages(self) -> Generator[CursorPage, None, None]:
         """Fetch pages.
 
+        When `prefetch` is set, the next page is requested as soon as its cursor is known, while
+        the consumer works on the current page. Closing the generator stops the prefetching.
+
         Yields
         ------
         Generator[Page, None, None]
         """
+        if self._prefetch > 0:
+            yield from self._fetch_pages_in_background()
+        else:
+            yield from self._fetch_pages()
+
+    def _fetch_pages(self) -> Generator[CursorPage, None, None]:
         next_page = None
         while True:
             page = self.fetch_page(next_page)
@@ -63,6 +91,9 @@ class CursorPaginator:
                 # stop if a next page is not defined
                 return
 
+    def _fetch_pages_in_background(self) -> Iterator[CursorPage]:
+        return in_background(self._fetch_pages(), self._prefetch, name="CursorPaginator")
+
     def fetch_page(self, next_page: str | None = None) -> CursorPage:
         """Fetch a page.
 
@@ -2,14 +2,20 @@ from __future__ import annotations
 
 import base64
 import json
-from datetime import datetime
+from datetime import datetime, timezone
 
-from typing_extensions import TYPE_CHECKING, Optional, TypedDict
+from typing_extensions import TYPE_CHECKING, Dict, Optional, TypedDict
 
 from ..oauth.types import OAuthTokenType
 
+# The name botocore reports for credentials obtained from Connect.
+_METHOD = "posit-connect"
+
 if TYPE_CHECKING:
+    from botocore.credentials import CredentialProvider, RefreshableCredentials
+
     from ..client import Client
+    from ..oauth.oauth import Credentials as OAuthCredentials
 
 
 class Credentials(TypedDict):
@@ -23,6 +29,8 @@ def get_credentials(
     client: Client,
     user_session_token: str,
     audience: Optional[str] = None,
+    *,
+    refresh_ahead: bool = False,
 ) -> Credentials:
     """
     Get AWS credentials using OAuth token exchange for an AWS Viewer integration.
@@ -59,6 +67,11 @@ def get_credentials(
         The client to use for making requests
     user_session_token : str
         The user session token to exchange
+    audience : str, optional
+        The GUID of the integration.
+    refresh_ahead : bool, optional
+        When True, cached credentials past half their lifetime are exchanged again in a
+        background thread while the cached credentials are returned. Default is False.
 
     Returns
     -------
@@ -66,11 +79,14 @@ def get_credentials(
         Dictionary containing AWS credentials with keys:
         access_key_id, secret_access_key, session_token, and expiration
     """
+    # Connect may omit `expires_in`, so cache the credentials until their own expiration
+    client.oauth.credentials_cache.set_lifetime(OAuthTokenType.AWS_CREDENTIALS, _lifetime)
     # Get credentials using OAuth
     credentials = client.oauth.get_credentials(
         user_session_token=user_session_token,
         requested_token_type=OAuthTokenType.AWS_CREDENTIALS,
         audience=audience,
+        refresh_ahead=refresh_ahead,
     )
 
     # Decode base64 access token
@@ -84,6 +100,8 @@ def get_content_credentials(
     client: Client,
     content_session_token: Optional[str] = None,
     audience: Optional[str] = None,
+    *,
+    refresh_ahead: bool = False,
 ) -> Credentials:
     """
     Get AWS credentials using OAuth token exchange for an AWS Service Account integration.
@@ -118,6 +136,11 @@ def get_content_credentials(
         The client to use for making requests
     content_session_token : str
         The content session token to exchange
+    audience : str, optional
+        The GUID of the integration.
+    refresh_ahead : bool, optional
+        When True, cached credentials past half their lifetime are exchanged again in a
+        background thread while the cached credentials are returned. Default is False.
 
     Returns
     -------
@@ -125,11 +148,14 @@ def get_content_credentials(
         Dictionary containing AWS credentials with keys:
         access_key_id, secret_access_key, session_token, and expiration
     """
+    # Connect may omit `expires_in`, so cache the credentials until their own expiration
+    client.oauth.credentials_cache.set_lifetime(OAuthTokenType.AWS_CREDENTIALS, _lifetime)
     # Get credentials using OAuth
     credentials = client.oauth.get_content_credentials(
         content_session_token=content_session_token,
         requested_token_type=OAuthTokenType.AWS_CREDENTIALS,
         audience=audience,
+        refresh_ahead=refresh_ahead,
     )
     if credentials is None:
         raise ValueError("No content session token is available for credential exchange.")
@@ -141,6 +167,157 @@ def get_content_credentials(
     return _decode_access_token(access_token)
 
 
+class PositCredentialsProvider:
+    """
+    Provides AWS credentials which are refreshed in the background ahead of their expiration.
+
+    Credentials are exchanged with `refresh_ahead`, so they are cached by the client until
+    shortly before they expire, and exchanged again in a background thread once half their
+    lifetime has passed while the current ones keep being returned. Their lifetime is the
+    ``expires_in`` of the exchange or, when Connect omits it, the ``expiration`` of the AWS
+    credentials. Requests only wait for Connect when no valid credentials are cached, e.g. on
+    first use or after the content was idle past the expiration.
+
+    Refresh is lazy: there is no timer, so new credentials are only exchanged when credentials
+    are asked for, e.g. by botocore, whose refreshable credentials ask for new credentials 15
+    minutes before expiration. Use `credential_provider` to add the provider to a botocore
+    session.
+
+    Examples
+    --------
+    ```python
+    import boto3
+    import botocore.session
+
+    from posit.connect import Client
+    from posit.connect.external.aws import PositCredentialsProvider
+
+    provider = PositCredentialsProvider(Client())
+    botocore_session = botocore.session.get_session()
+    resolver = botocore_session.get_component("credential_provider")
+    resolver.insert_before("env", provider.credential_provider())
+    session = boto3.Session(botocore_session=botocore_session)
+
+    s3 = session.resource("s3")
+    bucket = s3.Bucket("your-bucket-name")
+    ```
+
+    Parameters
+    ----------
+    client : Client
+        The client to use for making requests
+    user_session_token : str, optional
+        The user session token to exchange, for an AWS Viewer integration.
+    content_session_token : str, optional
+        The content session token to exchange, for an AWS Service Account integration. Defaults
+        to the content session token of the environment when `user_session_token` is not given.
+    audience : str, optional
+        The GUID of the integration.
+    """
+
+    def __init__(
+        self,
+        client: Client,
+        user_session_token: Optional[str] = None,
+        content_session_token: Optional[str] = None,
+        audience: Optional[str] = None,
+    ):
+        self._client = client
+        self._user_session_token = user_session_token
+        self._content_session_token = content_session_token
+        self._audience = audience
+
+    def get(self) -> Credentials:
+        """Return the current credentials."""
+        if self._user_session_token is not None:
+            return get_credentials(
+                self._client,
+                self._user_session_token,
+                self._audience,
+                refresh_ahead=True,
+            )
+        return get_content_credentials(
+            self._client,
+            self._content_session_token,
+            self._audience,
+            refresh_ahead=True,
+        )
+
+    def metadata(self) -> Dict[str, str]:
+        """Return the current credentials in the format of botocore's refreshable credentials."""
+        credentials = self.get()
+        return {
+            "access_key": credentials["aws_access_key_id"],
+            "secret_key": credentials["aws_secret_access_key"],
+            "token": credentials["aws_session_token"],
+            "expiry_time": _utc(credentials["expiration"]).isoformat(),
+        }
+
+    def credentials(self) -> RefreshableCredentials:
+        """
+        Return botocore credentials which are refreshed using this provider.
+
+        Returns
+        -------
+        botocore.credentials.RefreshableCredentials
+        """
+        try:
+            from botocore.credentials import RefreshableCredentials
+        except ImportError as e:
+            raise ImportError("The 'botocore' package is required to use this function.") from e
+
+        return RefreshableCredentials.create_from_metadata(
+            metadata=self.metadata(),
+            refresh_using=self.metadata,
+            method=_METHOD,
+        )
+
+    def credential_provider(self) -> CredentialProvider:
+        """
+        Return a botocore credential provider which loads credentials from this provider.
+
+        Add it to the credential resolver of a botocore session, e.g. with
+        ``session.get_component("credential_provider").insert_before("env", provider)``.
+
+        Returns
+        -------
+        botocore.credentials.CredentialProvider
+        """
+        try:
+            from botocore.credentials import CredentialProvider
+        except ImportError as e:
+            raise ImportError("The 'botocore' package is required to use this function.") from e
+
+        credentials = self.credentials
+
+        class _PositCredentialProvider(CredentialProvider):
+            METHOD = _METHOD
+            CANONICAL_NAME = "PositConnect"
+
+            # botocore is untyped, so its `load` is inferred from a placeholder return value.
+            def load(self) -> RefreshableCredentials:  # pyright: ignore[reportIncompatibleMethodOverride]
+                return credentials()
+
+        return _PositCredentialProvider()
+
+
+def _utc(value: datetime) -> datetime:
+    # Expirations are decoded as naive UTC datetimes.
+    return value if value.tzinfo else value.replace(tzinfo=timezone.utc)
+
+
+def _lifetime(credentials: OAuthCredentials) -> Optional[float]:
+    """Return the number of seconds until the AWS credentials of an exchange expire."""
+    access_token = credentials.get("access_token")
+    if not access_token:
+        return None
+    try:
+        expiration = _decode_access_token(access_token)["expiration"]
+    except (KeyError, TypeError, ValueError):
+        return None
+    return (_utc(expiration) - datetime.now(timezone.utc)).total_seconds()
+
+
 def _decode_access_token(access_token: str) -> Credentials:
     """
     Decode and deserialize an access token containing AWS credentials.
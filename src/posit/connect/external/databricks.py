@@ -58,6 +58,8 @@ class _PositConnectContentCredentialsProvider:
 
     The content-session-token is provided by Connect through the environment variable `CONNECT_CONTENT_SESSION_TOKEN_FILE` (or `CONNECT_CONTENT_SESSION_TOKEN`).
 
+    The credentials are cached by the client until shortly before they expire, and concurrent callers share a single exchange; see `posit.connect.oauth.OAuth.credentials_cache`.
+
     See Also
     --------
     * https://github.com/posit-dev/posit-sdk-py/blob/main/src/posit/connect/oauth/oauth.py
@@ -84,6 +86,8 @@ class _PositConnectViewerCredentialsProvider:
     The user-session-token is provided by Connect through the HTTP session header
     `Posit-Connect-User-Session-Token`.
 
+    The credentials are cached by the client until shortly before they expire, and concurrent callers share a single exchange; see `posit.connect.oauth.OAuth.credentials_cache`.
+
     See Also
     --------
     * https://github.com/posit-dev/posit-sdk-py/blob/main/src/posit/connect/oauth/oauth.py
@@ -7,16 +7,37 @@ Notes
 The APIs in this module are provided as a convenience and are subject to breaking changes.
 """
 
+from __future__ import annotations
+
+import threading
+
 from typing_extensions import Optional
 
 from .._utils import is_local
 from ..client import Client
 
+_client: Optional[Client] = None
+_client_lock = threading.Lock()
+
+
+def _shared_client() -> Client:
+    """Return the client shared by the authenticators created without one."""
+    global _client
+    with _client_lock:
+        if _client is None:
+            _client = Client()
+        return _client
+
 
 class PositAuthenticator:
     """
     Authenticator for Snowflake SDK which supports Posit OAuth integrations on Connect.
 
+    Tokens are cached by the client until shortly before they expire, and are exchanged again in
+    the background once half their lifetime has passed, so that opening a connection rarely
+    waits for Connect. Authenticators created without a client share a single client, and with
+    it the cached tokens.
+
     Examples
     --------
     ```python
@@ -98,17 +119,19 @@ class PositAuthenticator:
             )
 
         if self._client is None:
-            self._client = Client()
+            self._client = _shared_client()
 
         if self._user_session_token is not None:
             credentials = self._client.oauth.get_credentials(
                 self._user_session_token,
                 audience=self._audience,
+                refresh_ahead=True,
             )
         else:
             credentials = self._client.oauth.get_content_credentials(
                 self._content_session_token,
                 audience=self._audience,
+                refresh_ahead=True,
             )
             if credentials is None:
                 raise ValueError("No content session token is available for credential exchange.")
@@ -0,0 +1,180 @@
+"""Columnar export of API results to Arrow, pandas and polars."""
+
+from __future__ import annotations
+
+import importlib
+from abc import ABC, abstractmethod
+
+from typing_extensions import TYPE_CHECKING, Any, ClassVar, Dict, Iterable, List, Mapping, Tuple
+
+if TYPE_CHECKING:
+    import pandas as pd
+    import polars as pl
+    import pyarrow as pa
+
+
+def _import(name: str, extra: str) -> Any:
+    try:
+        return importlib.import_module(name)
+    except ImportError as e:
+        raise ImportError(
+            f"The '{name}' package is required to use this function. "
+            f"Install it with `pip install 'posit-sdk[{extra}]'`."
+        ) from e
+
+
+def _columns(results: Iterable[Mapping[str, Any]]) -> Tuple[Dict[str, List[Any]], int]:
+    """Collect results into a list of values per field.
+
+    Fields missing from a result are filled with None, including fields that first appear in a
+    later result.
+    """
+    columns: Dict[str, List[Any]] = {}
+    rows = 0
+    for result in results:
+        if result.keys() - columns.keys():
+            for key in result:
+                if key not in columns:
+                    columns[key] = [None] * rows
+        for key, column in columns.items():
+            column.append(result.get(key))
+        rows += 1
+    return columns, rows
+
+
+def to_arrow(results: Iterable[Mapping[str, Any]], timestamps: Iterable[str] = ()) -> pa.Table:
+    """
+    Convert API results into an Arrow table.
+
+    Requires the `pyarrow` package, installed with the `arrow` extra.
+
+    Parameters
+    ----------
+    results : Iterable[Mapping[str, Any]]
+        The results, e.g. the rows of each page returned by the API.
+    timestamps : Iterable[str], optional
+        The fields holding RFC 3339 timestamps, which are converted to UTC timestamp columns.
+
+    Returns
+    -------
+    pyarrow.Table
+    """
+    pa = _import("pyarrow", "arrow")
+    columns, _ = _columns(results)
+    table = pa.table(columns)
+    for name in timestamps:
+        if name in columns:
+            index = table.schema.get_field_index(name)
+            # Parse at nanosecond precision, which accepts any fraction length, then truncate.
+            column = table.column(name).cast(pa.timestamp("ns", tz="UTC"))
+            column = column.cast(pa.timestamp("us", tz="UTC"), safe=False)
+            table = table.set_column(index, name, column)
+    return table
+
+
+def to_pandas(
+    results: Iterable[Mapping[str, Any]], timestamps: Iterable[str] = ()
+) -> pd.DataFrame:
+    """
+    Convert API results into a pandas DataFrame.
+
+    Requires the `pandas` package, installed with the `pandas` extra.
+
+    Parameters
+    ----------
+    results : Iterable[Mapping[str, Any]]
+        The results, e.g. the rows of each page returned by the API.
+    timestamps : Iterable[str], optional
+        The fields holding RFC 3339 timestamps, which are converted to UTC datetime columns.
+
+    Returns
+    -------
+    pandas.DataFrame
+    """
+    pd = _import("pandas", "pandas")
+    columns, _ = _columns(results)
+    for name in timestamps:
+        if name in columns:
+            columns[name] = pd.to_datetime(columns[name], utc=True, format="ISO8601")
+    return pd.DataFrame(columns)
+
+
+def to_polars(
+    results: Iterable[Mapping[str, Any]], timestamps: Iterable[str] = ()
+) -> pl.DataFrame:
+    """
+    Convert API results into a polars DataFrame.
+
+    Requires the `polars` package, installed with the `polars` extra.
+
+    Parameters
+    ----------
+    results : Iterable[Mapping[str, Any]]
+        The results, e.g. the rows of each page returned by the API.
+    timestamps : Iterable[str], optional
+        The fields holding RFC 3339 timestamps, which are converted to UTC datetime columns.
+
+    Returns
+    -------
+    polars.DataFrame
+    """
+    pl = _import("polars", "polars")
+    columns, rows = _columns(results)
+    frame = pl.DataFrame(columns, strict=False) if rows else pl.DataFrame(columns)
+    # Columns without any value have the Null dtype, which has no string methods.
+    return frame.with_columns(
+        pl.col(name).cast(pl.String).str.to_datetime(time_zone="UTC", time_unit="us")
+        for name in timestamps
+        if name in columns
+    )
+
+
+class FrameExportMixin(ABC):
+    """Export the results of a finder to Arrow, pandas or polars.
+
+    The results are collected into columns as each page is fetched; no resource is created for
+    each row, and each timestamp column is parsed in a single pass.
+    """
+
+    # The fields holding RFC 3339 timestamps.
+    _timestamps: ClassVar[Tuple[str, ...]] = ()
+
+    @abstractmethod
+    def _iter_results(self, **kwargs) -> Iterable[Mapping[str, Any]]:
+        """Return the results of `find` as returned by the API."""
+
+    def to_arrow(self, **kwargs) -> pa.Table:
+        """
+        Find results as an Arrow table. Requires the `pyarrow` package.
+
+        Accepts the same parameters as `find`.
+
+        Returns
+        -------
+        pyarrow.Table
+        """
+        return to_arrow(self._iter_results(**kwargs), self._timestamps)
+
+    def to_pandas(self, **kwargs) -> pd.DataFrame:
+        """
+        Find results as a pandas DataFrame. Requires the `pandas` package.
+
+        Accepts the same parameters as `find`.
+
+        Returns
+        -------
+        pandas.DataFrame
+        """
+        return to_pandas(self._iter_results(**kwargs), self._timestamps)
+
+    def to_polars(self, **kwargs) -> pl.DataFrame:
+        """
+        Find results as a polars DataFrame. Requires the `polars` package.
+
+        Accepts the same parameters as `find`.
+
+        Returns
+        -------
+        polars.DataFrame
+        """
+        return to_polars(self._iter_results(**kwargs), self._timestamps)
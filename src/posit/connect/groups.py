@@ -2,7 +2,12 @@
 
 from __future__ import annotations
 
-from typing_extensions import TYPE_CHECKING, List, Optional, overload
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+
+from typing_extensions import TYPE_CHECKING, Dict, Generator, List, Optional, overload
 
 from .paginator import Paginator
 from .resources import BaseResource, Resources
@@ -62,6 +67,7 @@ class Group(BaseResource):
         ```
         """
         self._ctx.client.delete(f"v1/groups/{self['guid']}")
+        self._ctx.group_memberships.invalidate()
 
 
 class GroupMembers(Resources):
@@ -129,6 +135,7 @@ class GroupMembers(Resources):
             f"v1/groups/{self._group_guid}/members",
             json={"user_guid": user_guid},
         )
+        self._ctx.group_memberships.invalidate()
 
     @overload
     def delete(self, user: User, /) -> None: ...
@@ -187,6 +194,7 @@ class GroupMembers(Resources):
             raise ValueError("`user_guid=` should not be empty.")
 
         self._ctx.client.delete(f"v1/groups/{self._group_guid}/members/{user_guid}")
+        self._ctx.group_memberships.invalidate()
 
     def find(self) -> list[User]:
         """Find group members.
@@ -209,6 +217,35 @@ class GroupMembers(Resources):
         group_users = group.members.find()
         ```
 
+        See Also
+        --------
+        * https://docs.posit.co/connect/api/#get-/v1/groups/-group_guid-/members
+        """
+        return list(self.iter_find())
+
+    def iter_find(self) -> Generator[User, None, None]:
+        """Lazily find group members.
+
+        Suited to large groups, whose members are not collected into a list.
+
+        Yields
+        ------
+        User
+            Each user in the group.
+
+        Examples
+        --------
+        ```python
+        from posit.connect import Client
+
+        client = Client("https://posit.example.com", "API_KEY")
+
+        group = client.groups.get("GROUP_GUID_HERE")
+
+        for user in group.members.iter_find():
+            print(user["username"])
+        ```
+
         See Also
         --------
         * https://docs.posit.co/connect/api/#get-/v1/groups/-group_guid-/members
@@ -218,11 +255,9 @@ class GroupMembers(Resources):
 
         path = f"v1/groups/{self._group_guid}/members"
         paginator = Paginator(self._ctx, path)
-        member_dicts = paginator.fetch_results()
-
-        # For each member in the group
-        users = [User(self._ctx, **member_dict) for member_dict in member_dicts]
-        return users
+        for page in paginator.fetch_pages():
+            for member_dict in page.results:
+                yield User(self._ctx, **member_dict)
 
     def count(self) -> int:
         """Count the number of group members.
@@ -256,9 +291,190 @@ class GroupMembers(Resources):
         return result["total"]
 
 
+class GroupMemberships:
+    """Index of group memberships.
+
+    Connect only lists the members of a single group, so answering which groups a user belongs
+    to requires listing the members of every group. The index lists every group's members once,
+    concurrently, and answers lookups in both directions from memory until it expires.
+
+    The index is shared by a client; see `Groups.memberships`. It is invalidated when group
+    membership is changed through the same client, but changes made elsewhere are only seen
+    once it expires.
+
+    Parameters
+    ----------
+    ctx : Context
+    ttl : float, optional
+        The number of seconds the index is reused before it is rebuilt, by default 60
+    max_workers : int, optional
+        The maximum number of groups whose members are fetched concurrently, by default 8
+
+    Examples
+    --------
+    ```python
+    from posit.connect import Client
+
+    client = Client("https://posit.example.com", "API_KEY")
+
+    # Find the groups of every user with a single pass over the groups
+    memberships = client.groups.memberships
+    for user in client.users.find():
+        groups = memberships.groups_for(user["guid"])
+        print(user["username"], [group["name"] for group in groups])
+    ```
+    """
+
+    def __init__(self, ctx: Context, *, ttl: float = 60, max_workers: int = 8) -> None:
+        self._ctx = ctx
+        self.ttl = ttl
+        self.max_workers = max_workers
+        self._index: _MembershipIndex | None = None
+        # Incremented by `invalidate`, so that an index built meanwhile is not kept.
+        self._generation = 0
+        # Guards `_index` and `_generation`; never held while requests are sent.
+        self._lock = threading.Lock()
+        # Held while the index is built, so that concurrent lookups share one build.
+        self._building = threading.Lock()
+
+    def groups_for(self, user_guid: str, *, max_age: Optional[float] = None) -> List[Group]:
+        """Return the groups to which a user belongs.
+
+        Parameters
+        ----------
+        user_guid : str
+        max_age : float, optional
+            The maximum age in seconds of an index to reuse, by default `ttl`
+
+        Returns
+        -------
+        List[Group]
+        """
+        index = self._current(max_age)
+        return [index.groups[guid] for guid in index.user_groups.get(user_guid, [])]
+
+    def users_for(self, group_guid: str, *, max_age: Optional[float] = None) -> List[User]:
+        """Return the members of a group.
+
+        Parameters
+        ----------
+        group_guid : str
+        max_age : float, optional
+            The maximum age in seconds of an index to reuse, by default `ttl`
+
+        Returns
+        -------
+        List[User]
+        """
+        return list(self._current(max_age).members.get(group_guid, []))
+
+    def groups_by_user(self, *, max_age: Optional[float] = None) -> Dict[str, List[Group]]:
+        """Return the groups of every user that belongs to at least one group.
+
+        Parameters
+        ----------
+        max_age : float, optional
+            The maximum age in seconds of an index to reuse, by default `ttl`
+
+        Returns
+        -------
+        Dict[str, List[Group]]
+            The groups keyed by user guid.
+        """
+        index = self._current(max_age)
+        return {
+            user_guid: [index.groups[guid] for guid in group_guids]
+            for user_guid, group_guids in index.user_groups.items()
+        }
+
+    def refresh(self) -> None:
+        """Rebuild the index now."""
+        self._current(0)
+
+    def invalidate(self) -> None:
+        """Discard the index, so that it is rebuilt on the next lookup."""
+        with self._lock:
+            self._index = None
+            self._generation += 1
+
+    def _current(self, max_age: Optional[float]) -> _MembershipIndex:
+        # An index is reused when its build started less than `max_age` seconds before this call.
+        since = time.monotonic() - (self.ttl if max_age is None else max_age)
+        index = self._reusable(since)
+        if index is not None:
+            return index
+        with self._building:
+            # Another thread may have built the index while this one waited.
+            index = self._reusable(since)
+            if index is not None:
+                return index
+            with self._lock:
+                generation = self._generation
+            index = self._build()
+            with self._lock:
+                if generation == self._generation:
+                    self._index = index
+            return index
+
+    def _reusable(self, since: float) -> _MembershipIndex | None:
+        with self._lock:
+            index = self._index
+        if index is not None and index.started > since:
+            return index
+        return None
+
+    def _build(self) -> _MembershipIndex:
+        started = time.monotonic()
+        groups = Groups(self._ctx).find()
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            members = list(executor.map(lambda group: group.members.find(), groups))
+
+        index = _MembershipIndex(
+            groups={group["guid"]: group for group in groups},
+            members={},
+            user_groups={},
+            started=started,
+        )
+        for group, users in zip(groups, members):
+            index.members[group["guid"]] = users
+            for user in users:
+                index.user_groups.setdefault(user["guid"], []).append(group["guid"])
+        return index
+
+
+@dataclass(frozen=True)
+class _MembershipIndex:
+    groups: Dict[str, Group]
+    members: Dict[str, List[User]]
+    # The guids of the groups of each user, keyed by user guid.
+    user_groups: Dict[str, List[str]]
+    # When the build of the index started.
+    started: float
+
+
 class Groups(Resources):
     """Groups resource."""
 
+    @property
+    def memberships(self) -> GroupMemberships:
+        """The group membership index shared by this client.
+
+        Returns
+        -------
+        GroupMemberships
+
+        Examples
+        --------
+        ```python
+        from posit.connect import Client
+
+        client = Client("https://posit.example.com", "API_KEY")
+
+        user_groups = client.groups.memberships.groups_by_user()
+        ```
+        """
+        return self._ctx.group_memberships
+
     @overload
     def create(self, *, name: str, unique_id: str | None) -> Group:
         """Create a group.
@@ -306,37 +522,70 @@ class Groups(Resources):
         self,
         *,
         prefix: str = ...,
+        max_workers: int | None = ...,
     ) -> List[Group]: ...
 
     @overload
-    def find(self, **kwargs) -> List[Group]: ...
+    def find(self, *, max_workers: int | None = ..., **kwargs) -> List[Group]: ...
 
-    def find(self, **kwargs):
+    def find(self, *, max_workers: int | None = None, **kwargs):
         """Find groups.
 
         Parameters
         ----------
         prefix: str
             Filter by group name prefix. Casing is ignored.
+        max_workers: int | None
+            The maximum number of pages to fetch concurrently. By default, pages are fetched one after another.
 
         Returns
         -------
         List[Group]
 
+        See Also
+        --------
+        * https://docs.posit.co/connect/api/#get-/v1/groups
+        """
+        return list(self.iter_find(max_workers=max_workers, **kwargs))
+
+    @overload
+    def iter_find(
+        self,
+        *,
+        prefix: str = ...,
+        max_workers: int | None = ...,
+    ) -> Generator[Group, None, None]: ...
+
+    @overload
+    def iter_find(
+        self, *, max_workers: int | None = ..., **kwargs
+    ) -> Generator[Group, None, None]: ...
+
+    def iter_find(self, *, max_workers: int | None = None, **kwargs):
+        """Lazily find groups.
+
+        Each group is yielded as soon as its page arrives.
+
+        Parameters
+        ----------
+        prefix: str
+            Filter by group name prefix. Casing is ignored.
+        max_workers: int | None
+            The maximum number of pages to fetch concurrently. By default, pages are fetched one after another.
+
+        Yields
+        ------
+        Group
+
         See Also
         --------
         * https://docs.posit.co/connect/api/#get-/v1/groups
         """
         path = "v1/groups"
-        paginator = Paginator(self._ctx, path, params=kwargs)
-        results = paginator.fetch_results()
-        return [
-            Group(
-                self._ctx,
-                **result,
-            )
-            for result in results
-        ]
+        paginator = Paginator(self._ctx, path, params=kwargs, max_workers=max_workers)
+        for page in paginator.fetch_pages():
+            for result in page.results:
+                yield Group(self._ctx, **result)
 
     @overload
     def find_one(
@@ -364,18 +613,7 @@ class Groups(Resources):
         --------
         * https://docs.posit.co/connect/api/#get-/v1/groups
         """
-        path = "v1/groups"
-        paginator = Paginator(self._ctx, path, params=kwargs)
-        pages = paginator.fetch_pages()
-        results = (result for page in pages for result in page.results)
-        groups = (
-            Group(
-                self._ctx,
-                **result,
-            )
-            for result in results
-        )
-        return next(groups, None)
+        return next(self.iter_find(**kwargs), None)
 
     def get(self, guid: str) -> Group:
         """Get group.
@@ -1,38 +1,84 @@
+from __future__ import annotations
+
+import json
 import warnings
 from http.client import responses
 
-from requests import JSONDecodeError, Response
+from typing_extensions import TYPE_CHECKING, Any, Mapping, Protocol
 
 from .errors import ClientError
 
+if TYPE_CHECKING:
+    import requests
 
-def handle_errors(
-    response: Response,
-    # Arguments for the hook callback signature
-    *request_hook_args,  # noqa: ARG001
-    **request_hook_kwargs,  # noqa: ARG001
-) -> Response:
+
+class HTTPResponse(Protocol):
+    """The parts of a `requests` or `httpx` response used by the hooks below."""
+
+    @property
+    def status_code(self) -> int: ...
+
+    @property
+    def headers(self) -> Mapping[str, str]: ...
+
+    @property
+    def url(self) -> Any: ...
+
+    def json(self, **kwargs: Any) -> Any: ...
+
+    def raise_for_status(self) -> Any: ...
+
+
+def raise_for_error(response: HTTPResponse) -> None:
+    """
+    Raise for error responses.
+
+    Raises a [](`posit.connect.errors.ClientError`) when Connect describes the error in a JSON
+    body, and falls back to the transport's `raise_for_status` otherwise.
+    """
     if response.status_code >= 400:
         try:
             data = response.json()
             error_code = data["code"]
             message = data["error"]
             payload = data.get("payload")
-            http_status = response.status_code
-            http_status_message = responses[http_status]
-            raise ClientError(error_code, message, http_status, http_status_message, payload)
-        except JSONDecodeError:
-            # No JSON error message from Connect, so just raise
+        except json.JSONDecodeError:
+            # No JSON error message from Connect, so just raise.
+            # `requests.JSONDecodeError` is a subclass of `json.JSONDecodeError`.
             response.raise_for_status()
+            return
+        http_status = response.status_code
+        http_status_message = responses[http_status]
+        raise ClientError(error_code, message, http_status, http_status_message, payload)
+
+
+def warn_if_deprecated(response: HTTPResponse, *, stacklevel: int) -> None:
+    """Warn when the server marks the requested endpoint as deprecated."""
+    if "X-Deprecated-Endpoint" in response.headers:
+        msg = (
+            str(response.url)
+            + " is deprecated and will be removed in a future version of Connect."
+            + " Please upgrade `posit-sdk` in order to use the new APIs."
+        )
+        warnings.warn(msg, DeprecationWarning, stacklevel=stacklevel + 1)
+
+
+def handle_errors(
+    response: requests.Response,
+    # Arguments for the hook callback signature
+    *request_hook_args,  # noqa: ARG001
+    **request_hook_kwargs,  # noqa: ARG001
+) -> requests.Response:
+    raise_for_error(response)
     return response
 
 
 def check_for_deprecation_header(
-    response: Response,
+    response: requests.Response,
     # Extra arguments for the hook callback signature
     *args,  # noqa: ARG001
     **kwargs,  # noqa: ARG001
-) -> Response:
+) -> requests.Response:
     """
     Check for deprecation warnings from the server.
 
@@ -41,11 +87,5 @@ def check_for_deprecation_header(
     but if you have an old version of the package, it won't know the new URL
     to request.
     """
-    if "X-Deprecated-Endpoint" in response.headers:
-        msg = (
-            response.url
-            + " is deprecated and will be removed in a future version of Connect."
-            + " Please upgrade `posit-sdk` in order to use the new APIs."
-        )
-        warnings.warn(msg, DeprecationWarning, stacklevel=3)
+    warn_if_deprecated(response, stacklevel=3)
     return response
@@ -0,0 +1,245 @@
+"""Request instrumentation for the Connect API."""
+
+from __future__ import annotations
+
+import copy
+import logging
+import re
+import threading
+import time
+from dataclasses import dataclass, field
+from urllib.parse import urlsplit
+
+from typing_extensions import TYPE_CHECKING, Callable, Dict, Iterable, List, Sequence
+
+if TYPE_CHECKING:
+    from requests import Response
+
+logger = logging.getLogger(__name__)
+
+# Upper bounds, in seconds, of the latency histogram buckets.
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, float("inf"))
+
+_GUID = re.compile(
+    r"^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$", re.IGNORECASE
+)
+_ID = re.compile(r"^(?=.*\d)[0-9A-Za-z_-]{8,}$|^\d+$")
+
+
+def normalize_route(path: str) -> str:
+    """
+    Convert a request path into a route template.
+
+    The API prefix is removed, GUID segments are replaced with ``{guid}``, and numeric or
+    randomly generated identifiers are replaced with ``{id}``.
+
+    Parameters
+    ----------
+    path : str
+        The request path, with or without the ``/__api__/`` prefix.
+
+    Returns
+    -------
+    str
+
+    Examples
+    --------
+    >>> normalize_route("/__api__/v1/content/f2f37341-be58-4c32-a5a6-0a8d4e8a3d7f/permissions")
+    'v1/content/{guid}/permissions'
+    >>> normalize_route("/__api__/v1/content/f2f37341-be58-4c32-a5a6-0a8d4e8a3d7f/bundles/101")
+    'v1/content/{guid}/bundles/{id}'
+    """
+    _, sep, route = path.partition("/__api__/")
+    if not sep:
+        route = path.lstrip("/")
+    segments = []
+    for segment in route.split("/"):
+        if _GUID.match(segment):
+            segment = "{guid}"
+        elif _ID.match(segment):
+            segment = "{id}"
+        segments.append(segment)
+    return "/".join(segments)
+
+
+@dataclass(frozen=True)
+class RequestEvent:
+    """
+    A single request sent to Connect.
+
+    Attributes
+    ----------
+        method (str): The HTTP method.
+        route (str): The route template, e.g. ``v1/content/{guid}``.
+        url (str): The request URL.
+        status (int): The response status code.
+        seconds (float): The time taken to send the request and read the response body.
+        bytes (int): The size of the response body.
+        retries (int): The number of times the request was retried.
+    """
+
+    method: str
+    route: str
+    url: str
+    status: int
+    seconds: float
+    bytes: int
+    retries: int
+
+
+@dataclass
+class RouteStats:
+    """
+    Aggregated statistics for a route.
+
+    Attributes
+    ----------
+        method (str): The HTTP method.
+        route (str): The route template, e.g. ``v1/content/{guid}``.
+        count (int): The number of requests.
+        seconds (float): The total time spent on requests.
+        bytes (int): The total size of response bodies.
+        retries (int): The total number of retries.
+        statuses (Dict[int, int]): The number of responses for each status code.
+        latency (Dict[float, int]): The number of requests in each latency bucket, keyed by the
+            bucket's upper bound in seconds.
+    """
+
+    method: str
+    route: str
+    count: int = 0
+    seconds: float = 0.0
+    bytes: int = 0
+    retries: int = 0
+    statuses: Dict[int, int] = field(default_factory=dict)
+    latency: Dict[float, int] = field(default_factory=dict)
+
+    @property
+    def mean_seconds(self) -> float:
+        """The mean time spent on a request."""
+        return self.seconds / self.count if self.count else 0.0
+
+
+Exporter = Callable[[RequestEvent], None]
+
+
+class Instrumentation:
+    """
+    Registry of request statistics, grouped by method and route template.
+
+    Install on a client with ``Client(instrumentation=...)``. Every response received from
+    Connect is recorded, including error responses, and passed to each exporter.
+
+    Parameters
+    ----------
+    exporters : Iterable[Callable[[RequestEvent], None]], optional
+        Called with each recorded request, by default none. Exceptions raised by an exporter are
+        logged and otherwise ignored.
+    buckets : Sequence[float], optional
+        The upper bounds of the latency histogram buckets in seconds, by default
+        `DEFAULT_BUCKETS`. A final unbounded bucket is added when missing.
+    normalize : Callable[[str], str], optional
+        Converts a request path into a route template, by default `normalize_route`.
+
+    Examples
+    --------
+    >>> from posit.connect import Client
+    >>> from posit.connect.instrumentation import Instrumentation
+    >>> instrumentation = Instrumentation()
+    >>> client = Client(instrumentation=instrumentation)
+    >>> for item in client.content.find():
+    ...     item.permissions.find()
+    >>> for key, stats in instrumentation.snapshot().items():
+    ...     print(key, stats.count, stats.mean_seconds)
+    GET v1/content 1 0.21
+    GET v1/content/{guid}/permissions 250 0.04
+
+    Export each request to a log:
+
+    >>> instrumentation.add_exporter(lambda event: print(event.route, event.seconds))
+    """
+
+    def __init__(
+        self,
+        exporters: Iterable[Exporter] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+        normalize: Callable[[str], str] = normalize_route,
+    ) -> None:
+        buckets = sorted(buckets)
+        if not buckets or buckets[-1] != float("inf"):
+            buckets.append(float("inf"))
+        self.buckets = tuple(buckets)
+        self.normalize = normalize
+        self._exporters: List[Exporter] = list(exporters)
+        self._stats: Dict[str, RouteStats] = {}
+        self._lock = threading.Lock()
+
+    def add_exporter(self, exporter: Exporter) -> None:
+        """Add an exporter, called with each recorded request."""
+        with self._lock:
+            self._exporters.append(exporter)
+
+    def snapshot(self) -> Dict[str, RouteStats]:
+        """
+        Return a copy of the statistics recorded so far.
+
+        Returns
+        -------
+        Dict[str, RouteStats]
+            The statistics keyed by ``"<method> <route>"``, e.g. ``"GET v1/content/{guid}"``.
+        """
+        with self._lock:
+            return copy.deepcopy(self._stats)
+
+    def reset(self) -> None:
+        """Discard the statistics recorded so far."""
+        with self._lock:
+            self._stats.clear()
+
+    def record(self, event: RequestEvent) -> None:
+        """Record a request and pass it to the exporters."""
+        key = f"{event.method} {event.route}"
+        with self._lock:
+            stats = self._stats.get(key)
+            if stats is None:
+                stats = self._stats[key] = RouteStats(event.method, event.route)
+            stats.count += 1
+            stats.seconds += event.seconds
+            stats.bytes += event.bytes
+            stats.retries += event.retries
+            stats.statuses[event.status] = stats.statuses.get(event.status, 0) + 1
+            bucket = next(bound for bound in self.buckets if event.seconds <= bound)
+            stats.latency[bucket] = stats.latency.get(bucket, 0) + 1
+            exporters = list(self._exporters)
+        for exporter in exporters:
+            try:
+                exporter(event)
+            except Exception:
+                logger.exception("Instrumentation exporter %r failed", exporter)
+
+    def hook(self, response: Response, *args, **kwargs) -> Response:  # noqa: ARG002
+        """Response hook recording each response; installed by `Client`."""
+        start = time.perf_counter()
+        if kwargs.get("stream"):
+            # Do not consume a streamed body; rely on the declared size instead.
+            size = int(response.headers.get("Content-Length", 0))
+        else:
+            size = len(response.content or b"")
+        seconds = response.elapsed.total_seconds() + (time.perf_counter() - start)
+
+        retries = getattr(getattr(response, "raw", None), "retries", None)
+        request = response.request
+        method = request.method or "GET"
+        url = request.url or response.url
+        self.record(
+            RequestEvent(
+                method=method,
+                route=self.normalize(urlsplit(url).path),
+                url=url,
+                status=response.status_code,
+                seconds=seconds,
+                bytes=size,
+                retries=len(getattr(retries, "history", ())),
+            )
+        )
+        return response
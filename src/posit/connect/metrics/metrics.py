@@ -1,10 +1,20 @@
 """Metric resources."""
 
+from __future__ import annotations
+
+from typing_extensions import TYPE_CHECKING, Dict, Iterable
+
 from .. import resources
 from ..context import requires
 from .hits import Hits, _Hits
+from .sync import SOURCES, MetricsSync
 from .usage import Usage
 
+if TYPE_CHECKING:
+    import os
+
+    from .sync import EventStore
+
 
 class Metrics(resources.Resources):
     """Metrics resource.
@@ -23,3 +33,40 @@ class Metrics(resources.Resources):
     @requires(version="2025.04.0")
     def hits(self) -> Hits:
         return _Hits(self._ctx, "v1/instrumentation/content/hits", uid="id")
+
+    def sync(
+        self,
+        directory: str | os.PathLike,
+        *,
+        store: EventStore | None = None,
+        sources: Iterable[str] = tuple(SOURCES),
+        **kwargs,
+    ) -> Dict[str, int]:
+        """Incrementally copy visits and Shiny usage events into a local directory.
+
+        Only events added since the previous sync into the same directory are fetched, and an
+        interrupted sync resumes where it stopped. See `MetricsSync` for details.
+
+        Parameters
+        ----------
+        directory : str | os.PathLike
+            The directory holding the sync state and, unless `store` is given, the events.
+        store : EventStore, optional
+            Where to append events, e.g. a `posit.connect.metrics.store.MetricsStore`, by default
+            JSON Lines files in `directory`.
+        sources : Iterable[str], optional
+            The sources to sync, by default ``("visits", "shiny_usage")``.
+        **kwargs
+            Filters applied to every request, e.g. `content_guid` or `min_data_version`.
+
+        Returns
+        -------
+        Dict[str, int]
+            The number of new events for each source.
+
+        Examples
+        --------
+        >>> client.metrics.sync("metrics")
+        {'visits': 1250, 'shiny_usage': 87}
+        """
+        return MetricsSync(self._ctx, directory, store=store, sources=sources).run(**kwargs)
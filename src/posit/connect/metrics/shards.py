@@ -0,0 +1,111 @@
+"""Sharded fetching of metrics events by time window."""
+
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+
+from typing_extensions import TYPE_CHECKING, Any, Dict, Generator, List, Tuple
+
+from ..cursors import CursorPaginator
+from .timestamps import parse_instant, parse_timestamp
+
+if TYPE_CHECKING:
+    from ..context import Context
+
+
+def split_window(start: str, end: str, shards: int) -> List[Tuple[str, str]]:
+    """
+    Split a time window into consecutive sub-windows of equal length.
+
+    Each sub-window starts where the previous one ends.
+
+    Parameters
+    ----------
+    start : str
+        The RFC 3339 start of the window.
+    end : str
+        The RFC 3339 end of the window.
+    shards : int
+        The number of sub-windows.
+
+    Returns
+    -------
+    List[Tuple[str, str]]
+        The start and end of each sub-window, in order.
+    """
+    if shards < 1:
+        raise ValueError("`shards=` must be greater than or equal to 1.")
+    first, last = parse_timestamp(start), parse_timestamp(end)
+    if last <= first:
+        return [(start, end)]
+    step = (last - first) / shards
+    bounds = [start] + [(first + step * i).isoformat() for i in range(1, shards)] + [end]
+    return list(zip(bounds, bounds[1:]))
+
+
+def fetch_sharded(
+    ctx: Context,
+    path: str,
+    params: Dict[str, Any],
+    *,
+    shards: int,
+    field: str,
+) -> Generator[dict, None, None]:
+    """
+    Fetch the results of a cursor endpoint by walking sub-windows of `from`/`to` concurrently.
+
+    Results are yielded in window order. A window may also return events which belong to
+    another window: events at the boundary between two windows, and Shiny sessions which
+    started in an earlier window but overlap this one. Each event is kept only by the window
+    containing its `field`, where each window includes its start but not its end. The first
+    window also keeps events before `from`, and the last window events at or after `to`, as
+    an unsharded request would.
+
+    Parameters
+    ----------
+    ctx : Context
+    path : str
+        The path of the cursor endpoint.
+    params : Dict[str, Any]
+        The query parameters, which must include `from` and `to`.
+    shards : int
+        The number of sub-windows, each walked by its own worker thread.
+    field : str
+        The field holding the time of an event, used to find events at window boundaries.
+
+    Yields
+    ------
+    dict
+    """
+    start, end = params.get("from"), params.get("to")
+    if not start or not end:
+        raise ValueError("`shards=` requires both `start=` and `end=`.")
+    windows = split_window(start, end, shards)
+
+    def fetch(window: Tuple[str, str]) -> List[dict]:
+        paginator = CursorPaginator(
+            ctx, path, params={**params, "from": window[0], "to": window[1]}
+        )
+        return paginator.fetch_results()
+
+    last = len(windows) - 1
+    with ThreadPoolExecutor(max_workers=len(windows)) as executor:
+        futures = [executor.submit(fetch, window) for window in windows]
+        try:
+            for index, ((window_start, window_end), future) in enumerate(zip(windows, futures)):
+                opening, closing = parse_instant(window_start), parse_instant(window_end)
+                for result in future.result():
+                    value = result.get(field)
+                    if not value:
+                        if index == 0:
+                            yield result
+                        continue
+                    instant = parse_instant(value)
+                    if index > 0 and instant < opening:
+                        continue
+                    if index < last and instant >= closing:
+                        continue
+                    yield result
+        finally:
+            for future in futures:
+                future.cancel()
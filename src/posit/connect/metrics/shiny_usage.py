@@ -1,13 +1,19 @@
 from __future__ import annotations
 
-from typing_extensions import List, overload
+from typing_extensions import Any, Generator, List, Mapping, overload
 
 from ..cursors import CursorPaginator
+from ..frames import FrameExportMixin
+from ..records import Record, to_record
 from ..resources import BaseResource, Resources
 from .rename_params import rename_params
+from .shards import fetch_sharded
+from .timestamps import EventTimes, event_times
 
 
-class ShinyUsageEvent(BaseResource):
+class _ShinyUsageEventFields(Mapping[str, Any]):
+    """Field accessors shared by [](`ShinyUsageEvent`) and its asynchronous counterpart."""
+
     @property
     def content_guid(self) -> str:
         """The associated unique content identifier.
@@ -59,7 +65,13 @@ class ShinyUsageEvent(BaseResource):
         return self["data_version"]
 
 
-class ShinyUsage(Resources):
+class ShinyUsageEvent(BaseResource, _ShinyUsageEventFields):
+    pass
+
+
+class ShinyUsage(FrameExportMixin, Resources):
+    _timestamps = ("started", "ended")
+
     @overload
     def find(
         self,
@@ -68,6 +80,8 @@ class ShinyUsage(Resources):
         min_data_version: int = ...,
         start: str = ...,
         end: str = ...,
+        prefetch: int = ...,
+        shards: int = ...,
     ) -> List[ShinyUsageEvent]:
         """Find usage.
 
@@ -81,6 +95,11 @@ class ShinyUsage(Resources):
             Filter by the start time, by default ...
         end : str, optional
             Filter by the end time, by default ...
+        prefetch : int, optional
+            The number of pages to fetch ahead on a background thread, by default 0
+        shards : int, optional
+            The number of sub-windows of `start` to `end` to fetch concurrently, by default 1.
+            Requires both `start` and `end`; `prefetch` does not apply to sharded fetches.
 
         Returns
         -------
@@ -88,7 +107,7 @@ class ShinyUsage(Resources):
         """
 
     @overload
-    def find(self, **kwargs) -> List[ShinyUsageEvent]:
+    def find(self, *, prefetch: int = ..., **kwargs) -> List[ShinyUsageEvent]:
         """Find usage.
 
         Returns
@@ -96,25 +115,112 @@ class ShinyUsage(Resources):
         List[ShinyUsageEvent]
         """
 
-    def find(self, **kwargs) -> List[ShinyUsageEvent]:
+    def find(self, *, prefetch: int = 0, **kwargs) -> List[ShinyUsageEvent]:
         """Find usage.
 
         Returns
         -------
         List[ShinyUsageEvent]
         """
+        return list(self.iter_find(prefetch=prefetch, **kwargs))
+
+    @overload
+    def iter_find(
+        self,
+        *,
+        content_guid: str = ...,
+        min_data_version: int = ...,
+        start: str = ...,
+        end: str = ...,
+        prefetch: int = ...,
+        shards: int = ...,
+    ) -> Generator[ShinyUsageEvent, None, None]:
+        """Lazily find usage.
+
+        Parameters
+        ----------
+        content_guid : str, optional
+            Filter by an associated unique content identifer, by default ...
+        min_data_version : int, optional
+            Filter by a minimum data version, by default ...
+        start : str, optional
+            Filter by the start time, by default ...
+        end : str, optional
+            Filter by the end time, by default ...
+        prefetch : int, optional
+            The number of pages to fetch ahead on a background thread, by default 0
+        shards : int, optional
+            The number of sub-windows of `start` to `end` to fetch concurrently, by default 1.
+            Requires both `start` and `end`; `prefetch` does not apply to sharded fetches.
+
+        Yields
+        ------
+        ShinyUsageEvent
+        """
+
+    @overload
+    def iter_find(
+        self, *, prefetch: int = ..., **kwargs
+    ) -> Generator[ShinyUsageEvent, None, None]:
+        """Lazily find usage.
+
+        Yields
+        ------
+        ShinyUsageEvent
+        """
+
+    def iter_find(self, *, prefetch: int = 0, **kwargs) -> Generator[ShinyUsageEvent, None, None]:
+        """Lazily find usage.
+
+        Like `find`, without collecting the events into a list.
+
+        Yields
+        ------
+        ShinyUsageEvent
+        """
+        for result in self._iter_results(prefetch=prefetch, **kwargs):
+            yield ShinyUsageEvent(self._ctx, **result)
+
+    def find_times(self, *, prefetch: int = 0, **kwargs) -> EventTimes:
+        """Find the start and end times of Shiny usage events as NumPy arrays.
+
+        Accepts the same parameters as `find`. The timestamps of every event are parsed in a
+        single pass into ``datetime64`` arrays in UTC, and `EventTimes.durations` computes every
+        duration at once. Requires the `numpy` package.
+
+        Returns
+        -------
+        EventTimes
+        """
+        results = self._iter_results(prefetch=prefetch, **kwargs)
+        return event_times(results, "started", "ended")
+
+    def iter_records(self, *, prefetch: int = 0, **kwargs) -> Generator[Record, None, None]:
+        """Lazily find usage as compact records.
+
+        Accepts the same parameters as `iter_find`, but yields read-only records instead of
+        `ShinyUsageEvent` resources, which use a fraction of the memory when reading many events.
+
+        Yields
+        ------
+        Record
+        """
+        for result in self._iter_results(prefetch=prefetch, **kwargs):
+            yield to_record(result)
+
+    def _iter_results(
+        self, *, prefetch: int = 0, shards: int = 1, **kwargs
+    ) -> Generator[dict, None, None]:
         params = rename_params(kwargs)
 
         path = "/v1/instrumentation/shiny/usage"
-        paginator = CursorPaginator(self._ctx, path, params=params)
-        results = paginator.fetch_results()
-        return [
-            ShinyUsageEvent(
-                self._ctx,
-                **result,
-            )
-            for result in results
-        ]
+        if shards > 1:
+            yield from fetch_sharded(self._ctx, path, params, shards=shards, field="started")
+            return
+
+        paginator = CursorPaginator(self._ctx, path, params=params, prefetch=prefetch)
+        for page in paginator.fetch_pages():
+            yield from page.results
 
     @overload
     def find_one(
@@ -159,16 +265,4 @@ class ShinyUsage(Resources):
         -------
         ShinyUsageEvent | None
         """
-        params = rename_params(kwargs)
-        path = "/v1/instrumentation/shiny/usage"
-        paginator = CursorPaginator(self._ctx, path, params=params)
-        pages = paginator.fetch_pages()
-        results = (result for page in pages for result in page.results)
-        visits = (
-            ShinyUsageEvent(
-                self._ctx,
-                **result,
-            )
-            for result in results
-        )
-        return next(visits, None)
+        return next(self.iter_find(**kwargs), None)
@@ -0,0 +1,313 @@
+"""Local SQLite store of metrics events with daily rollups."""
+
+from __future__ import annotations
+
+import json
+import os
+import sqlite3
+from dataclasses import dataclass
+from datetime import timezone
+
+from typing_extensions import Any, Dict, Generator, Iterable, List, Literal, Mapping, Self, Tuple
+
+from .timestamps import parse_instant, parse_timestamp
+
+# The fields holding the start and end time of the events of each source.
+_TIMES: Dict[str, Tuple[str, str | None]] = {
+    "visits": ("time", None),
+    "shiny_usage": ("started", "ended"),
+    "hits": ("timestamp", None),
+}
+
+# The first day of the period containing a day, keyed by period.
+_PERIODS = {
+    "day": "day",
+    "week": "date(day, 'weekday 0', '-6 days')",
+    "month": "strftime('%Y-%m-01', day)",
+}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS events (
+    id INTEGER PRIMARY KEY,
+    source TEXT NOT NULL,
+    event_id TEXT,
+    content_guid TEXT NOT NULL,
+    user_guid TEXT,
+    started TEXT,
+    ended TEXT,
+    day TEXT,
+    duration REAL NOT NULL,
+    data TEXT NOT NULL,
+    UNIQUE (source, event_id)
+);
+CREATE INDEX IF NOT EXISTS events_by_day ON events (source, day, content_guid);
+CREATE TABLE IF NOT EXISTS daily (
+    source TEXT NOT NULL,
+    content_guid TEXT NOT NULL,
+    day TEXT NOT NULL,
+    events INTEGER NOT NULL,
+    duration REAL NOT NULL,
+    PRIMARY KEY (source, day, content_guid)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS daily_users (
+    source TEXT NOT NULL,
+    content_guid TEXT NOT NULL,
+    day TEXT NOT NULL,
+    user_guid TEXT NOT NULL,
+    PRIMARY KEY (source, day, content_guid, user_guid)
+) WITHOUT ROWID;
+"""
+
+
+@dataclass(frozen=True)
+class Rollup:
+    """
+    Aggregated events of a content item over a period.
+
+    Attributes
+    ----------
+        source (str): The source of the events: ``"visits"``, ``"shiny_usage"`` or ``"hits"``.
+        period (str): The first day of the period, e.g. ``"2024-01-01"``.
+        content_guid (str): The content item.
+        events (int): The number of events.
+        users (int): The number of distinct users. Anonymous events are not counted.
+        duration (float): The total duration of the events in seconds. Only Shiny usage events
+            have a duration.
+    """
+
+    source: str
+    period: str
+    content_guid: str
+    events: int
+    users: int
+    duration: float
+
+
+class MetricsStore:
+    """
+    Stores visits, Shiny usage and hits events in a SQLite database with daily rollups.
+
+    The number of events, the distinct users and the total duration of each content item are
+    maintained per day as events are added, so rollup queries read the rollup tables instead of
+    the raw events.
+
+    A store can be used as the store of `MetricsSync`, which keeps it up to date incrementally.
+
+    Parameters
+    ----------
+    path : str | os.PathLike, optional
+        The database file, created when missing, by default an in-memory database.
+
+    Examples
+    --------
+    >>> from posit.connect.metrics.store import MetricsStore
+    >>> store = MetricsStore("metrics.db")
+    >>> client.metrics.sync("metrics", store=store)
+    >>> store.add(client.metrics.hits.fetch(start="2025-05-01T00:00:00Z"), source="hits")
+    >>> for rollup in store.rollup("week", source="visits"):
+    ...     print(rollup.period, rollup.content_guid, rollup.events, rollup.users)
+    """
+
+    def __init__(self, path: str | os.PathLike = ":memory:") -> None:
+        self.path = os.fspath(path)
+        self._connection = sqlite3.connect(self.path)
+        self._connection.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        """Close the database."""
+        self._connection.close()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def add(self, results: Iterable[Mapping[str, Any]], *, source: str) -> int:
+        """
+        Add events and update the rollups.
+
+        Events with an ``id`` field, such as hits, are added once; adding them again is ignored.
+
+        Parameters
+        ----------
+        results : Iterable[Mapping[str, Any]]
+            The events, as returned by the API.
+        source : str
+            The source of the events: ``"visits"``, ``"shiny_usage"`` or ``"hits"``.
+
+        Returns
+        -------
+        int
+            The number of events added.
+        """
+        if source not in _TIMES:
+            raise ValueError(f"Unknown source {source!r}; expected one of {list(_TIMES)}.")
+        start_field, end_field = _TIMES[source]
+        added = 0
+        with self._connection as connection:
+            for result in results:
+                started = _utc(result.get(start_field))
+                ended = _utc(result.get(end_field)) if end_field else started
+                duration = 0.0
+                if started and ended:
+                    duration = (parse_timestamp(ended) - parse_timestamp(started)).total_seconds()
+                day = started[:10] if started else None
+                content_guid = result.get("content_guid") or ""
+                user_guid = result.get("user_guid")
+                event_id = result.get("id")
+                cursor = connection.execute(
+                    "INSERT OR IGNORE INTO events"
+                    " (source, event_id, content_guid, user_guid, started, ended, day, duration, data)"
+                    " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (
+                        source,
+                        None if event_id is None else str(event_id),
+                        content_guid,
+                        user_guid,
+                        started,
+                        ended,
+                        day,
+                        duration,
+                        json.dumps(result),
+                    ),
+                )
+                if cursor.rowcount == 0:
+                    continue
+                added += 1
+                if day is None:
+                    continue
+                connection.execute(
+                    "INSERT INTO daily VALUES (?, ?, ?, 1, ?)"
+                    " ON CONFLICT (source, day, content_guid) DO UPDATE"
+                    " SET events = events + 1, duration = duration + excluded.duration",
+                    (source, content_guid, day, duration),
+                )
+                if user_guid:
+                    connection.execute(
+                        "INSERT OR IGNORE INTO daily_users VALUES (?, ?, ?, ?)",
+                        (source, content_guid, day, user_guid),
+                    )
+        return added
+
+    # The methods below let `MetricsSync` append to the store and recover from interruptions.
+
+    def size(self, source: str) -> int:
+        """Return the position of the last event of a source."""
+        (size,) = self._connection.execute(
+            "SELECT COALESCE(MAX(id), 0) FROM events WHERE source = ?", (source,)
+        ).fetchone()
+        return size
+
+    def truncate(self, source: str, size: int) -> None:
+        """Remove the events of a source added after it reached `size`, and their rollups."""
+        with self._connection as connection:
+            days = connection.execute(
+                "SELECT DISTINCT day FROM events WHERE source = ? AND id > ? AND day IS NOT NULL",
+                (source, size),
+            ).fetchall()
+            connection.execute("DELETE FROM events WHERE source = ? AND id > ?", (source, size))
+            for (day,) in days:
+                self._rebuild(connection, source, day)
+
+    def append(self, source: str, results: Iterable[Mapping[str, Any]]) -> None:
+        """Add events of a source; see `add`."""
+        self.add(results, source=source)
+
+    def read(self, source: str) -> Generator[dict, None, None]:
+        """Read the events of a source, in the order they were added."""
+        rows = self._connection.execute(
+            "SELECT data FROM events WHERE source = ? ORDER BY id", (source,)
+        )
+        for (data,) in rows:
+            yield json.loads(data)
+
+    def _rebuild(self, connection: sqlite3.Connection, source: str, day: str) -> None:
+        connection.execute("DELETE FROM daily WHERE source = ? AND day = ?", (source, day))
+        connection.execute("DELETE FROM daily_users WHERE source = ? AND day = ?", (source, day))
+        connection.execute(
+            "INSERT INTO daily"
+            " SELECT source, content_guid, day, COUNT(*), SUM(duration) FROM events"
+            " WHERE source = ? AND day = ? GROUP BY content_guid",
+            (source, day),
+        )
+        connection.execute(
+            "INSERT INTO daily_users"
+            " SELECT DISTINCT source, content_guid, day, user_guid FROM events"
+            " WHERE source = ? AND day = ? AND user_guid IS NOT NULL",
+            (source, day),
+        )
+
+    def rollup(
+        self,
+        period: Literal["day", "week", "month"] = "day",
+        *,
+        source: str = "visits",
+        content_guid: str | None = None,
+        start: str | None = None,
+        end: str | None = None,
+    ) -> List[Rollup]:
+        """
+        Aggregate the events of each content item by period.
+
+        Parameters
+        ----------
+        period : Literal["day", "week", "month"], optional
+            The length of each period, by default ``"day"``. Weeks start on Monday.
+        source : str, optional
+            The source of the events: ``"visits"``, ``"shiny_usage"`` or ``"hits"``, by default
+            ``"visits"``.
+        content_guid : str, optional
+            Only aggregate the events of this content item.
+        start : str, optional
+            The first day to aggregate, e.g. ``"2024-01-01"``. Events are assigned to the UTC day
+            of their start time.
+        end : str, optional
+            The last day to aggregate, e.g. ``"2024-01-31"``.
+
+        Returns
+        -------
+        List[Rollup]
+            Ordered by period, then content item.
+        """
+        if period not in _PERIODS:
+            raise ValueError(f"Unknown period {period!r}; expected one of {list(_PERIODS)}.")
+        conditions = ["source = ?"]
+        params: List[Any] = [source]
+        if content_guid is not None:
+            conditions.append("content_guid = ?")
+            params.append(content_guid)
+        if start is not None:
+            conditions.append("day >= ?")
+            params.append(start[:10])
+        if end is not None:
+            conditions.append("day <= ?")
+            params.append(end[:10])
+        where = " AND ".join(conditions)
+        key = _PERIODS[period]
+        query = f"""
+            WITH totals AS (
+                SELECT {key} AS period, content_guid, SUM(events) AS events,
+                    SUM(duration) AS duration
+                FROM daily WHERE {where} GROUP BY 1, 2
+            ), users AS (
+                SELECT {key} AS period, content_guid, COUNT(DISTINCT user_guid) AS users
+                FROM daily_users WHERE {where} GROUP BY 1, 2
+            )
+            SELECT totals.period, totals.content_guid, totals.events,
+                COALESCE(users.users, 0), totals.duration
+            FROM totals LEFT JOIN users USING (period, content_guid)
+            ORDER BY 1, 2
+        """
+        rows = self._connection.execute(query, params * 2).fetchall()
+        return [
+            Rollup(source, label, guid, events, users, duration)
+            for label, guid, events, users, duration in rows
+        ]
+
+
+def _utc(value: str | None) -> str | None:
+    """Normalize a timestamp to UTC, so that it sorts and its date is the UTC day."""
+    if not value:
+        return None
+    return parse_instant(value).astimezone(timezone.utc).isoformat()
@@ -0,0 +1,280 @@
+"""Incremental sync of metrics events to local files."""
+
+from __future__ import annotations
+
+import json
+import os
+from collections import Counter
+from datetime import timezone
+
+from typing_extensions import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Generator,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Protocol,
+    Tuple,
+)
+
+from ..cursors import CursorPaginator
+from .rename_params import rename_params
+from .timestamps import parse_instant
+
+if TYPE_CHECKING:
+    from ..context import Context
+
+# The path, time field and end time field of each source, keyed by source name.
+SOURCES: Dict[str, Tuple[str, str, Optional[str]]] = {
+    "visits": ("/v1/instrumentation/content/visits", "time", None),
+    "shiny_usage": ("/v1/instrumentation/shiny/usage", "started", "ended"),
+}
+
+
+class EventStore(Protocol):
+    """Where `MetricsSync` appends events; e.g. `JsonLinesStore` or `MetricsStore`."""
+
+    def size(self, source: str) -> int:
+        """Return the position after the last event of a source."""
+        ...
+
+    def truncate(self, source: str, size: int) -> None:
+        """Discard the events of a source after position `size`."""
+        ...
+
+    def append(self, source: str, results: Iterable[Mapping[str, Any]]) -> None:
+        """Durably append events to a source."""
+        ...
+
+    def read(self, source: str) -> Iterator[dict]:
+        """Read the events of a source, in the order they were appended."""
+        ...
+
+
+class JsonLinesStore:
+    """
+    Stores the events of each source in a JSON Lines file.
+
+    Parameters
+    ----------
+    directory : str | os.PathLike
+        The directory holding one ``<source>.jsonl`` file per source. Created when missing.
+    """
+
+    def __init__(self, directory: str | os.PathLike) -> None:
+        self.directory = os.fspath(directory)
+        os.makedirs(self.directory, exist_ok=True)
+
+    def path(self, source: str) -> str:
+        """Return the path of the file holding the events of a source."""
+        return os.path.join(self.directory, f"{source}.jsonl")
+
+    def size(self, source: str) -> int:
+        """Return the size of the file holding the events of a source, in bytes."""
+        try:
+            return os.path.getsize(self.path(source))
+        except FileNotFoundError:
+            return 0
+
+    def truncate(self, source: str, size: int) -> None:
+        """Discard anything written to a source after it reached `size` bytes."""
+        if self.size(source) > size:
+            with open(self.path(source), "r+b") as f:
+                f.truncate(size)
+
+    def append(self, source: str, results: Iterable[Mapping[str, Any]]) -> None:
+        """Append events to a source, flushed to disk before returning."""
+        with open(self.path(source), "a", encoding="utf-8") as f:
+            for result in results:
+                f.write(json.dumps(result))
+                f.write("\n")
+            f.flush()
+            os.fsync(f.fileno())
+
+    def read(self, source: str) -> Generator[dict, None, None]:
+        """Read the events of a source, in the order they were appended."""
+        try:
+            with open(self.path(source), encoding="utf-8") as f:
+                for line in f:
+                    yield json.loads(line)
+        except FileNotFoundError:
+            return
+
+
+class MetricsSync:
+    """
+    Incrementally copies visits and Shiny usage events from Connect into a local store.
+
+    Each run fetches only events at or after the newest event time seen by the previous run
+    (the watermark), skipping the events at the watermark that were already stored. Progress
+    is checkpointed to ``state.json`` after every page, together with the size of the store,
+    so a run interrupted mid-walk resumes from its last cursor without duplicating events.
+
+    Connect selects Shiny sessions by overlap, so a run also receives sessions that started
+    before the watermark; those are skipped, as they were stored by an earlier run. Sessions
+    which are still open are not stored until a later run receives them with an end time.
+
+    Events that Connect records with a time earlier than the watermark after a run has passed
+    it are not fetched.
+
+    Parameters
+    ----------
+    ctx : Context
+    directory : str | os.PathLike
+        The directory holding the state file and, unless `store` is given, the events.
+    store : EventStore, optional
+        Where to append events, by default a `JsonLinesStore` in `directory`. Use a
+        `posit.connect.metrics.store.MetricsStore` to maintain rollups of the events.
+    sources : Iterable[str], optional
+        The sources to sync, by default ``("visits", "shiny_usage")``.
+    """
+
+    def __init__(
+        self,
+        ctx: Context,
+        directory: str | os.PathLike,
+        *,
+        store: EventStore | None = None,
+        sources: Iterable[str] = tuple(SOURCES),
+    ) -> None:
+        self._ctx = ctx
+        self.directory = os.fspath(directory)
+        os.makedirs(self.directory, exist_ok=True)
+        self.store: EventStore = store if store is not None else JsonLinesStore(self.directory)
+        self.sources = tuple(sources)
+        for source in self.sources:
+            if source not in SOURCES:
+                raise ValueError(f"Unknown source {source!r}; expected one of {list(SOURCES)}.")
+
+    @property
+    def state_path(self) -> str:
+        return os.path.join(self.directory, "state.json")
+
+    def state(self) -> Dict[str, dict]:
+        """Return the checkpoint of each source, keyed by source name."""
+        try:
+            with open(self.state_path, encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+
+    def _save(self, state: Dict[str, dict]) -> None:
+        # Write to a temporary file and rename it, so the state file is never half-written.
+        path = self.state_path
+        with open(f"{path}.tmp", "w", encoding="utf-8") as f:
+            json.dump(state, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(f"{path}.tmp", path)
+
+    def run(self, **kwargs) -> Dict[str, int]:
+        """
+        Fetch the events added since the last run and append them to the store.
+
+        Parameters
+        ----------
+        **kwargs
+            Filters applied to every request, e.g. `content_guid` or `min_data_version`. Use the
+            same filters for every run against the same directory. `min_data_version` is saved
+            with the watermark, so later runs keep applying it unless they pass another.
+
+        Returns
+        -------
+        Dict[str, int]
+            The number of events appended for each source.
+        """
+        state = self.state()
+        return {source: self._sync(source, state, dict(kwargs)) for source in self.sources}
+
+    def _sync(self, source: str, state: Dict[str, dict], filters: dict) -> int:
+        path, field, end_field = SOURCES[source]
+        checkpoint = state.get(source, {})
+        # Discard events appended after the last checkpoint, e.g. by an interrupted run.
+        self.store.truncate(source, checkpoint.get("size", self.store.size(source)))
+
+        if checkpoint.get("next"):
+            # Resume the interrupted walk.
+            params = checkpoint["params"]
+            next_page = checkpoint["next"]
+        else:
+            if "min_data_version" not in filters and "min_data_version" in checkpoint:
+                filters["min_data_version"] = checkpoint["min_data_version"]
+            params = rename_params(filters)
+            if checkpoint.get("watermark"):
+                params["from"] = checkpoint["watermark"]
+            next_page = None
+
+        watermark = checkpoint.get("watermark")
+        min_data_version = params.get("min_data_version")
+        # The number of times each event at the watermark has been stored.
+        stored: Counter[str] = Counter(checkpoint.get("stored", {}))
+        # The events at the watermark that are yet to be returned again by the API.
+        repeated: Counter[str] = Counter(checkpoint["repeated"] if next_page else stored)
+        # The sessions that were open when they were received, which are stored once they end.
+        pending = set(checkpoint.get("pending", []))
+
+        count = 0
+        paginator = CursorPaginator(self._ctx, path, params=params)
+        while True:
+            page = paginator.fetch_page(next_page)
+            results: List[dict] = []
+            for result in page.results:
+                ended = False
+                if end_field is not None:
+                    session = _identity({**result, end_field: None}, field)
+                    if not result.get(end_field):
+                        pending.add(session)
+                        continue
+                    if session in pending:
+                        # An open session received by an earlier run has ended.
+                        pending.discard(session)
+                        ended = True
+                value = result.get(field)
+                time = parse_instant(value) if value else None
+                mark = parse_instant(watermark) if watermark else None
+                if time is not None:
+                    if mark is not None and time < mark:
+                        if not ended:
+                            # A session overlapping the watermark, stored by an earlier run.
+                            continue
+                    elif time == mark:
+                        identity = _identity(result, field)
+                        if repeated[identity] > 0:
+                            repeated[identity] -= 1
+                            continue
+                        stored[identity] += 1
+                    else:
+                        watermark = value
+                        stored = Counter({_identity(result, field): 1})
+                        repeated = Counter()
+                results.append(result)
+
+            self.store.append(source, results)
+            count += len(results)
+            next_page = page.paging.get("cursors", {}).get("next")
+            state[source] = {
+                "params": params,
+                "next": next_page,
+                "size": self.store.size(source),
+                "watermark": watermark,
+                "stored": dict(stored),
+                "repeated": dict(repeated),
+                "pending": sorted(pending),
+            }
+            if min_data_version is not None:
+                state[source]["min_data_version"] = min_data_version
+            self._save(state)
+            if not next_page:
+                return count
+
+
+def _identity(result: Dict[str, Any], field: str) -> str:
+    # The same instant may be written with different offsets.
+    return json.dumps(
+        {**result, field: parse_instant(result[field]).astimezone(timezone.utc).isoformat()},
+        sort_keys=True,
+    )
@@ -0,0 +1,148 @@
+"""Timestamp parsing for metrics events."""
+
+from __future__ import annotations
+
+import functools
+import re
+from dataclasses import dataclass
+from datetime import datetime, timezone
+
+from typing_extensions import TYPE_CHECKING, Any, Iterable, List, Mapping
+
+if TYPE_CHECKING:
+    import numpy as np
+
+
+def _numpy() -> Any:
+    try:
+        import numpy as np
+    except ImportError as e:
+        raise ImportError("The 'numpy' package is required to use this function.") from e
+    return np
+
+
+# The fractional seconds of a timestamp.
+_FRACTION = re.compile(r"\.(\d+)")
+
+
+def _microseconds(match: re.Match) -> str:
+    # Before Python 3.11, `fromisoformat` only accepts 3 or 6 fractional digits.
+    return "." + match.group(1)[:6].ljust(6, "0")
+
+
+@functools.lru_cache(maxsize=4096)
+def parse_timestamp(value: str) -> datetime:
+    """
+    Parse an RFC 3339 timestamp into a datetime.
+
+    Results are cached, so a timestamp shared by many events is parsed once. Timestamps without
+    an offset are parsed into naive datetimes; use `parse_instant` to compare them with others.
+
+    Parameters
+    ----------
+    value : str
+        The timestamp, e.g. ``"2018-09-15T18:00:00-05:00"``.
+
+    Returns
+    -------
+    datetime
+    """
+    if value[-1:] in ("Z", "z"):
+        value = value[:-1] + "+00:00"
+    return datetime.fromisoformat(_FRACTION.sub(_microseconds, value, count=1))
+
+
+def parse_instant(value: str) -> datetime:
+    """
+    Parse an RFC 3339 timestamp into a timezone-aware datetime.
+
+    Timestamps without an offset are UTC, so that they compare with those that have one.
+
+    Parameters
+    ----------
+    value : str
+        The timestamp, e.g. ``"2018-09-15T18:00:00-05:00"``.
+
+    Returns
+    -------
+    datetime
+    """
+    instant = parse_timestamp(value)
+    return instant if instant.tzinfo else instant.replace(tzinfo=timezone.utc)
+
+
+def _split(value: str) -> tuple[str, int]:
+    """Split a timestamp into its local time and its UTC offset in minutes."""
+    if value[-1:] in ("Z", "z"):
+        return value[:-1], 0
+    if len(value) > 6 and value[-6] in "+-" and value[-3] == ":":
+        minutes = int(value[-5:-3]) * 60 + int(value[-2:])
+        return value[:-6], -minutes if value[-6] == "-" else minutes
+    return value, 0
+
+
+def parse_timestamps(values: Iterable[str | None]) -> np.ndarray:
+    """
+    Parse RFC 3339 timestamps into a NumPy array.
+
+    The timestamps are converted to UTC in a single pass. Requires the `numpy` package.
+
+    Parameters
+    ----------
+    values : Iterable[str | None]
+        The timestamps. Missing values (None or empty) become ``NaT``.
+
+    Returns
+    -------
+    numpy.ndarray
+        A ``datetime64[us]`` array of UTC times.
+
+    Examples
+    --------
+    >>> parse_timestamps(["2018-09-15T18:00:00-05:00", None])
+    array(['2018-09-15T23:00:00.000000', 'NaT'], dtype='datetime64[us]')
+    """
+    np = _numpy()
+    local: List[str] = []
+    offsets: List[int] = []
+    for value in values:
+        if value:
+            time, minutes = _split(value)
+        else:
+            time, minutes = "NaT", 0
+        local.append(time)
+        offsets.append(minutes)
+    return np.array(local, dtype="datetime64[us]") - np.array(offsets, dtype="timedelta64[m]")
+
+
+@dataclass(frozen=True)
+class EventTimes:
+    """
+    The start and end times of events, as NumPy arrays.
+
+    Attributes
+    ----------
+        started (numpy.ndarray): The UTC start time of each event, as ``datetime64[us]``.
+        ended (numpy.ndarray): The UTC end time of each event, as ``datetime64[us]``.
+    """
+
+    started: np.ndarray
+    ended: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.started)
+
+    @property
+    def durations(self) -> np.ndarray:
+        """The duration of each event, as ``timedelta64[us]``; ``NaT`` when either time is missing."""
+        return self.ended - self.started
+
+
+def event_times(results: Iterable[Mapping[str, Any]], started: str, ended: str) -> EventTimes:
+    """Collect and parse the start and end times of events from API results."""
+    start: List[str | None] = []
+    end: List[str | None] = []
+    for result in results:
+        start.append(result.get(started))
+        end.append(result.get(ended))
+    return EventTimes(parse_timestamps(start), parse_timestamps(end))
@@ -2,57 +2,53 @@
 
 from __future__ import annotations
 
+import heapq
+from datetime import datetime, timezone
+
 from requests.sessions import Session as Session
-from typing_extensions import List, overload
+from typing_extensions import Any, Generator, Iterator, List, Mapping, overload
 
 from .. import resources
+from .._utils import in_background
+from ..cursors import _MAX_PAGE_SIZE
+from ..frames import FrameExportMixin
+from ..records import Record, to_record
 from . import shiny_usage, visits
+from .timestamps import EventTimes, event_times, parse_instant
 
 
-class UsageEvent(resources.BaseResource):
-    @staticmethod
-    def from_event(
-        event: visits.VisitEvent | shiny_usage.ShinyUsageEvent,
-    ) -> UsageEvent:
-        if isinstance(event, visits.VisitEvent):
-            return UsageEvent.from_visit_event(event)
-
-        if isinstance(event, shiny_usage.ShinyUsageEvent):
-            return UsageEvent.from_shiny_usage_event(event)
-
-        raise TypeError
+class _UsageEventFields(Mapping[str, Any]):
+    """Field accessors shared by [](`UsageEvent`) and its asynchronous counterpart."""
 
     @staticmethod
-    def from_visit_event(event: visits.VisitEvent) -> UsageEvent:
-        return UsageEvent(
-            event._ctx,
-            content_guid=event.content_guid,
-            user_guid=event.user_guid,
-            variant_key=event.variant_key,
-            rendering_id=event.rendering_id,
-            bundle_id=event.bundle_id,
-            started=event.time,
-            ended=event.time,
-            data_version=event.data_version,
-            path=event.path,
-        )
+    def _visit_fields(result: Mapping[str, Any]) -> dict:
+        """Map the fields of a visit to the fields of a usage event."""
+        return {
+            "content_guid": result.get("content_guid"),
+            "user_guid": result.get("user_guid"),
+            "variant_key": result.get("variant_key"),
+            "rendering_id": result.get("rendering_id"),
+            "bundle_id": result.get("bundle_id"),
+            "started": result.get("time"),
+            "ended": result.get("time"),
+            "data_version": result.get("data_version"),
+            "path": result.get("path"),
+        }
 
     @staticmethod
-    def from_shiny_usage_event(
-        event: shiny_usage.ShinyUsageEvent,
-    ) -> UsageEvent:
-        return UsageEvent(
-            event._ctx,
-            content_guid=event.content_guid,
-            user_guid=event.user_guid,
-            variant_key=None,
-            rendering_id=None,
-            bundle_id=None,
-            started=event.started,
-            ended=event.ended,
-            data_version=event.data_version,
-            path=None,
-        )
+    def _shiny_usage_fields(result: Mapping[str, Any]) -> dict:
+        """Map the fields of a Shiny usage event to the fields of a usage event."""
+        return {
+            "content_guid": result.get("content_guid"),
+            "user_guid": result.get("user_guid"),
+            "variant_key": None,
+            "rendering_id": None,
+            "bundle_id": None,
+            "started": result.get("started"),
+            "ended": result.get("ended"),
+            "data_version": result.get("data_version"),
+            "path": None,
+        }
 
     @property
     def content_guid(self) -> str:
@@ -147,9 +143,35 @@ class UsageEvent(resources.BaseResource):
         return self["path"]
 
 
-class Usage(resources.Resources):
+class UsageEvent(resources.BaseResource, _UsageEventFields):
+    @staticmethod
+    def from_event(
+        event: visits.VisitEvent | shiny_usage.ShinyUsageEvent,
+    ) -> UsageEvent:
+        if isinstance(event, visits.VisitEvent):
+            return UsageEvent.from_visit_event(event)
+
+        if isinstance(event, shiny_usage.ShinyUsageEvent):
+            return UsageEvent.from_shiny_usage_event(event)
+
+        raise TypeError
+
+    @staticmethod
+    def from_visit_event(event: visits.VisitEvent) -> UsageEvent:
+        return UsageEvent(event._ctx, **UsageEvent._visit_fields(event))
+
+    @staticmethod
+    def from_shiny_usage_event(
+        event: shiny_usage.ShinyUsageEvent,
+    ) -> UsageEvent:
+        return UsageEvent(event._ctx, **UsageEvent._shiny_usage_fields(event))
+
+
+class Usage(FrameExportMixin, resources.Resources):
     """Usage resource."""
 
+    _timestamps = ("started", "ended")
+
     @overload
     def find(
         self,
@@ -158,6 +180,8 @@ class Usage(resources.Resources):
         min_data_version: int = ...,
         start: str = ...,
         end: str = ...,
+        prefetch: int = ...,
+        shards: int = ...,
     ) -> List[UsageEvent]:
         """Find view events.
 
@@ -171,6 +195,11 @@ class Usage(resources.Resources):
             Filter by the start time, by default ...
         end : str, optional
             Filter by the end time, by default ...
+        prefetch : int, optional
+            The number of pages to fetch ahead on a background thread, by default 0
+        shards : int, optional
+            The number of sub-windows of `start` to `end` to fetch concurrently, by default 1.
+            Requires both `start` and `end`; `prefetch` does not apply to sharded fetches.
 
         Returns
         -------
@@ -178,7 +207,7 @@ class Usage(resources.Resources):
         """
 
     @overload
-    def find(self, **kwargs) -> List[UsageEvent]:
+    def find(self, *, prefetch: int = ..., **kwargs) -> List[UsageEvent]:
         """Find view events.
 
         Returns
@@ -186,21 +215,135 @@ class Usage(resources.Resources):
         List[UsageEvent]
         """
 
-    def find(self, **kwargs) -> List[UsageEvent]:
+    def find(self, *, prefetch: int = 0, **kwargs) -> List[UsageEvent]:
         """Find view events.
 
+        Visit events and Shiny usage events are merged in order of start time, and fetched
+        concurrently with `prefetch`; see `iter_find`.
+
         Returns
         -------
         List[UsageEvent]
         """
-        events = []
-        finders = (visits.Visits, shiny_usage.ShinyUsage)
-        for finder in finders:
-            instance = finder(self._ctx)
-            events.extend(
-                [UsageEvent.from_event(event) for event in instance.find(**kwargs)],
-            )
-        return events
+        return list(self.iter_find(prefetch=prefetch, **kwargs))
+
+    @overload
+    def iter_find(
+        self,
+        *,
+        content_guid: str = ...,
+        min_data_version: int = ...,
+        start: str = ...,
+        end: str = ...,
+        prefetch: int = ...,
+        shards: int = ...,
+    ) -> Generator[UsageEvent, None, None]:
+        """Lazily find view events.
+
+        Parameters
+        ----------
+        content_guid : str, optional
+            Filter by an associated unique content identifer, by default ...
+        min_data_version : int, optional
+            Filter by a minimum data version, by default ...
+        start : str, optional
+            Filter by the start time, by default ...
+        end : str, optional
+            Filter by the end time, by default ...
+        prefetch : int, optional
+            The number of pages to fetch ahead on a background thread, by default 0
+        shards : int, optional
+            The number of sub-windows of `start` to `end` to fetch concurrently, by default 1.
+            Requires both `start` and `end`; `prefetch` does not apply to sharded fetches.
+
+        Yields
+        ------
+        UsageEvent
+        """
+
+    @overload
+    def iter_find(self, *, prefetch: int = ..., **kwargs) -> Generator[UsageEvent, None, None]:
+        """Lazily find view events.
+
+        Yields
+        ------
+        UsageEvent
+        """
+
+    def iter_find(self, *, prefetch: int = 0, **kwargs) -> Generator[UsageEvent, None, None]:
+        """Lazily find view events.
+
+        Visit events and Shiny usage events are merged into a single stream ordered by start
+        time, as Connect returns each in ascending order of time. Events that start at the same
+        time are yielded in the order visits, then Shiny usage. With `prefetch`, both are fetched
+        concurrently, each on a background thread holding up to `prefetch` pages of events
+        ahead of the consumer.
+
+        Yields
+        ------
+        UsageEvent
+        """
+        for result in self._iter_results(prefetch=prefetch, **kwargs):
+            yield UsageEvent(self._ctx, **result)
+
+    def find_times(self, *, prefetch: int = 0, **kwargs) -> EventTimes:
+        """Find the start and end times of view events as NumPy arrays.
+
+        Accepts the same parameters as `find`. The timestamps of every event are parsed in a
+        single pass into ``datetime64`` arrays in UTC, and `EventTimes.durations` computes every
+        duration at once. Requires the `numpy` package.
+
+        Returns
+        -------
+        EventTimes
+
+        Examples
+        --------
+        >>> times = client.metrics.usage.find_times(start="2024-01-01T00:00:00Z")
+        >>> times.durations.mean()
+        """
+        results = self._iter_results(prefetch=prefetch, **kwargs)
+        return event_times(results, "started", "ended")
+
+    def iter_records(self, *, prefetch: int = 0, **kwargs) -> Generator[Record, None, None]:
+        """Lazily find view events as compact records.
+
+        Accepts the same parameters as `iter_find`, but yields read-only records with the fields
+        of `UsageEvent` instead of resources, which use a fraction of the memory when reading
+        many events.
+
+        Yields
+        ------
+        Record
+        """
+        for result in self._iter_results(prefetch=prefetch, **kwargs):
+            yield to_record(result)
+
+    def _iter_results(self, *, prefetch: int = 0, **kwargs) -> Generator[dict, None, None]:
+        if prefetch < 0:
+            raise ValueError("`prefetch=` must be greater than or equal to 0.")
+        sources: List[Iterator[dict]] = [
+            map(UsageEvent._visit_fields, visits.Visits(self._ctx)._iter_results(**kwargs)),
+            map(
+                UsageEvent._shiny_usage_fields,
+                shiny_usage.ShinyUsage(self._ctx)._iter_results(**kwargs),
+            ),
+        ]
+        # Connect returns the events of each source in ascending order of time, which the merge
+        # relies on.
+        if not prefetch:
+            yield from heapq.merge(*sources, key=_started)
+            return
+        # Start both background threads before merging, so that the sources are fetched
+        # concurrently rather than one page at a time.
+        streams = [
+            in_background(source, prefetch * _MAX_PAGE_SIZE, name="Usage") for source in sources
+        ]
+        try:
+            yield from heapq.merge(*streams, key=_started)
+        finally:
+            for stream in streams:
+                stream.close()
 
     @overload
     def find_one(
@@ -252,3 +395,12 @@ class Usage(resources.Resources):
             if event:
                 return UsageEvent.from_event(event)
         return None
+
+
+# Sorts events without a start time first.
+_EPOCH = datetime.min.replace(tzinfo=timezone.utc)
+
+
+def _started(result: dict) -> datetime:
+    started = result.get("started")
+    return parse_instant(started) if started else _EPOCH
@@ -1,13 +1,19 @@
 from __future__ import annotations
 
-from typing_extensions import List, overload
+from typing_extensions import Any, Generator, List, Mapping, overload
 
 from ..cursors import CursorPaginator
+from ..frames import FrameExportMixin
+from ..records import Record, to_record
 from ..resources import BaseResource, Resources
 from .rename_params import rename_params
+from .shards import fetch_sharded
+from .timestamps import EventTimes, event_times
 
 
-class VisitEvent(BaseResource):
+class _VisitEventFields(Mapping[str, Any]):
+    """Field accessors shared by [](`VisitEvent`) and its asynchronous counterpart."""
+
     @property
     def content_guid(self) -> str:
         """The associated unique content identifier.
@@ -91,7 +97,13 @@ class VisitEvent(BaseResource):
         return self["path"]
 
 
-class Visits(Resources):
+class VisitEvent(BaseResource, _VisitEventFields):
+    pass
+
+
+class Visits(FrameExportMixin, Resources):
+    _timestamps = ("time",)
+
     @overload
     def find(
         self,
@@ -100,6 +112,8 @@ class Visits(Resources):
         min_data_version: int = ...,
         start: str = ...,
         end: str = ...,
+        prefetch: int = ...,
+        shards: int = ...,
     ) -> List[VisitEvent]:
         """Find visits.
 
@@ -113,6 +127,11 @@ class Visits(Resources):
             Filter by the start time, by default ...
         end : str, optional
             Filter by the end time, by default ...
+        prefetch : int, optional
+            The number of pages to fetch ahead on a background thread, by default 0
+        shards : int, optional
+            The number of sub-windows of `start` to `end` to fetch concurrently, by default 1.
+            Requires both `start` and `end`; `prefetch` does not apply to sharded fetches.
 
         Returns
         -------
@@ -120,7 +139,7 @@ class Visits(Resources):
         """
 
     @overload
-    def find(self, **kwargs) -> List[VisitEvent]:
+    def find(self, *, prefetch: int = ..., **kwargs) -> List[VisitEvent]:
         """Find visits.
 
         Returns
@@ -128,25 +147,112 @@ class Visits(Resources):
         List[Visit]
         """
 
-    def find(self, **kwargs) -> List[VisitEvent]:
+    def find(self, *, prefetch: int = 0, **kwargs) -> List[VisitEvent]:
         """Find visits.
 
         Returns
         -------
         List[Visit]
         """
+        return list(self.iter_find(prefetch=prefetch, **kwargs))
+
+    @overload
+    def iter_find(
+        self,
+        *,
+        content_guid: str = ...,
+        min_data_version: int = ...,
+        start: str = ...,
+        end: str = ...,
+        prefetch: int = ...,
+        shards: int = ...,
+    ) -> Generator[VisitEvent, None, None]:
+        """Lazily find visits.
+
+        Parameters
+        ----------
+        content_guid : str, optional
+            Filter by an associated unique content identifer, by default ...
+        min_data_version : int, optional
+            Filter by a minimum data version, by default ...
+        start : str, optional
+            Filter by the start time, by default ...
+        end : str, optional
+            Filter by the end time, by default ...
+        prefetch : int, optional
+            The number of pages to fetch ahead on a background thread, by default 0
+        shards : int, optional
+            The number of sub-windows of `start` to `end` to fetch concurrently, by default 1.
+            Requires both `start` and `end`; `prefetch` does not apply to sharded fetches.
+
+        Yields
+        ------
+        VisitEvent
+        """
+
+    @overload
+    def iter_find(self, *, prefetch: int = ..., **kwargs) -> Generator[VisitEvent, None, None]:
+        """Lazily find visits.
+
+        Yields
+        ------
+        VisitEvent
+        """
+
+    def iter_find(self, *, prefetch: int = 0, **kwargs) -> Generator[VisitEvent, None, None]:
+        """Lazily find visits.
+
+        Like `find`, but yields each visit as its page arrives.
+
+        Yields
+        ------
+        VisitEvent
+        """
+        for result in self._iter_results(prefetch=prefetch, **kwargs):
+            yield VisitEvent(self._ctx, **result)
+
+    def find_times(self, *, prefetch: int = 0, **kwargs) -> EventTimes:
+        """Find the start and end times of visits as NumPy arrays.
+
+        Accepts the same parameters as `find`. The timestamps of every event are parsed in a
+        single pass into ``datetime64`` arrays in UTC, and `EventTimes.durations` computes every
+        duration at once. Requires the `numpy` package.
+
+        The start and end times of a visit are both its `time`, so its duration is zero.
+
+        Returns
+        -------
+        EventTimes
+        """
+        results = self._iter_results(prefetch=prefetch, **kwargs)
+        return event_times(results, "time", "time")
+
+    def iter_records(self, *, prefetch: int = 0, **kwargs) -> Generator[Record, None, None]:
+        """Lazily find visits as compact records.
+
+        Accepts the same parameters as `iter_find`, but yields read-only records instead of
+        `VisitEvent` resources, which use a fraction of the memory when reading many events.
+
+        Yields
+        ------
+        Record
+        """
+        for result in self._iter_results(prefetch=prefetch, **kwargs):
+            yield to_record(result)
+
+    def _iter_results(
+        self, *, prefetch: int = 0, shards: int = 1, **kwargs
+    ) -> Generator[dict, None, None]:
         params = rename_params(kwargs)
 
         path = "/v1/instrumentation/content/visits"
-        paginator = CursorPaginator(self._ctx, path, params=params)
-        results = paginator.fetch_results()
-        return [
-            VisitEvent(
-                self._ctx,
-                **result,
-            )
-            for result in results
-        ]
+        if shards > 1:
+            yield from fetch_sharded(self._ctx, path, params, shards=shards, field="time")
+            return
+
+        paginator = CursorPaginator(self._ctx, path, params=params, prefetch=prefetch)
+        for page in paginator.fetch_pages():
+            yield from page.results
 
     @overload
     def find_one(
@@ -191,16 +297,4 @@ class Visits(Resources):
         -------
         Visit | None
         """
-        params = rename_params(kwargs)
-        path = "/v1/instrumentation/content/visits"
-        paginator = CursorPaginator(self._ctx, path, params=params)
-        pages = paginator.fetch_pages()
-        results = (result for page in pages for result in page.results)
-        visits = (
-            VisitEvent(
-                self._ctx,
-                **result,
-            )
-            for result in results
-        )
-        return next(visits, None)
+        return next(self.iter_find(**kwargs), None)
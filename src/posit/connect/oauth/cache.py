@@ -0,0 +1,210 @@
+"""Expiry-aware cache of OAuth credentials."""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import threading
+import time
+from collections import OrderedDict
+
+from typing_extensions import TYPE_CHECKING, Callable, Dict, Optional, Set, Tuple
+
+if TYPE_CHECKING:
+    from .oauth import Credentials
+
+logger = logging.getLogger(__name__)
+
+CacheKey = Tuple[str, str, Optional[str], Optional[str]]
+
+
+def cache_key(
+    subject_token_type: str,
+    subject_token: str,
+    requested_token_type: str | None = None,
+    audience: str | None = None,
+) -> CacheKey:
+    """
+    Return the cache key of a credential exchange.
+
+    The subject token is hashed, so the cache does not hold session tokens.
+    """
+    digest = hashlib.sha256(subject_token.encode()).hexdigest()
+    return (str(subject_token_type), digest, requested_token_type, audience)
+
+
+class _Exchange:
+    """The lock of the exchanges of a key, and the number of threads holding or awaiting it."""
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.users = 0
+
+
+class CredentialsCache:
+    """
+    Thread-safe cache of the credentials returned by OAuth credential exchanges.
+
+    Credentials are cached until `skew` seconds before they expire, using the ``expires_in``
+    field of the exchange response or, without it, the lifetime registered for the requested
+    token type with `set_lifetime`; other credentials are not cached.
+    Concurrent requests for the same credentials wait for a single exchange.
+
+    Callers that cannot afford to wait for an exchange may ask for credentials to be refreshed
+    ahead of expiry: once half their lifetime has passed, they are exchanged again in a
+    background thread while the cached credentials are returned.
+
+    Parameters
+    ----------
+    maxsize : int, optional
+        The maximum number of credentials to keep; the least recently used are evicted first, by
+        default 128
+    skew : float, optional
+        The number of seconds before expiry at which credentials are exchanged again, by
+        default 60
+
+    Examples
+    --------
+    Always perform a new exchange:
+
+    >>> client.oauth.credentials_cache.clear()
+    """
+
+    def __init__(self, maxsize: int = 128, skew: float = 60) -> None:
+        if maxsize < 1:
+            raise ValueError("maxsize must be greater than or equal to 1")
+        if skew < 0:
+            raise ValueError("skew must be greater than or equal to 0")
+        self.maxsize = maxsize
+        self.skew = skew
+        # The expiry, the time from which to refresh ahead, and the credentials of each key.
+        self._entries: OrderedDict[CacheKey, Tuple[float, float, Credentials]] = OrderedDict()
+        self._exchanges: Dict[CacheKey, _Exchange] = {}
+        self._refreshing: Set[CacheKey] = set()
+        self._lifetimes: Dict[str, Callable[[Credentials], Optional[float]]] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def clear(self) -> None:
+        """Discard all cached credentials."""
+        with self._lock:
+            self._entries.clear()
+
+    def get(self, key: CacheKey) -> Credentials | None:
+        """
+        Return cached credentials, unless they expire within `skew` seconds.
+
+        The returned ``expires_in`` is the number of seconds remaining.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, _, credentials = entry
+            remaining = expires_at - time.monotonic()
+            if remaining <= self.skew:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+        result = dict(credentials)
+        result["expires_in"] = int(remaining)
+        return result  # pyright: ignore[reportReturnType]
+
+    def set_lifetime(
+        self,
+        requested_token_type: str,
+        lifetime: Callable[[Credentials], Optional[float]],
+    ) -> None:
+        """
+        Set how long credentials of a requested token type live when they lack ``expires_in``.
+
+        `lifetime` returns the number of seconds until the credentials expire, or None when it
+        is unknown. Integrations whose tokens carry their own expiry use it to keep them cached.
+        """
+        with self._lock:
+            self._lifetimes[requested_token_type] = lifetime
+
+    def put(self, key: CacheKey, credentials: Credentials) -> None:
+        """Cache credentials, when their lifetime is known."""
+        expires_in = credentials.get("expires_in")
+        if expires_in is None:
+            lifetime = self._lifetimes.get(key[2]) if key[2] is not None else None
+            expires_in = lifetime(credentials) if lifetime is not None else None
+        if expires_in is None or expires_in <= 0:
+            return
+        now = time.monotonic()
+        expires_at = now + float(expires_in)
+        with self._lock:
+            self._entries[key] = (expires_at, now + float(expires_in) / 2, credentials)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def get_or_exchange(
+        self,
+        key: CacheKey,
+        exchange: Callable[[], Credentials],
+        *,
+        refresh_ahead: bool = False,
+    ) -> Credentials:
+        """
+        Return cached credentials, or call `exchange` and cache its result.
+
+        Concurrent calls with the same key perform a single exchange. With `refresh_ahead`,
+        cached credentials past half their lifetime are exchanged again in the background.
+        """
+        credentials = self.get(key)
+        if credentials is not None:
+            if refresh_ahead and self._due(key):
+                self._refresh_in_background(key, exchange)
+            return credentials
+        return self._exchange(key, exchange, refresh=False)
+
+    def _due(self, key: CacheKey) -> bool:
+        with self._lock:
+            entry = self._entries.get(key)
+            return entry is not None and time.monotonic() >= entry[1]
+
+    def _refresh_in_background(self, key: CacheKey, exchange: Callable[[], Credentials]) -> None:
+        with self._lock:
+            if key in self._refreshing:
+                return
+            self._refreshing.add(key)
+
+        def refresh() -> None:
+            try:
+                self._exchange(key, exchange, refresh=True)
+            except Exception:
+                # The credentials are exchanged again in the foreground once they expire.
+                logger.debug("Refreshing OAuth credentials failed", exc_info=True)
+            finally:
+                with self._lock:
+                    self._refreshing.discard(key)
+
+        threading.Thread(target=refresh, daemon=True).start()
+
+    def _exchange(
+        self, key: CacheKey, exchange: Callable[[], Credentials], *, refresh: bool
+    ) -> Credentials:
+        with self._lock:
+            entry = self._exchanges.setdefault(key, _Exchange())
+            entry.users += 1
+        try:
+            with entry.lock:
+                # Another thread may have completed the exchange while this one waited.
+                credentials = self.get(key)
+                if credentials is not None and not (refresh and self._due(key)):
+                    return credentials
+                credentials = exchange()
+                self.put(key, credentials)
+                return credentials
+        finally:
+            with self._lock:
+                # The lock is kept while other threads wait on it, so that later threads wait on
+                # the same lock rather than exchanging alongside them.
+                entry.users -= 1
+                if entry.users == 0:
+                    del self._exchanges[key]
@@ -3,10 +3,11 @@ from __future__ import annotations
 import logging
 import os
 
-from typing_extensions import TYPE_CHECKING, Optional, TypedDict
+from typing_extensions import TYPE_CHECKING, Dict, Optional, Tuple, TypedDict
 
 from ..oauth import types
 from ..resources import Resources
+from .cache import CredentialsCache, cache_key
 from .integrations import Integrations
 from .sessions import Sessions
 
@@ -22,6 +23,32 @@ OAuthTokenType = types.OAuthTokenType
 
 logger = logging.getLogger(__name__)
 
+# The signature and contents of each token file read, keyed by path.
+_token_files: Dict[str, Tuple[Tuple[int, int, int, int], str]] = {}
+
+
+def _read_token_file(path: str) -> str:
+    """Return the stripped contents of a token file.
+
+    The contents are cached, and read again only when the file's device, inode,
+    modification time or size change, so a rotated file is picked up on the next
+    call at the cost of a single `stat`.
+
+    Raises
+    ------
+    FileNotFoundError
+        If the file does not exist.
+    """
+    stat = os.stat(path)
+    signature = (stat.st_dev, stat.st_ino, stat.st_mtime_ns, stat.st_size)
+    cached = _token_files.get(path)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+    with open(path) as f:
+        value = f.read().strip()
+    _token_files[path] = (signature, value)
+    return value
+
 
 def _get_content_session_token() -> Optional[str]:
     """Return the content session token, if available.
@@ -38,8 +65,7 @@ def _get_content_session_token() -> Optional[str]:
     token_file = os.environ.get("CONNECT_CONTENT_SESSION_TOKEN_FILE")
     if token_file:
         try:
-            with open(token_file) as f:
-                value = f.read().strip()
+            value = _read_token_file(token_file)
             if value:
                 return value
             logger.warning(
@@ -66,11 +92,18 @@ class OAuth(Resources):
     def sessions(self):
         return Sessions(self._ctx)
 
+    @property
+    def credentials_cache(self) -> CredentialsCache:
+        """The credentials cached by `get_credentials` and `get_content_credentials`."""
+        return self._ctx.oauth_credentials
+
     def get_credentials(
         self,
         user_session_token: str,
         requested_token_type: Optional[str | types.OAuthTokenType] = None,
         audience: Optional[str] = None,
+        *,
+        refresh_ahead: bool = False,
     ) -> Credentials:
         """Perform an oauth credential exchange with a user-session-token.
 
@@ -82,24 +115,25 @@ class OAuth(Resources):
             The type of token being requested. This can be one of the predefined types in `OAuthTokenType` or a custom string.
         audience : str, optional
             The intended audience for the token. This must be a valid integration GUID.
+        refresh_ahead : bool, optional
+            When True, cached credentials past half their lifetime are exchanged again in a background thread while the cached credentials are returned. Default is False.
 
         Returns
         -------
         Credentials
             The credentials obtained from the exchange.
+
+        Notes
+        -----
+        Credentials are cached until shortly before they expire; see `credentials_cache`.
         """
-        # craft a credential exchange request
-        data = {}
-        data["grant_type"] = types.GRANT_TYPE
-        data["subject_token_type"] = types.OAuthTokenType.USER_SESSION_TOKEN
-        data["subject_token"] = user_session_token
-        if requested_token_type:
-            data["requested_token_type"] = requested_token_type
-        if audience:
-            data["audience"] = audience
-
-        response = self._ctx.client.post(self._path, data=data)
-        return Credentials(**response.json())
+        return self._exchange(
+            types.OAuthTokenType.USER_SESSION_TOKEN,
+            user_session_token,
+            requested_token_type,
+            audience,
+            refresh_ahead=refresh_ahead,
+        )
 
     def has_content_credentials(self) -> bool:
         """Check whether OAuth content credentials are available.
@@ -119,6 +153,8 @@ class OAuth(Resources):
         content_session_token: Optional[str] = None,
         requested_token_type: Optional[str | types.OAuthTokenType] = None,
         audience: Optional[str] = None,
+        *,
+        refresh_ahead: bool = False,
     ) -> Optional[Credentials]:
         """Perform an oauth credential exchange with a content-session-token.
 
@@ -130,32 +166,65 @@ class OAuth(Resources):
             The type of token being requested. This can be one of the predefined types in `OAuthTokenType` or a custom string.
         audience : str, optional
             The intended audience for the token. This must be a valid integration GUID.
+        refresh_ahead : bool, optional
+            When True, cached credentials past half their lifetime are exchanged again in a background thread while the cached credentials are returned. Default is False.
 
         Returns
         -------
         Optional[Credentials]
             The credentials obtained from the exchange, or None if no content
             session token is available.
+
+        Notes
+        -----
+        Credentials are cached until shortly before they expire; see `credentials_cache`.
         """
         token = content_session_token or _get_content_session_token()
         if token is None:
             return None
 
-        # craft a credential exchange request
-        data = {}
-        data["grant_type"] = types.GRANT_TYPE
-        data["subject_token_type"] = types.OAuthTokenType.CONTENT_SESSION_TOKEN
-        data["subject_token"] = token
-        if requested_token_type:
-            data["requested_token_type"] = requested_token_type
-        if audience:
-            data["audience"] = audience
+        return self._exchange(
+            types.OAuthTokenType.CONTENT_SESSION_TOKEN,
+            token,
+            requested_token_type,
+            audience,
+            refresh_ahead=refresh_ahead,
+        )
 
-        response = self._ctx.client.post(self._path, data=data)
-        return Credentials(**response.json())
+    def _exchange(
+        self,
+        subject_token_type: str,
+        subject_token: str,
+        requested_token_type: Optional[str],
+        audience: Optional[str],
+        *,
+        refresh_ahead: bool = False,
+    ) -> Credentials:
+        def exchange() -> Credentials:
+            # craft a credential exchange request
+            data = {}
+            data["grant_type"] = types.GRANT_TYPE
+            data["subject_token_type"] = subject_token_type
+            data["subject_token"] = subject_token
+            if requested_token_type:
+                data["requested_token_type"] = requested_token_type
+            if audience:
+                data["audience"] = audience
+
+            response = self._ctx.client.post(self._path, data=data)
+            return Credentials(**response.json())
+
+        key = cache_key(
+            subject_token_type,
+            subject_token,
+            requested_token_type or None,
+            audience or None,
+        )
+        return self.credentials_cache.get_or_exchange(key, exchange, refresh_ahead=refresh_ahead)
 
 
 class Credentials(TypedDict, total=False):
     access_token: str
     issued_token_type: str
     token_type: str
+    expires_in: int
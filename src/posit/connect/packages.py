@@ -3,13 +3,18 @@
 from __future__ import annotations
 
 from typing_extensions import (
+    TYPE_CHECKING,
     Iterable,
+    Iterator,
     Literal,
     Protocol,
 )
 
 from .resources import Resource, ResourceSequence
 
+if TYPE_CHECKING:
+    from .records import Record
+
 
 class ContentPackage(Resource, Protocol):
     pass
@@ -120,6 +125,29 @@ class Packages(ResourceSequence[Package], Protocol):
         """
         ...
 
+    def fetch_records(
+        self,
+        *,
+        language: Literal["python", "r"] = ...,
+        name: str = ...,
+        version: str = ...,
+        hash: str | None = ...,  # noqa: A002,
+        bundle_id: str = ...,
+        app_id: str = ...,
+        app_guid: str = ...,
+    ) -> Iterator[Record]:
+        """
+        Fetch all records matching the specified conditions as compact, read-only records.
+
+        Accepts the same parameters as `fetch`, but yields records instead of resources, which
+        use a fraction of the memory when reading many packages.
+
+        Returns
+        -------
+        Iterator[Record]
+        """
+        ...
+
     def find_by(
         self,
         *,
@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+import math
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
 
 from typing_extensions import TYPE_CHECKING, Generator, List
@@ -35,6 +38,9 @@ class Paginator:
     Args:
         session (requests.Session): The session object to use for making API requests.
         url (str): The URL of the paginated API endpoint.
+        max_workers (int | None): The maximum number of pages to fetch concurrently. When
+            greater than 1, the first page is fetched to discover the total and the remaining
+            pages are fetched by a bounded pool of worker threads. Defaults to sequential fetching.
 
     Attributes
     ----------
@@ -43,14 +49,23 @@ class Paginator:
     """
 
     def __init__(
-        self, ctx: Context, path: str, params: dict | None = None, page_size: int | None = None
+        self,
+        ctx: Context,
+        path: str,
+        params: dict | None = None,
+        page_size: int | None = None,
+        *,
+        max_workers: int | None = None,
     ) -> None:
         if params is None:
             params = {}
+        if max_workers is not None and max_workers < 1:
+            raise ValueError("`max_workers=` must be greater than or equal to 1.")
         self._ctx = ctx
         self._path = path
         self._params = params
         self._page_size = page_size or _MAX_PAGE_SIZE
+        self._max_workers = max_workers or 1
 
     def fetch_results(self) -> List[dict]:
         """
@@ -69,12 +84,20 @@ class Paginator:
         """
         Fetches pages of results from the API.
 
+        Pages are always yielded in order, regardless of how many are fetched concurrently.
+
         Yields
         ------
             Page: A page of results from the API.
         """
-        count = 0
-        page_number = 1
+        if self._max_workers > 1:
+            yield from self._fetch_pages_concurrently()
+        else:
+            yield from self._fetch_pages_sequentially()
+
+    def _fetch_pages_sequentially(
+        self, page_number: int = 1, count: int = 0
+    ) -> Generator[Page, None, None]:
         while True:
             page = self.fetch_page(page_number)
             page_number += 1
@@ -92,6 +115,47 @@ class Paginator:
             if count >= page.total:
                 break
 
+    def _fetch_pages_concurrently(self) -> Generator[Page, None, None]:
+        page = self.fetch_page(1)
+        if len(page.results) == 0:
+            return
+        yield page
+
+        count = len(page.results)
+        if count >= page.total:
+            return
+
+        # The server may cap the requested page size, so derive the number of pages from the
+        # size of the first page rather than from the requested page size.
+        last_page_number = math.ceil(page.total / len(page.results))
+        page_number = 2
+        with ThreadPoolExecutor(max_workers=self._max_workers) as executor:
+            futures: deque[Future[Page]] = deque()
+            try:
+                while futures or page_number <= last_page_number:
+                    # Keep at most `max_workers` pages in flight so memory stays bounded when
+                    # the consumer is slower than the network.
+                    while page_number <= last_page_number and len(futures) < self._max_workers:
+                        futures.append(executor.submit(self.fetch_page, page_number))
+                        page_number += 1
+
+                    page = futures.popleft().result()
+                    if len(page.results) == 0:
+                        # stop if the result set is empty
+                        return
+                    yield page
+
+                    count += len(page.results)
+                    # The total may shrink or grow between pages; see `_fetch_pages_sequentially`.
+                    if count >= page.total:
+                        return
+            finally:
+                for future in futures:
+                    future.cancel()
+
+        # The total grew while the pages were being fetched, so continue until it is reached.
+        yield from self._fetch_pages_sequentially(page_number, count)
+
     def fetch_page(self, page_number: int) -> Page:
         """
         Fetches a specific page of data from the API.
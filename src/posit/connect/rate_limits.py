@@ -0,0 +1,68 @@
+"""Client-side rate limiting for requests sent to Connect."""
+
+from __future__ import annotations
+
+import math
+import threading
+import time
+
+
+class RateLimiter:
+    """Token bucket rate limiter.
+
+    The bucket holds up to ``burst`` tokens and is refilled at ``rate`` tokens per second. Each
+    request takes one token, waiting for the bucket to refill when it is empty. Waiting requests
+    are served in the order they arrived. A limiter is thread-safe and may be shared by several
+    clients to apply a single limit to all of them.
+
+    Parameters
+    ----------
+    rate : float
+        The sustained number of requests per second.
+    burst : int, optional
+        The maximum number of requests sent at once after the limiter has been idle, by default
+        the rate rounded up (at least 1)
+
+    Examples
+    --------
+    >>> from posit.connect import Client
+    >>> client = Client(rate_limit=10)
+
+    Allow bursts of 50 requests, and at most one write per second:
+
+    >>> from posit.connect.rate_limits import RateLimiter
+    >>> client = Client(rate_limit=RateLimiter(10, burst=50), write_rate_limit=1)
+    """
+
+    def __init__(self, rate: float, burst: int | None = None) -> None:
+        if rate <= 0:
+            raise ValueError("rate must be greater than 0")
+        if burst is None:
+            burst = max(1, math.ceil(rate))
+        if burst < 1:
+            raise ValueError("burst must be greater than or equal to 1")
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """
+        Take a token, waiting until one is available.
+
+        Returns
+        -------
+        float
+            The number of seconds spent waiting.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated_at) * self.rate)
+            self._updated_at = now
+            # Reserve the token now, so that concurrent callers queue up behind this one.
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+        if wait > 0:
+            time.sleep(wait)
+        return wait
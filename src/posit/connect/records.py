@@ -0,0 +1,81 @@
+"""Compact read-only records for bulk reads."""
+
+from __future__ import annotations
+
+import functools
+
+from typing_extensions import Any, ClassVar, Dict, Iterator, Mapping, Tuple
+
+
+class Record(Mapping[str, Any]):
+    """
+    A compact, read-only mapping of field names to values.
+
+    Records are an alternative to resources for reading large numbers of rows. Their values are
+    stored in a tuple, and their field names in a schema that is shared by every record with the
+    same fields, so a record has no per-instance dictionary and no reference to the client.
+
+    Records support the read-only mapping interface (``record["guid"]``, ``record.get(...)``,
+    ``record.keys()``, ``dict(record)``, and so on). Use `to_dict` to create a plain dictionary,
+    e.g. to create a resource from a record.
+
+    Examples
+    --------
+    >>> for event in client.metrics.usage.iter_records():
+    ...     print(event["content_guid"], event["started"])
+    """
+
+    __slots__ = ("_values",)
+
+    _fields: ClassVar[Tuple[str, ...]] = ()
+    _index: ClassVar[Dict[str, int]] = {}
+
+    def __init__(self, values: Tuple[Any, ...]) -> None:
+        self._values = values
+
+    def __getitem__(self, key: str) -> Any:
+        return self._values[self._index[key]]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._fields)
+
+    def __len__(self) -> int:
+        return len(self._fields)
+
+    def __repr__(self) -> str:
+        return f"Record({self.to_dict()!r})"
+
+    def __reduce__(self):
+        return (to_record, (self.to_dict(),))
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Return the record as a dictionary.
+
+        Returns
+        -------
+        Dict[str, Any]
+        """
+        return dict(zip(self._fields, self._values))
+
+
+@functools.lru_cache(maxsize=256)
+def _record_type(fields: Tuple[str, ...]) -> type[Record]:
+    """Return the record class for a schema, creating it on first use."""
+    index = {field: i for i, field in enumerate(fields)}
+    return type("Record", (Record,), {"__slots__": (), "_fields": fields, "_index": index})
+
+
+def to_record(result: Mapping[str, Any]) -> Record:
+    """
+    Convert a result from the API into a record.
+
+    Parameters
+    ----------
+    result : Mapping[str, Any]
+
+    Returns
+    -------
+    Record
+    """
+    return _record_type(tuple(result))(tuple(result.values()))
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+import copy
 import posixpath
 import re
+import time
 import warnings
 from abc import ABC
 
@@ -13,6 +15,7 @@ from typing_extensions import (
     Iterator,
     List,
     Protocol,
+    Self,
     Sequence,
     SupportsIndex,
     TypeVar,
@@ -21,6 +24,7 @@ from typing_extensions import (
 
 from .context import Context
 from .paginator import Paginator
+from .records import Record, to_record
 
 if TYPE_CHECKING:
     from .context import Context
@@ -111,30 +115,89 @@ class ResourceSequence(Protocol[T]):
 
     def __repr__(self) -> str: ...
 
+    def snapshot(self, *, max_age: float | None = None) -> Self:
+        """
+        Return a copy of the sequence that is fetched once and then reused.
+
+        By default, every index, length and iteration fetches the collection again. A snapshot
+        fetches the collection on first use and serves all of them from that result until it is
+        refreshed or becomes older than `max_age`.
+
+        Parameters
+        ----------
+        max_age : float, optional
+            The number of seconds after which the snapshot is fetched again, by default None
+            (never).
+
+        Returns
+        -------
+        Self
+
+        Examples
+        --------
+        >>> jobs = content.jobs.snapshot()
+        >>> for i in range(len(jobs)):
+        ...     print(jobs[i]["key"])
+        """
+        ...
+
+    def refresh(self) -> None:
+        """Fetch the collection again, replacing the current snapshot."""
+        ...
+
 
 class _ResourceSequence(Sequence[T], ResourceSequence[T]):
     def __init__(self, ctx: Context, path: str, *, uid: str = "guid"):
         self._ctx = ctx
         self._path = path
         self._uid = uid
+        self._snapshot = False
+        self._max_age: float | None = None
+        self._results: List[T] | None = None
+        self._fetched_at = 0.0
 
     def __getitem__(self, index):
-        return list(self.fetch())[index]
+        return self._materialize()[index]
 
     def __len__(self) -> int:
-        return len(list(self.fetch()))
+        return len(self._materialize())
 
     def __iter__(self) -> Iterator[T]:
+        if self._snapshot:
+            return iter(self._materialize())
         return iter(self.fetch())
 
     def __str__(self) -> str:
-        return str(self.fetch())
+        return str(self._materialize())
 
     def __repr__(self) -> str:
-        return repr(self.fetch())
+        return repr(self._materialize())
+
+    def snapshot(self, *, max_age: float | None = None) -> Self:
+        sequence = copy.copy(self)
+        sequence._snapshot = True
+        sequence._max_age = max_age
+        sequence._results = None
+        return sequence
+
+    def refresh(self) -> None:
+        self._results = list(self.fetch())
+        self._fetched_at = time.monotonic()
+
+    def _materialize(self) -> List[T]:
+        if not self._snapshot:
+            return list(self.fetch())
+        if self._results is None or (
+            self._max_age is not None and time.monotonic() - self._fetched_at >= self._max_age
+        ):
+            self.refresh()
+        assert self._results is not None
+        return self._results
 
     def create(self, **attributes: Any) -> Any:
         response = self._ctx.client.post(self._path, json=attributes)
+        # The collection has changed, so the snapshot (if any) is stale.
+        self._results = None
         result = response.json()
         uid = result[self._uid]
         path = posixpath.join(self._path, str(uid))
@@ -194,6 +257,23 @@ class _PaginatedResourceSequence(_ResourceSequence):
                 resources.append(resource)
             yield from resources
 
+    def fetch_records(self, **conditions) -> Iterator[Record]:
+        """
+        Fetch the collection as compact, read-only records instead of resources.
+
+        Parameters
+        ----------
+        **conditions : Any
+
+        Returns
+        -------
+        Iterator[Record]
+        """
+        paginator = Paginator(self._ctx, self._path, dict(**conditions), page_size=self._page_size)
+        for page in paginator.fetch_pages():
+            for result in page.results:
+                yield to_record(result)
+
 
 def _matches_exact(item: BaseResource, key: str, value: str):
     item_value = item.get(key)
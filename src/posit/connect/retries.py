@@ -0,0 +1,88 @@
+"""Automatic retries for transient server errors."""
+
+from __future__ import annotations
+
+import random
+
+from typing_extensions import Callable, Collection
+from urllib3.util import retry
+
+# Status codes returned by Connect, or a proxy in front of it, when it is temporarily unable to
+# handle a request.
+RETRY_STATUSES = frozenset({429, 502, 503, 504})
+
+
+class Retry(retry.Retry):
+    """Retry policy for requests sent to Connect.
+
+    Extends `urllib3.util.Retry` with defaults suitable for Connect. Only idempotent requests
+    (``GET``, ``HEAD``, ``PUT``, ``DELETE``, ``OPTIONS`` and ``TRACE``) are retried. Between
+    attempts, the policy sleeps for the duration in the ``Retry-After`` response header, when
+    present, and otherwise for a jittered exponential backoff. Once the retries are exhausted,
+    the last response is returned so the usual error handling applies.
+
+    Parameters
+    ----------
+    total : int, optional
+        The maximum number of retries, by default 3
+    status_forcelist : Collection[int], optional
+        The status codes to retry, by default 429, 502, 503 and 504
+    backoff_factor : float, optional
+        The base of the exponential backoff in seconds, by default 0.5
+    backoff_max : float, optional
+        The maximum backoff in seconds, by default 30
+    on_retry : Callable[[str | None, str | None], None], optional
+        Called with the method and url of each request that is retried, by default None
+    **kwargs
+        Additional keyword arguments passed to `urllib3.util.Retry`.
+
+    Examples
+    --------
+    >>> from posit.connect import Client
+    >>> from posit.connect.retries import Retry
+    >>> client = Client(retry=Retry(total=5, backoff_factor=1))
+
+    Disable retries:
+
+    >>> client = Client(retry=False)
+    """
+
+    def __init__(
+        self,
+        total: int = 3,
+        *,
+        status_forcelist: Collection[int] = RETRY_STATUSES,
+        backoff_factor: float = 0.5,
+        backoff_max: float = 30,
+        raise_on_status: bool = False,
+        on_retry: Callable[[str | None, str | None], None] | None = None,
+        **kwargs,
+    ) -> None:
+        super().__init__(
+            total=total,
+            status_forcelist=status_forcelist,
+            backoff_factor=backoff_factor,
+            raise_on_status=raise_on_status,
+            **kwargs,
+        )
+        # Assigned directly since older versions of urllib3 do not accept `backoff_max`.
+        self.backoff_max = backoff_max
+        self.on_retry = on_retry
+
+    def new(self, **kwargs) -> Retry:
+        retry = super().new(**kwargs)
+        retry.backoff_max = kwargs.get("backoff_max", self.backoff_max)
+        retry.on_retry = kwargs.get("on_retry", self.on_retry)
+        return retry
+
+    def increment(self, method=None, url=None, *args, **kwargs) -> Retry:
+        retry = super().increment(method, url, *args, **kwargs)
+        if self.on_retry is not None:
+            self.on_retry(method, url)
+        return retry
+
+    def get_backoff_time(self) -> float:
+        # Spread retries over the second half of the backoff window so that concurrent clients
+        # that failed together do not retry together.
+        backoff = min(self.backoff_max, super().get_backoff_time())
+        return backoff / 2 + random.uniform(0, backoff / 2)
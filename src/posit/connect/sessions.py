@@ -1,6 +1,80 @@
+from __future__ import annotations
+
+import threading
+from dataclasses import dataclass
 from urllib.parse import urljoin
 
 import requests
+from requests.adapters import HTTPAdapter
+from typing_extensions import Callable, Dict
+
+from .caches import ResponseCache, cache_key
+from .rate_limits import RateLimiter
+from .retries import Retry
+
+
+@dataclass
+class PoolStats:
+    """
+    Connection pool statistics for a single host.
+
+    Attributes
+    ----------
+        maxsize (int): The maximum number of connections kept open to the host.
+        in_use (int): The number of connections currently checked out of the pool.
+        idle (int): The number of open connections waiting in the pool for reuse.
+        connections (int): The number of connections opened since the pool was created.
+        requests (int): The number of requests sent since the pool was created.
+    """
+
+    maxsize: int
+    in_use: int
+    idle: int
+    connections: int
+    requests: int
+
+
+_READ_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+
+class _Flight:
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.response: requests.Response | None = None
+        self.error: BaseException | None = None
+
+
+class _SingleFlight:
+    """Collapse concurrent calls with the same key into a single call."""
+
+    def __init__(self) -> None:
+        self._flights: Dict[str, _Flight] = {}
+        self._lock = threading.Lock()
+
+    def do(self, key: str, fn: Callable[[], requests.Response]) -> requests.Response:
+        with self._lock:
+            flight = self._flights.get(key)
+            leader = flight is None
+            if flight is None:
+                flight = self._flights[key] = _Flight()
+
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            assert flight.response is not None
+            return flight.response
+
+        try:
+            flight.response = fn()
+            return flight.response
+        except BaseException as e:
+            flight.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._flights[key]
+            flight.done.set()
 
 
 class Session(requests.Session):
@@ -30,6 +104,28 @@ class Session(requests.Session):
             - If ``preserve_post=False``, the method is converted to GET and the
               request body is discarded.
 
+    Connections are pooled per host and kept alive between requests. The pool is sized by
+    ``pool_connections`` (the number of hosts to keep pools for) and ``pool_maxsize`` (the
+    number of connections to keep per host). When ``pool_block`` is True, requests wait for a
+    free connection instead of opening connections beyond ``pool_maxsize`` that are discarded
+    after use.
+
+    Idempotent requests that fail with a transient status (429, 502, 503 or 504) or a connection
+    error are retried according to ``retry``; see `posit.connect.retries.Retry`. Pass
+    ``retry=False`` to disable retries.
+
+    When ``cache`` is enabled, GET responses with an ``ETag`` or ``Last-Modified`` header are kept
+    in memory and revalidated with conditional requests, so unchanged responses are not downloaded
+    again; see `posit.connect.caches.ResponseCache`.
+
+    When ``single_flight`` is True, concurrent GET requests for the same URL and headers share a
+    single request to the server, and every caller receives the same response (or exception).
+
+    Requests are throttled to ``rate_limit`` requests per second, and writes (``POST``, ``PUT``,
+    ``PATCH`` and ``DELETE``) are additionally throttled to ``write_rate_limit``; see
+    `posit.connect.rate_limits.RateLimiter`. Each request sent to the server counts against the
+    limit, including redirects and retries.
+
     Examples
     --------
     Create a session and send a POST request while preserving POST data on redirects:
@@ -45,6 +141,141 @@ class Session(requests.Session):
     requests.Session : The base session class from the requests library.
     """
 
+    def __init__(
+        self,
+        *,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        pool_block: bool = False,
+        retry: Retry | bool = True,
+        cache: ResponseCache | bool = False,
+        single_flight: bool = False,
+        rate_limit: RateLimiter | float | None = None,
+        write_rate_limit: RateLimiter | float | None = None,
+    ) -> None:
+        super().__init__()
+        if rate_limit is not None and not isinstance(rate_limit, RateLimiter):
+            rate_limit = RateLimiter(rate_limit)
+        if write_rate_limit is not None and not isinstance(write_rate_limit, RateLimiter):
+            write_rate_limit = RateLimiter(write_rate_limit)
+        self.rate_limit = rate_limit
+        self.write_rate_limit = write_rate_limit
+        self._flights = _SingleFlight() if single_flight else None
+        if cache is True:
+            cache = ResponseCache()
+        self.cache = cache if isinstance(cache, ResponseCache) else None
+        self._retry_count = 0
+        self._retry_lock = threading.Lock()
+        if retry is True:
+            retry = Retry()
+        if isinstance(retry, Retry):
+            retry = retry.new(on_retry=self._on_retry(retry))
+        else:
+            retry = Retry(0)
+        adapter = HTTPAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            max_retries=retry,
+            pool_block=pool_block,
+        )
+        self.mount("https://", adapter)
+        self.mount("http://", adapter)
+
+    @property
+    def retry_count(self) -> int:
+        """The number of requests retried by this session."""
+        return self._retry_count
+
+    def _on_retry(self, retry: Retry):
+        callback = retry.on_retry
+
+        def on_retry(method: str | None, url: str | None) -> None:
+            with self._retry_lock:
+                self._retry_count += 1
+            # Retries are sent by urllib3 below `send`, so they are throttled here.
+            self._throttle(method)
+            if callback is not None:
+                callback(method, url)
+
+        return on_retry
+
+    def pool_stats(self) -> Dict[str, PoolStats]:
+        """
+        Return connection pool statistics for each host this session has connected to.
+
+        Returns
+        -------
+        Dict[str, PoolStats]
+            The statistics keyed by ``scheme://host:port``.
+
+        Examples
+        --------
+        >>> session.pool_stats()
+        {'https://connect.example.com:443': PoolStats(maxsize=10, in_use=0, idle=1, connections=1, requests=12)}
+        """
+        stats = {}
+        for adapter in set(self.adapters.values()):
+            if not isinstance(adapter, HTTPAdapter):
+                continue
+            pools = adapter.poolmanager.pools
+            # The pool container does not support iteration; `keys()` takes a thread-safe copy.
+            for key in pools.keys():  # noqa: SIM118
+                pool = pools.get(key)
+                if pool is None or pool.pool is None:
+                    continue
+                # The pool queue is pre-filled with `None` placeholders for connections that
+                # have not been opened yet.
+                idle = sum(1 for conn in list(pool.pool.queue) if conn is not None)
+                stats[f"{pool.scheme}://{pool.host}:{pool.port}"] = PoolStats(
+                    maxsize=pool.pool.maxsize,
+                    in_use=pool.pool.maxsize - pool.pool.qsize(),
+                    idle=idle,
+                    connections=pool.num_connections,
+                    requests=pool.num_requests,
+                )
+        return stats
+
+    def send(self, request, **kwargs):
+        self._throttle(request.method)
+        return super().send(request, **kwargs)
+
+    def _throttle(self, method: str | None) -> None:
+        if self.rate_limit is not None:
+            self.rate_limit.acquire()
+        if self.write_rate_limit is not None and method not in _READ_METHODS:
+            self.write_rate_limit.acquire()
+
+    def request(self, method, url, *args, **kwargs):
+        if method.upper() != "GET" or args or kwargs.get("stream"):
+            return super().request(method, url, *args, **kwargs)
+        if self.cache is None and self._flights is None:
+            return super().request(method, url, **kwargs)
+
+        request = requests.Request(
+            method, url, params=kwargs.get("params"), headers=kwargs.get("headers")
+        )
+        # Prepared by the session, so that the key includes its headers and credentials.
+        prepared = self.prepare_request(request)
+        key = cache_key(prepared.url or url, prepared.headers)
+        if self._flights is None:
+            return self._get(key, url, **kwargs)
+        return self._flights.do(key, lambda: self._get(key, url, **kwargs))
+
+    def _get(self, key: str, url, **kwargs) -> requests.Response:
+        if self.cache is None:
+            return super().request("GET", url, **kwargs)
+
+        headers = kwargs.pop("headers", None) or {}
+        response = super().request(
+            "GET", url, headers={**self.cache.validators(key), **headers}, **kwargs
+        )
+        response = self.cache.update(key, response)
+        if response.status_code == 304:
+            # The cached response expired or was evicted while the request was in flight.
+            response = super().request("GET", url, headers=headers, **kwargs)
+            response = self.cache.update(key, response)
+        return response
+
     def post(self, url, data=None, json=None, preserve_post=True, max_redirects=5, **kwargs):
         """
         Send a POST request and handle redirects manually.
@@ -2,12 +2,14 @@
 
 from __future__ import annotations
 
-from typing_extensions import overload
+from typing_extensions import Any, Mapping, overload
 
 from . import resources
 
 
-class Task(resources.BaseResource):
+class _TaskFields(Mapping[str, Any]):
+    """Field accessors shared by [](`Task`) and its asynchronous counterpart."""
+
     @property
     def is_finished(self) -> bool:
         """The task state.
@@ -47,6 +49,8 @@ class Task(resources.BaseResource):
         """
         return self.get("error") if self.is_finished else None
 
+
+class Task(resources.BaseResource, _TaskFields):
     # CRUD Methods
 
     @overload
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from typing_extensions import (
     TYPE_CHECKING,
+    Generator,
     List,
     Literal,
     NotRequired,
@@ -14,7 +15,9 @@ from typing_extensions import (
 
 from . import me
 from .content import Content
+from .frames import FrameExportMixin
 from .paginator import Paginator
+from .records import Record, to_record
 from .resources import BaseResource, Resources
 
 if TYPE_CHECKING:
@@ -144,6 +147,9 @@ class User(BaseResource):
         """
         Retrieve the groups to which the user belongs.
 
+        Answered from the client's group membership index, which lists the members of every
+        group once and is reused until it expires; see `Groups.memberships`.
+
         Returns
         -------
         UserGroups
@@ -271,10 +277,20 @@ class UserGroups(Resources):
         group_obj = self._ctx.client.groups.get(group)
         group_obj.members.delete(user_guid=self._user_guid)
 
-    def find(self) -> List[Group]:
+    def find(self, *, max_age: float = 0) -> List[Group]:
         """
         Retrieve the groups to which the user belongs.
 
+        Answered from the client's group membership index, which lists the members of every
+        group; see `Groups.memberships`. By default the index is rebuilt, so the result is
+        current. Pass `max_age` to reuse an index built up to that many seconds ago, e.g. when
+        finding the groups of many users, at the cost of missing changes made elsewhere since.
+
+        Parameters
+        ----------
+        max_age : float, optional
+            The maximum age in seconds of a membership index to reuse, by default 0
+
         Returns
         -------
         List[Group]
@@ -295,19 +311,14 @@ class UserGroups(Resources):
         --------
         * https://docs.posit.co/connect/api/#get-/v1/groups/-group_guid-/members
         """
-        self_groups: list[Group] = []
-        for group in self._ctx.client.groups.find():
-            group_users = group.members.find()
-            for group_user in group_users:
-                if group_user["guid"] == self._user_guid:
-                    self_groups.append(group)
-
-        return self_groups
+        return self._ctx.group_memberships.groups_for(self._user_guid, max_age=max_age)
 
 
-class Users(Resources):
+class Users(FrameExportMixin, Resources):
     """Users resource."""
 
+    _timestamps = ("created_time", "updated_time", "active_time")
+
     class CreateUser(TypedDict):
         """Create user request."""
 
@@ -392,12 +403,16 @@ class Users(Resources):
         user_role: NotRequired[Literal["administrator", "publisher", "viewer"] | str]
         account_status: NotRequired[Literal["locked", "licensed", "inactive"] | str]
 
-    def find(self, **conditions: Unpack[FindUser]) -> List[User]:
+    def find(
+        self, *, max_workers: int | None = None, **conditions: Unpack[FindUser]
+    ) -> List[User]:
         """
         Find users matching the specified conditions.
 
         Parameters
         ----------
+        max_workers : int, optional
+            The maximum number of pages to fetch concurrently. By default, pages are fetched one after another.
         prefix : str, not required
             Filter users by prefix (username, first name, or last name). The filter is case-insensitive.
         user_role : Literal["administrator", "publisher", "viewer"], not required
@@ -424,20 +439,84 @@ class Users(Resources):
 
         >>> users = client.find(account_status="locked|licensed")
 
+        Find all users, fetching up to 8 pages at a time:
+
+        >>> users = client.find(max_workers=8)
+
         See Also
         --------
         * https://docs.posit.co/connect/api/#get-/v1/users
         """
+        return list(self.iter_find(max_workers=max_workers, **conditions))
+
+    def iter_find(
+        self, *, max_workers: int | None = None, **conditions: Unpack[FindUser]
+    ) -> Generator[User, None, None]:
+        """
+        Lazily find users matching the specified conditions.
+
+        Useful when only the first few matching users are needed.
+
+        Parameters
+        ----------
+        max_workers : int, optional
+            The maximum number of pages to fetch concurrently. By default, pages are fetched one after another.
+        prefix : str, not required
+            Filter users by prefix (username, first name, or last name). The filter is case-insensitive.
+        user_role : Literal["administrator", "publisher", "viewer"], not required
+            Filter by user role. Options are `'administrator'`, `'publisher'`, `'viewer'`. Use `'|'` to represent logical OR (e.g., `'viewer|publisher'`).
+        account_status : Literal["locked", "licensed", "inactive"], not required
+            Filter by account status. Options are `'locked'`, `'licensed'`, `'inactive'`. Use `'|'` to represent logical OR. For example, `'locked|licensed'` includes users who are either locked or licensed.
+
+        Yields
+        ------
+        User
+            Each user matching the specified conditions.
+
+        Examples
+        --------
+        >>> for user in client.iter_find(account_status="licensed"):
+        ...     print(user["username"])
+
+        See Also
+        --------
+        * https://docs.posit.co/connect/api/#get-/v1/users
+        """
+        for result in self._iter_results(max_workers=max_workers, **conditions):
+            yield User(self._ctx, **result)
+
+    def iter_records(
+        self, *, max_workers: int | None = None, **conditions: Unpack[FindUser]
+    ) -> Generator[Record, None, None]:
+        """
+        Lazily find users matching the specified conditions, as compact records.
+
+        Accepts the same parameters as `iter_find`, but yields read-only records instead of
+        `User` resources, which use a fraction of the memory when reading many users.
+
+        Yields
+        ------
+        Record
+            Each user matching the specified conditions.
+
+        Examples
+        --------
+        >>> usernames = {user["guid"]: user["username"] for user in client.users.iter_records()}
+
+        See Also
+        --------
+        * https://docs.posit.co/connect/api/#get-/v1/users
+        """
+        for result in self._iter_results(max_workers=max_workers, **conditions):
+            yield to_record(result)
+
+    def _iter_results(
+        self, *, max_workers: int | None = None, **conditions
+    ) -> Generator[dict, None, None]:
         path = "v1/users"
-        paginator = Paginator(self._ctx, path, params={**conditions})
-        results = paginator.fetch_results()
-        return [
-            User(
-                self._ctx,
-                **user,
-            )
-            for user in results
-        ]
+        paginator = Paginator(self._ctx, path, params={**conditions}, max_workers=max_workers)
+        for page in paginator.fetch_pages():
+            yield from page.results
 
     def find_one(self, **conditions: Unpack[FindUser]) -> User | None:
         """
@@ -475,18 +554,7 @@ class Users(Resources):
         --------
         * https://docs.posit.co/connect/api/#get-/v1/users
         """
-        path = "v1/users"
-        paginator = Paginator(self._ctx, path, params={**conditions})
-        pages = paginator.fetch_pages()
-        results = (result for page in pages for result in page.results)
-        users = (
-            User(
-                self._ctx,
-                **result,
-            )
-            for result in results
-        )
-        return next(users, None)
+        return next(self.iter_find(**conditions), None)
 
     def get(self, uid: str) -> User:
         """
@@ -10,7 +10,11 @@ https://github.com/databricks/databricks-sdk-py#interface-stability
 
 from __future__ import annotations
 
-from typing_extensions import Optional
+import os
+import threading
+import time
+
+from typing_extensions import Dict, Optional
 
 try:
     from databricks.sdk.core import Config
@@ -24,6 +28,9 @@ except ImportError as e:
 
 POSIT_WORKBENCH_AUTH_TYPE = "posit-workbench"
 
+# The number of seconds a token is used before checking whether Workbench has refreshed it.
+_RELOAD_INTERVAL = 30.0
+
 
 class WorkbenchStrategy(CredentialsStrategy):
     """`CredentialsStrategy` implementation which uses a bearer token authentication provider for Workbench environments.
@@ -72,6 +79,12 @@ class WorkbenchStrategy(CredentialsStrategy):
 
     def __init__(self, config: Optional[Config] = None):
         self.__config = config
+        # Only a configuration created by this strategy is reloaded from the profile.
+        self.__reloadable = config is None
+        self._lock = threading.Lock()
+        self._header: Optional[Dict[str, str]] = None
+        self._checked_at = 0.0
+        self._mtime: Optional[int] = None
 
     def auth_type(self) -> str:
         return POSIT_WORKBENCH_AUTH_TYPE
@@ -97,4 +110,37 @@ class WorkbenchStrategy(CredentialsStrategy):
         if self._config.token is None:
             raise ValueError("Missing value for field 'token' in Config.")
 
-        return lambda: {"Authorization": f"Bearer {self._config.token}"}
+        return self._authorization_header
+
+    def _authorization_header(self) -> Dict[str, str]:
+        """Return the bearer header, reusing it until Workbench refreshes the token.
+
+        Workbench refreshes the token by rewriting the Databricks configuration file. The file is
+        checked at most every `_RELOAD_INTERVAL` seconds, and the "workbench" profile is read
+        again only when the file has changed. Concurrent callers share a single reload.
+        """
+        header = self._header
+        if header is not None and time.monotonic() - self._checked_at < _RELOAD_INTERVAL:
+            return header
+        with self._lock:
+            if self._header is not None and time.monotonic() - self._checked_at < _RELOAD_INTERVAL:
+                return self._header
+            self._reload()
+            token = self._config.token
+            if token is None:
+                raise ValueError("Missing value for field 'token' in Config.")
+            self._header = {"Authorization": f"Bearer {token}"}
+            self._checked_at = time.monotonic()
+            return self._header
+
+    def _reload(self) -> None:
+        if not self.__reloadable:
+            return
+        path = os.path.expanduser(self._config.config_file or "~/.databrickscfg")
+        try:
+            mtime = os.stat(path).st_mtime_ns
+        except OSError:
+            return
+        if self._mtime is not None and mtime != self._mtime:
+            self.__config = Config(profile="workbench")
+        self._mtime = mtime
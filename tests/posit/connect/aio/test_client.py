@@ -0,0 +1,237 @@
+import asyncio
+
+import pytest
+
+from posit.connect.errors import ClientError
+
+from ..api import load_mock
+
+httpx = pytest.importorskip("httpx")
+
+from posit.connect.aio import AsyncClient  # noqa: E402
+from posit.connect.aio.groups import AsyncGroup, AsyncGroupMembers  # noqa: E402
+from posit.connect.aio.metrics import AsyncUsageEvent  # noqa: E402
+from posit.connect.aio.tasks import AsyncTask  # noqa: E402
+from posit.connect.aio.users import AsyncUser  # noqa: E402
+
+
+def _client(handler) -> AsyncClient:
+    return AsyncClient(
+        "https://connect.example",
+        "12345",
+        transport=httpx.MockTransport(handler),
+    )
+
+
+class TestAsyncClient:
+    def test_request(self):
+        def handler(request):
+            assert request.headers["Authorization"] == "Key 12345"
+            assert str(request.url) == "https://connect.example/__api__/v1/users/guid"
+            return httpx.Response(200, json={"guid": "guid"})
+
+        async def main():
+            async with _client(handler) as client:
+                return await client.users.get("guid")
+
+        user = asyncio.run(main())
+        assert isinstance(user, AsyncUser)
+        assert user == {"guid": "guid"}
+        assert user.content.owner_guid == "guid"
+
+    def test_client_error(self):
+        def handler(request):
+            return httpx.Response(404, json={"code": 4, "error": "not found", "payload": None})
+
+        async def main():
+            async with _client(handler) as client:
+                await client.content.get("guid")
+
+        with pytest.raises(ClientError) as e:
+            asyncio.run(main())
+        assert e.value.http_status == 404
+
+    def test_http_error(self):
+        def handler(request):
+            return httpx.Response(502, text="bad gateway")
+
+        async def main():
+            async with _client(handler) as client:
+                await client.content.get("guid")
+
+        with pytest.raises(httpx.HTTPStatusError):
+            asyncio.run(main())
+
+
+class TestAsyncUsers:
+    def test_iter_find(self):
+        def handler(request):
+            page_number = request.url.params["page_number"]
+            assert request.url.params["page_size"] == "500"
+            return httpx.Response(
+                200, json=load_mock(f"v1/users?page_number={page_number}&page_size=500.jsonc")
+            )
+
+        async def main():
+            async with _client(handler) as client:
+                return [user["username"] async for user in client.users.iter_find()]
+
+        assert asyncio.run(main()) == ["al", "robert", "carlos12"]
+
+    def test_find_one(self):
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            return httpx.Response(
+                200, json=load_mock("v1/users?page_number=1&page_size=500.jsonc")
+            )
+
+        async def main():
+            async with _client(handler) as client:
+                return await client.users.find_one(prefix="a")
+
+        user = asyncio.run(main())
+        assert user is not None
+        assert user["username"] == "al"
+        assert len(requests) == 1
+        assert requests[0].url.params["prefix"] == "a"
+
+    def test_concurrent_get(self):
+        def handler(request):
+            return httpx.Response(200, json={"guid": request.url.path.rsplit("/", 1)[-1]})
+
+        async def main():
+            async with _client(handler) as client:
+                return await asyncio.gather(*(client.users.get(str(i)) for i in range(50)))
+
+        assert [user["guid"] for user in asyncio.run(main())] == [str(i) for i in range(50)]
+
+
+class TestAsyncContent:
+    def test_count(self):
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            return httpx.Response(200, json=[{"guid": "a"}, {"guid": "b"}])
+
+        async def main():
+            async with _client(handler) as client:
+                return await client.content.count()
+
+        assert asyncio.run(main()) == 2
+        assert len(requests) == 1
+        assert not requests[0].url.params
+
+    def test_count_streams_the_list(self):
+        chunks = [b'[{"guid": "a"}, {"gu', b'id": "b"},', b' {"guid": "c"}]']
+
+        class Body(httpx.AsyncByteStream):
+            async def __aiter__(self):
+                for chunk in chunks:
+                    yield chunk
+
+        def handler(request):
+            return httpx.Response(200, stream=Body())
+
+        async def main():
+            async with _client(handler) as client:
+                return await client.content.count()
+
+        assert asyncio.run(main()) == 3
+
+    def test_count_error(self):
+        def handler(request):
+            return httpx.Response(403, json={"code": 3, "error": "forbidden", "payload": None})
+
+        async def main():
+            async with _client(handler) as client:
+                return await client.content.count()
+
+        with pytest.raises(ClientError) as e:
+            asyncio.run(main())
+        assert e.value.http_status == 403
+
+
+class TestAsyncGroups:
+    def test_get(self):
+        def handler(request):
+            return httpx.Response(200, json={"guid": "group", "name": "friends"})
+
+        async def main():
+            async with _client(handler) as client:
+                return await client.groups.get("group")
+
+        group = asyncio.run(main())
+        assert isinstance(group, AsyncGroup)
+        assert isinstance(group.members, AsyncGroupMembers)
+
+
+class TestAsyncTasks:
+    def test_get(self):
+        def handler(request):
+            return httpx.Response(200, json={"id": "task", "finished": True, "code": 1})
+
+        async def main():
+            async with _client(handler) as client:
+                return await client.tasks.get("task")
+
+        task = asyncio.run(main())
+        assert isinstance(task, AsyncTask)
+        assert task.is_finished
+        assert task.error_code == 1
+
+
+class TestAsyncUsage:
+    def test_find(self):
+        def handler(request):
+            kind = "content/visits" if "visits" in request.url.path else "shiny/usage"
+            name = f"v1/instrumentation/{kind}?limit=500"
+            if "next" in request.url.params:
+                name += f"&next={request.url.params['next']}"
+            return httpx.Response(200, json=load_mock(f"{name}.json"))
+
+        async def main():
+            async with _client(handler) as client:
+                return await client.metrics.usage.find()
+
+        events = asyncio.run(main())
+        assert len(events) == 2
+        assert all(isinstance(event, AsyncUsageEvent) for event in events)
+        assert events[0].content_guid == "bd1d2285-6c80-49af-8a83-a200effe3cb3"
+
+    def test_find_merges_by_start_time(self):
+        def handler(request):
+            if "visits" in request.url.path:
+                results = [{"time": "2024-01-01T00:00:00Z"}, {"time": "2024-01-01T02:00:00Z"}]
+            else:
+                results = [{"started": "2024-01-01T01:00:00Z"}]
+            return httpx.Response(
+                200, json={"paging": {"cursors": {"next": None}}, "results": results}
+            )
+
+        async def main():
+            async with _client(handler) as client:
+                return await client.metrics.usage.find()
+
+        events = asyncio.run(main())
+        assert [event.started for event in events] == [
+            "2024-01-01T00:00:00Z",
+            "2024-01-01T01:00:00Z",
+            "2024-01-01T02:00:00Z",
+        ]
+
+
+class TestAsyncOAuth:
+    def test_get_credentials(self):
+        def handler(request):
+            assert request.method == "POST"
+            assert b"subject_token=cit" in request.content
+            return httpx.Response(200, json={"access_token": "token"})
+
+        async def main():
+            async with _client(handler) as client:
+                return await client.oauth.get_credentials("cit")
+
+        assert asyncio.run(main()) == {"access_token": "token"}
@@ -0,0 +1,32 @@
+from contextlib import ExitStack
+from unittest.mock import patch
+
+import pytest
+
+
+class FakeClock:
+    """A clock which only moves when `now` is changed or `sleep` is called."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(request):
+    """
+    Patch the `time` functions named by the `CLOCK` list of the test module with a `FakeClock`.
+
+    Each target is the dotted path of a function, e.g. ``"posit.connect.rate_limits.time.sleep"``,
+    and is replaced by the `FakeClock` method of the same name.
+    """
+    clock = FakeClock()
+    with ExitStack() as stack:
+        for target in request.module.CLOCK:
+            stack.enter_context(patch(target, getattr(clock, target.rsplit(".", 1)[1])))
+        yield clock
@@ -1,4 +1,8 @@
+import base64
+import json
+import time
 from datetime import datetime
+from unittest.mock import patch
 
 import pytest
 import responses
@@ -6,6 +10,7 @@ import responses
 from posit.connect import Client
 from posit.connect.external.aws import (
     Credentials,
+    PositCredentialsProvider,
     _decode_access_token,
     get_content_credentials,
     get_credentials,
@@ -129,3 +134,125 @@ class TestAWS:
     def test_decode_access_token(self):
         decoded_creds = _decode_access_token(encoded_aws_creds)
         assert decoded_creds == aws_creds
+
+
+def _encode(access_key_id, expiration):
+    credentials = {
+        "accessKeyId": access_key_id,
+        "secretAccessKey": "def456",
+        "sessionToken": "ghi789",
+        "expiration": expiration,
+    }
+    return base64.b64encode(json.dumps(credentials).encode()).decode()
+
+
+def _register(*tokens):
+    return [
+        responses.post(
+            "https://connect.example/__api__/v1/oauth/integrations/credentials",
+            json={"access_token": token, "expires_in": 3600},
+        )
+        for token in tokens
+    ]
+
+
+def _monotonic(value):
+    return patch("posit.connect.oauth.cache.time.monotonic", return_value=value)
+
+
+class TestPositCredentialsProvider:
+    @pytest.fixture
+    def client(self):
+        c = Client(api_key="12345", url="https://connect.example/")
+        c._ctx.version = None
+        return c
+
+    @responses.activate
+    def test_reuses_credentials(self, client):
+        _register(encoded_aws_creds)
+        provider = PositCredentialsProvider(client, user_session_token="cit")
+        with _monotonic(1000):
+            assert provider.get() == aws_creds
+            assert provider.get() == aws_creds
+        assert len(responses.calls) == 1
+
+    @responses.activate
+    def test_refreshes_in_background(self, client):
+        _register(encoded_aws_creds, _encode("new", "2025-01-01T01:00:00Z"))
+        provider = PositCredentialsProvider(client, content_session_token="cit")
+        with _monotonic(1000):
+            assert provider.get() == aws_creds
+        with _monotonic(3000):
+            # past half their lifetime, the current credentials are returned while new ones
+            # are exchanged
+            assert provider.get() == aws_creds
+            for _ in range(100):
+                if provider.get()["aws_access_key_id"] == "new":
+                    break
+                time.sleep(0.01)
+            assert provider.get()["aws_access_key_id"] == "new"
+        assert len(responses.calls) == 2
+
+    @responses.activate
+    def test_exchanges_expired_credentials(self, client):
+        _register(encoded_aws_creds, _encode("new", "2025-01-01T01:00:00Z"))
+        provider = PositCredentialsProvider(client, user_session_token="cit")
+        with _monotonic(1000):
+            provider.get()
+        with _monotonic(1000 + 3600):
+            assert provider.get()["aws_access_key_id"] == "new"
+
+    @responses.activate
+    def test_caches_credentials_without_expires_in(self, client):
+        # without `expires_in`, the expiration of the AWS credentials is used
+        mock_post = responses.post(
+            "https://connect.example/__api__/v1/oauth/integrations/credentials",
+            json={"access_token": _encode("abc123", "2100-01-01T00:00:00Z")},
+        )
+        provider = PositCredentialsProvider(client, user_session_token="cit")
+        assert provider.get()["aws_access_key_id"] == "abc123"
+        assert provider.get()["aws_access_key_id"] == "abc123"
+        assert mock_post.call_count == 1
+
+    @responses.activate
+    def test_does_not_cache_expired_credentials_without_expires_in(self, client):
+        mock_post = responses.post(
+            "https://connect.example/__api__/v1/oauth/integrations/credentials",
+            json={"access_token": encoded_aws_creds},
+        )
+        provider = PositCredentialsProvider(client, user_session_token="cit")
+        provider.get()
+        provider.get()
+        assert mock_post.call_count == 2
+
+    def test_no_content_session_token(self, client, monkeypatch):
+        monkeypatch.delenv("CONNECT_CONTENT_SESSION_TOKEN", raising=False)
+        monkeypatch.delenv("CONNECT_CONTENT_SESSION_TOKEN_FILE", raising=False)
+        provider = PositCredentialsProvider(client)
+        with pytest.raises(ValueError, match="No content session token"):
+            provider.get()
+
+    @responses.activate
+    def test_botocore_credentials(self, client):
+        pytest.importorskip("botocore")
+        _register(_encode("abc123", "2100-01-01T00:00:00Z"))
+        credentials = PositCredentialsProvider(client, user_session_token="cit").credentials()
+        frozen = credentials.get_frozen_credentials()
+        assert (frozen.access_key, frozen.secret_key, frozen.token) == (
+            "abc123",
+            "def456",
+            "ghi789",
+        )
+
+    @responses.activate
+    def test_credential_provider(self, client):
+        botocore_session = pytest.importorskip("botocore.session")
+        _register(_encode("abc123", "2100-01-01T00:00:00Z"))
+        session = botocore_session.Session()
+        resolver = session.get_component("credential_provider")
+        provider = PositCredentialsProvider(client, user_session_token="cit")
+        resolver.insert_before("env", provider.credential_provider())
+        credentials = session.get_credentials()
+        assert credentials is not None
+        assert credentials.method == "posit-connect"
+        assert credentials.get_frozen_credentials().access_key == "abc123"
@@ -1,9 +1,10 @@
-from unittest.mock import patch
+from unittest.mock import Mock, patch
 
 import pytest
 import responses
 
 from posit.connect import Client
+from posit.connect.external import snowflake
 from posit.connect.external.snowflake import PositAuthenticator
 
 
@@ -76,6 +77,46 @@ class TestPositAuthenticator:
         assert auth.authenticator == "oauth"
         assert auth.token == "service-account-access-token"
 
+    @responses.activate
+    @patch.dict(
+        "os.environ",
+        {"RSTUDIO_PRODUCT": "CONNECT", "CONNECT_CONTENT_SESSION_TOKEN": "content-token-123"},
+    )
+    def test_posit_authenticator_empty_content_token(self):
+        # an empty content session token falls back to the one in the environment
+        register_mocks()
+
+        client = Client(api_key="12345", url="https://connect.example/")
+        client._ctx.version = None
+        auth = PositAuthenticator(
+            local_authenticator="SNOWFLAKE",
+            content_session_token="",
+            client=client,
+        )
+        assert auth.token == "service-account-access-token"
+
+    @responses.activate
+    @patch.dict("os.environ", {"RSTUDIO_PRODUCT": "CONNECT"})
+    def test_posit_authenticator_caches_token(self):
+        mock_post = responses.post(
+            "https://connect.example/__api__/v1/oauth/integrations/credentials",
+            json={"access_token": "dynamic-viewer-access-token", "expires_in": 3600},
+        )
+
+        client = Client(api_key="12345", url="https://connect.example/")
+        client._ctx.version = None
+        for _ in range(3):
+            auth = PositAuthenticator(user_session_token="cit", client=client)
+            assert auth.token == "dynamic-viewer-access-token"
+        assert mock_post.call_count == 1
+
+    def test_shared_client(self, monkeypatch):
+        client_class = Mock()
+        monkeypatch.setattr(snowflake, "_client", None)
+        monkeypatch.setattr(snowflake, "Client", client_class)
+        assert snowflake._shared_client() is snowflake._shared_client()
+        client_class.assert_called_once_with()
+
     def test_posit_authenticator_fallback(self):
         # local_authenticator is used when the content is running locally
         client = Client(api_key="12345", url="https://connect.example/")
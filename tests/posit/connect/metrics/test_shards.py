@@ -0,0 +1,131 @@
+import pytest
+import responses
+from responses import matchers
+
+from posit import connect
+from posit.connect.metrics import shiny_usage, visits
+from posit.connect.metrics.shards import split_window
+
+URL = "https://connect.example/__api__/v1/instrumentation/content/visits"
+SHINY_URL = "https://connect.example/__api__/v1/instrumentation/shiny/usage"
+
+
+def _page(results, next_page=None):
+    return {"paging": {"cursors": {"next": next_page}}, "results": results}
+
+
+def _visit(time, path="/"):
+    return {"content_guid": "abc", "user_guid": "def", "time": time, "path": path}
+
+
+class TestSplitWindow:
+    def test(self):
+        assert split_window("2024-01-01T00:00:00Z", "2024-01-01T03:00:00Z", 3) == [
+            ("2024-01-01T00:00:00Z", "2024-01-01T01:00:00+00:00"),
+            ("2024-01-01T01:00:00+00:00", "2024-01-01T02:00:00+00:00"),
+            ("2024-01-01T02:00:00+00:00", "2024-01-01T03:00:00Z"),
+        ]
+
+    def test_empty_window(self):
+        assert split_window("2024-01-01T00:00:00Z", "2024-01-01T00:00:00Z", 3) == [
+            ("2024-01-01T00:00:00Z", "2024-01-01T00:00:00Z")
+        ]
+
+    def test_invalid(self):
+        with pytest.raises(ValueError):
+            split_window("2024-01-01T00:00:00Z", "2024-01-02T00:00:00Z", 0)
+
+
+class TestShardedFind:
+    @responses.activate
+    def test_merges_windows_in_order(self):
+        boundary = "2024-01-01T01:00:00+00:00"
+        responses.get(
+            URL,
+            json=_page([_visit("2024-01-01T00:10:00Z")], next_page="2"),
+            match=[
+                matchers.query_param_matcher(
+                    {"from": "2024-01-01T00:00:00Z", "to": boundary, "limit": 500}
+                )
+            ],
+        )
+        responses.get(
+            URL,
+            json=_page([_visit("2024-01-01T00:00:00-01:00"), _visit(boundary, path="/b")]),
+            match=[
+                matchers.query_param_matcher(
+                    {"from": "2024-01-01T00:00:00Z", "to": boundary, "next": "2", "limit": 500}
+                )
+            ],
+        )
+        responses.get(
+            URL,
+            # the second window repeats the events at its start
+            json=_page(
+                [
+                    _visit(boundary),
+                    _visit(boundary, path="/b"),
+                    _visit(boundary, path="/b"),
+                    _visit("2024-01-01T01:30:00Z"),
+                ]
+            ),
+            match=[
+                matchers.query_param_matcher(
+                    {"from": boundary, "to": "2024-01-01T02:00:00Z", "limit": 500}
+                )
+            ],
+        )
+
+        c = connect.Client("https://connect.example", "12345")
+        events = visits.Visits(c._ctx).find(
+            start="2024-01-01T00:00:00Z", end="2024-01-01T02:00:00Z", shards=2
+        )
+        # events at the boundary are kept from the window which starts there
+        assert [(event["time"], event["path"]) for event in events] == [
+            ("2024-01-01T00:10:00Z", "/"),
+            (boundary, "/"),
+            (boundary, "/b"),
+            (boundary, "/b"),
+            ("2024-01-01T01:30:00Z", "/"),
+        ]
+
+    @responses.activate
+    def test_shiny_session_spanning_windows(self):
+        boundary = "2024-01-01T01:00:00+00:00"
+        earlier = {"started": "2023-12-31T23:50:00Z", "ended": "2024-01-01T00:10:00Z"}
+        spanning = {"started": "2024-01-01T00:50:00Z", "ended": "2024-01-01T01:10:00Z"}
+        later = {"started": "2024-01-01T01:20:00Z", "ended": None}
+        responses.get(
+            SHINY_URL,
+            json=_page([earlier, spanning]),
+            match=[
+                matchers.query_param_matcher(
+                    {"from": "2024-01-01T00:00:00Z", "to": boundary, "limit": 500}
+                )
+            ],
+        )
+        responses.get(
+            SHINY_URL,
+            # sessions are selected by overlap, so the spanning session is returned again
+            json=_page([spanning, later]),
+            match=[
+                matchers.query_param_matcher(
+                    {"from": boundary, "to": "2024-01-01T02:00:00Z", "limit": 500}
+                )
+            ],
+        )
+
+        c = connect.Client("https://connect.example", "12345")
+        events = shiny_usage.ShinyUsage(c._ctx).find(
+            start="2024-01-01T00:00:00Z", end="2024-01-01T02:00:00Z", shards=2
+        )
+        assert [event["started"] for event in events] == [
+            earlier["started"],
+            spanning["started"],
+            later["started"],
+        ]
+
+    def test_requires_window(self):
+        c = connect.Client("https://connect.example", "12345")
+        with pytest.raises(ValueError):
+            visits.Visits(c._ctx).find(start="2024-01-01T00:00:00Z", shards=2)
@@ -0,0 +1,121 @@
+import time
+
+import pytest
+from typing_extensions import Optional
+
+from posit.connect.metrics.store import MetricsStore, Rollup
+
+
+def _shiny(started: str, ended: str, content_guid: str = "abc", user_guid: Optional[str] = "u1"):
+    return {
+        "content_guid": content_guid,
+        "user_guid": user_guid,
+        "started": started,
+        "ended": ended,
+        "data_version": 1,
+    }
+
+
+@pytest.fixture
+def store():
+    with MetricsStore() as store:
+        yield store
+
+
+class TestMetricsStore:
+    def test_daily_rollup(self, store):
+        added = store.add(
+            [
+                _shiny("2024-01-01T10:00:00Z", "2024-01-01T10:01:00Z"),
+                _shiny("2024-01-01T11:00:00Z", "2024-01-01T11:00:30Z"),
+                _shiny("2024-01-01T12:00:00Z", "2024-01-01T12:00:10Z", user_guid="u2"),
+                # the UTC day of the start time is 2024-01-02
+                _shiny("2024-01-01T23:00:00-05:00", "2024-01-02T04:00:05Z", user_guid=None),
+                _shiny("2024-01-01T09:00:00Z", "2024-01-01T09:00:01Z", content_guid="def"),
+            ],
+            source="shiny_usage",
+        )
+        assert added == 5
+        assert store.rollup(source="shiny_usage") == [
+            Rollup("shiny_usage", "2024-01-01", "abc", 3, 2, 100.0),
+            Rollup("shiny_usage", "2024-01-01", "def", 1, 1, 1.0),
+            Rollup("shiny_usage", "2024-01-02", "abc", 1, 0, 5.0),
+        ]
+        assert store.rollup(source="shiny_usage", content_guid="abc", start="2024-01-02") == [
+            Rollup("shiny_usage", "2024-01-02", "abc", 1, 0, 5.0),
+        ]
+
+    def test_weekly_distinct_users(self, store):
+        visits = [
+            {"content_guid": "abc", "user_guid": user, "time": time}
+            for user, time in [
+                ("u1", "2024-01-01T00:00:00Z"),  # Monday
+                ("u1", "2024-01-03T00:00:00Z"),
+                ("u2", "2024-01-07T00:00:00Z"),  # Sunday
+                ("u1", "2024-01-08T00:00:00Z"),  # next Monday
+            ]
+        ]
+        store.add(visits, source="visits")
+        assert store.rollup("week") == [
+            Rollup("visits", "2024-01-01", "abc", 3, 2, 0.0),
+            Rollup("visits", "2024-01-08", "abc", 1, 1, 0.0),
+        ]
+        assert store.rollup("month") == [Rollup("visits", "2024-01-01", "abc", 4, 2, 0.0)]
+
+    def test_hits_are_added_once(self, store):
+        hits = [
+            {
+                "id": 1,
+                "content_guid": "abc",
+                "user_guid": "u1",
+                "timestamp": "2025-05-01T10:00:00Z",
+            },
+            {
+                "id": 2,
+                "content_guid": "abc",
+                "user_guid": "u2",
+                "timestamp": "2025-05-01T11:00:00Z",
+            },
+        ]
+        assert store.add(hits, source="hits") == 2
+        assert store.add(hits, source="hits") == 0
+        assert store.rollup(source="hits") == [Rollup("hits", "2025-05-01", "abc", 2, 2, 0.0)]
+
+    @pytest.mark.skipif(not hasattr(time, "tzset"), reason="requires time.tzset")
+    def test_timestamps_without_offset_are_utc(self, store, monkeypatch):
+        monkeypatch.setenv("TZ", "Pacific/Honolulu")
+        time.tzset()
+        try:
+            store.add([_shiny("2024-01-01T23:30:00", "2024-01-01T23:31:00")], source="shiny_usage")
+        finally:
+            monkeypatch.undo()
+            time.tzset()
+        assert store.rollup(source="shiny_usage") == [
+            Rollup("shiny_usage", "2024-01-01", "abc", 1, 1, 60.0)
+        ]
+
+    def test_truncate_rebuilds_rollups(self, store):
+        store.append(
+            "visits", [{"content_guid": "abc", "user_guid": "u1", "time": "2024-01-01T00:00:00Z"}]
+        )
+        size = store.size("visits")
+        store.append(
+            "visits", [{"content_guid": "abc", "user_guid": "u2", "time": "2024-01-01T01:00:00Z"}]
+        )
+        store.truncate("visits", size)
+        assert store.size("visits") == size
+        assert len(list(store.read("visits"))) == 1
+        assert store.rollup() == [Rollup("visits", "2024-01-01", "abc", 1, 1, 0.0)]
+
+    def test_invalid(self, store):
+        with pytest.raises(ValueError):
+            store.add([], source="unknown")
+        with pytest.raises(ValueError):
+            store.rollup("year")  # pyright: ignore[reportArgumentType]
+
+    def test_persists(self, tmp_path):
+        path = tmp_path / "metrics.db"
+        with MetricsStore(path) as store:
+            store.add([{"content_guid": "abc", "time": "2024-01-01T00:00:00Z"}], source="visits")
+        with MetricsStore(path) as store:
+            assert store.rollup() == [Rollup("visits", "2024-01-01", "abc", 1, 0, 0.0)]
@@ -0,0 +1,186 @@
+import json
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+import requests
+import responses
+
+from posit import connect
+from posit.connect.metrics.store import MetricsStore
+from posit.connect.metrics.sync import JsonLinesStore, MetricsSync
+from posit.connect.metrics.timestamps import parse_instant
+
+URL = "https://connect.example/__api__/v1/instrumentation"
+
+
+class FakeInstrumentation:
+    """Serves events in pages of two, filtered by `from`, from a list that can grow."""
+
+    def __init__(self, rsps):
+        self.events = {"content/visits": [], "shiny/usage": []}
+        self.fail_at = None
+        self.requests = 0
+        self.params = {}
+        for path in self.events:
+            rsps.add_callback(responses.GET, f"{URL}/{path}", callback=self.callback(path))
+
+    def callback(self, path):
+        field = "time" if path == "content/visits" else "started"
+
+        def handle(request):
+            self.requests += 1
+            if self.fail_at is not None and self.requests >= self.fail_at:
+                return (500, {}, "")
+            params = {k: v[0] for k, v in parse_qs(urlsplit(request.url).query).items()}
+            self.params = params
+            events = self.events[path]
+            if "from" in params:
+                start = parse_instant(params["from"])
+                # Shiny sessions are selected by overlap: open sessions and sessions that
+                # ended after `from` are included.
+                events = [
+                    e
+                    for e in events
+                    if parse_instant(e[field]) >= start
+                    or (
+                        field == "started"
+                        and (not e["ended"] or parse_instant(e["ended"]) >= start)
+                    )
+                ]
+            offset = int(params.get("next", 0))
+            page = events[offset : offset + 2]
+            next_page = str(offset + 2) if offset + 2 < len(events) else None
+            body = {"paging": {"cursors": {"next": next_page}}, "results": page}
+            return (200, {}, json.dumps(body))
+
+        return handle
+
+
+def _visit(minute, path="/"):
+    return {"content_guid": "abc", "time": f"2024-01-01T00:{minute:02d}:00Z", "path": path}
+
+
+def _session(started, ended):
+    return {
+        "content_guid": "abc",
+        "started": f"2024-01-01T00:{started:02d}:00Z",
+        "ended": None if ended is None else f"2024-01-01T00:{ended:02d}:00Z",
+    }
+
+
+@pytest.fixture
+def server():
+    with responses.RequestsMock(assert_all_requests_are_fired=False) as rsps:
+        yield FakeInstrumentation(rsps)
+
+
+@pytest.fixture
+def client():
+    return connect.Client("https://connect.example", "12345")
+
+
+class TestMetricsSync:
+    def test_incremental(self, server, client, tmp_path):
+        server.events["content/visits"] = [_visit(1), _visit(2), _visit(3, "/a")]
+        assert client.metrics.sync(tmp_path) == {"visits": 3, "shiny_usage": 0}
+
+        # a later event, and a distinct event at the watermark
+        server.events["content/visits"] += [_visit(3, "/b"), _visit(4)]
+        assert client.metrics.sync(tmp_path) == {"visits": 2, "shiny_usage": 0}
+        assert client.metrics.sync(tmp_path) == {"visits": 0, "shiny_usage": 0}
+
+        store = JsonLinesStore(tmp_path)
+        assert list(store.read("visits")) == server.events["content/visits"]
+        assert MetricsSync(client._ctx, tmp_path).state()["visits"]["watermark"] == (
+            "2024-01-01T00:04:00Z"
+        )
+
+    def test_resumes_after_failure(self, server, client, tmp_path):
+        server.events["content/visits"] = [_visit(minute) for minute in range(1, 6)]
+        server.fail_at = 2
+        sync = MetricsSync(client._ctx, tmp_path, sources=["visits"])
+        with pytest.raises(requests.HTTPError):
+            sync.run()
+        assert sync.state()["visits"]["next"] == "2"
+
+        # simulate a crash after appending a page but before saving the state
+        sync.store.append("visits", [_visit(3)])
+
+        server.fail_at = None
+        assert sync.run() == {"visits": 3}
+        assert list(sync.store.read("visits")) == server.events["content/visits"]
+
+    def test_shiny_sessions_spanning_the_watermark(self, server, client, tmp_path):
+        closed = _session(1, 5)
+        open_session = _session(2, None)
+        spanning = _session(3, 10)
+        server.events["shiny/usage"] = [closed, open_session, spanning]
+        sync = MetricsSync(client._ctx, tmp_path, sources=["shiny_usage"])
+        assert sync.run() == {"shiny_usage": 2}
+
+        # the open session ends, and a new session starts
+        open_session["ended"] = "2024-01-01T00:20:00Z"
+        server.events["shiny/usage"].append(_session(15, 16))
+        assert sync.run() == {"shiny_usage": 2}
+        assert sync.run() == {"shiny_usage": 0}
+
+        stored = list(sync.store.read("shiny_usage"))
+        assert sorted(event["started"] for event in stored) == [
+            "2024-01-01T00:01:00Z",
+            "2024-01-01T00:02:00Z",
+            "2024-01-01T00:03:00Z",
+            "2024-01-01T00:15:00Z",
+        ]
+        assert all(event["ended"] for event in stored)
+
+    def test_metrics_store(self, server, client, tmp_path):
+        server.events["content/visits"] = [_visit(1), _visit(2), _visit(2, "/a")]
+        with MetricsStore(tmp_path / "metrics.db") as store:
+            assert client.metrics.sync(tmp_path, store=store) == {"visits": 3, "shiny_usage": 0}
+            server.events["content/visits"] += [_visit(3)]
+            assert client.metrics.sync(tmp_path, store=store) == {"visits": 1, "shiny_usage": 0}
+            assert [rollup.events for rollup in store.rollup()] == [4]
+
+    def test_metrics_store_overlapping_sessions(self, server, client, tmp_path):
+        open_session = _session(2, None)
+        server.events["shiny/usage"] = [_session(1, 5), open_session, _session(3, 10)]
+        with MetricsStore() as store:
+            sync = MetricsSync(client._ctx, tmp_path, store=store, sources=["shiny_usage"])
+            sync.run()
+            open_session["ended"] = "2024-01-01T00:20:00Z"
+            sync.run()
+            rollups = store.rollup(source="shiny_usage")
+            assert [(rollup.events, rollup.duration) for rollup in rollups] == [(3, 1740.0)]
+
+            # re-syncing the same overlapping sessions leaves the rollups unchanged
+            sync.run()
+            assert store.rollup(source="shiny_usage") == rollups
+
+    def test_timestamps_with_and_without_offset(self, server, client, tmp_path):
+        server.events["content/visits"] = [_visit(1)]
+        client.metrics.sync(tmp_path, sources=["visits"])
+
+        # timestamps without an offset are UTC
+        server.events["content/visits"] += [
+            {**_visit(1, "/b"), "time": "2024-01-01T00:01:00"},
+            {**_visit(2), "time": "2024-01-01T00:02:00"},
+        ]
+        assert client.metrics.sync(tmp_path, sources=["visits"]) == {"visits": 2}
+        assert client.metrics.sync(tmp_path, sources=["visits"]) == {"visits": 0}
+
+    def test_min_data_version_is_kept(self, server, client, tmp_path):
+        sync = MetricsSync(client._ctx, tmp_path, sources=["visits"])
+        sync.run(min_data_version=2)
+        assert sync.state()["visits"]["min_data_version"] == 2
+
+        MetricsSync(client._ctx, tmp_path, sources=["visits"]).run()
+        assert server.params["min_data_version"] == "2"
+
+    def test_sources(self, server, client, tmp_path):
+        server.events["content/visits"] = [_visit(1)]
+        assert client.metrics.sync(tmp_path, sources=["visits"]) == {"visits": 1}
+        assert server.requests == 1
+
+    def test_unknown_source(self, client, tmp_path):
+        with pytest.raises(ValueError):
+            MetricsSync(client._ctx, tmp_path, sources=["hits"])
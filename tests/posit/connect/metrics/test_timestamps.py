@@ -0,0 +1,55 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from posit.connect.metrics.timestamps import EventTimes, parse_timestamp, parse_timestamps
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        ("2018-09-15T18:00:00-05:00", datetime(2018, 9, 15, 23, tzinfo=timezone.utc)),
+        ("2018-09-15T18:00:00Z", datetime(2018, 9, 15, 18, tzinfo=timezone.utc)),
+        ("2018-09-15T18:00:00.500+01:30", datetime(2018, 9, 15, 16, 30, 0, 500000, timezone.utc)),
+        ("2018-09-15T18:00:00.5Z", datetime(2018, 9, 15, 18, 0, 0, 500000, timezone.utc)),
+        ("2018-09-15T18:00:00.12345Z", datetime(2018, 9, 15, 18, 0, 0, 123450, timezone.utc)),
+        ("2018-09-15T18:00:00.123456789Z", datetime(2018, 9, 15, 18, 0, 0, 123456, timezone.utc)),
+    ],
+)
+def test_parse_timestamp(value, expected):
+    assert parse_timestamp(value) == expected
+
+
+def test_parse_timestamp_is_cached():
+    assert parse_timestamp("2018-09-15T18:00:00Z") is parse_timestamp("2018-09-15T18:00:00Z")
+
+
+def test_parse_timestamps():
+    np = pytest.importorskip("numpy")
+    values = [
+        "2018-09-15T18:00:00-05:00",
+        "2018-09-15T18:00:00Z",
+        "2018-09-15T18:00:00.500+01:30",
+        "2018-09-15T18:00:00",
+        None,
+    ]
+    result = parse_timestamps(values)
+    assert result.dtype == np.dtype("datetime64[us]")
+    assert result[:4].tolist() == [
+        datetime(2018, 9, 15, 23),
+        datetime(2018, 9, 15, 18),
+        datetime(2018, 9, 15, 16, 30, 0, 500000),
+        datetime(2018, 9, 15, 18),
+    ]
+    assert np.isnat(result[4])
+
+
+def test_durations():
+    np = pytest.importorskip("numpy")
+    times = EventTimes(
+        parse_timestamps(["2018-09-15T18:00:00-05:00", "2018-09-15T18:00:00Z"]),
+        parse_timestamps(["2018-09-15T18:01:30-05:00", None]),
+    )
+    assert len(times) == 2
+    assert times.durations[0].item() == timedelta(seconds=90)
+    assert np.isnat(times.durations[1])
@@ -1,3 +1,5 @@
+import json
+import threading
 from unittest import mock
 
 import pytest
@@ -6,6 +8,7 @@ from responses import matchers
 
 from posit import connect
 from posit.connect.metrics import shiny_usage, usage, visits
+from posit.connect.records import Record
 
 from ..api import load_mock, load_mock_dict
 
@@ -165,6 +168,225 @@ class TestUsageFind:
         assert mock_get[3].call_count == 1
         assert len(events) == 2
 
+    @responses.activate
+    def test_iter_find(self):
+        # behavior
+        mock_get = [
+            responses.get(
+                "https://connect.example/__api__/v1/instrumentation/content/visits",
+                json=load_mock("v1/instrumentation/content/visits?limit=500.json"),
+                match=[matchers.query_param_matcher({"limit": 500})],
+            ),
+            responses.get(
+                "https://connect.example/__api__/v1/instrumentation/content/visits",
+                json=load_mock(
+                    "v1/instrumentation/content/visits?limit=500&next=23948901087.json"
+                ),
+                match=[matchers.query_param_matcher({"next": "23948901087", "limit": 500})],
+            ),
+            responses.get(
+                "https://connect.example/__api__/v1/instrumentation/shiny/usage",
+                json=load_mock("v1/instrumentation/shiny/usage?limit=500.json"),
+                match=[matchers.query_param_matcher({"limit": 500})],
+            ),
+            responses.get(
+                "https://connect.example/__api__/v1/instrumentation/shiny/usage",
+                json=load_mock("v1/instrumentation/shiny/usage?limit=500&next=23948901087.json"),
+                match=[matchers.query_param_matcher({"next": "23948901087", "limit": 500})],
+            ),
+        ]
+
+        # setup
+        c = connect.Client("https://connect.example", "12345")
+
+        # invoke
+        events = c.metrics.usage.iter_find()
+        first = next(events)
+
+        # assert both sources are fetched concurrently, and visits come first on a tie
+        assert isinstance(first, usage.UsageEvent)
+        assert first["path"] == "/logs"
+        assert mock_get[0].call_count == 1
+        assert mock_get[2].call_count == 1
+
+        assert len([first, *events]) == 2
+        assert mock_get[1].call_count == 1
+        assert mock_get[2].call_count == 1
+        assert mock_get[3].call_count == 1
+
+    @responses.activate
+    def test_find_merges_by_start_time(self):
+        # behavior
+        def page(results):
+            return {"paging": {"cursors": {"next": None}}, "results": results}
+
+        responses.get(
+            "https://connect.example/__api__/v1/instrumentation/content/visits",
+            json=page(
+                [
+                    {"time": "2024-01-01T00:00:00Z", "path": "/a"},
+                    # a timestamp without an offset is UTC
+                    {"time": "2024-01-01T02:30:00", "path": "/b"},
+                    {"time": "2024-01-01T03:00:00Z", "path": "/c"},
+                ]
+            ),
+        )
+        responses.get(
+            "https://connect.example/__api__/v1/instrumentation/shiny/usage",
+            json=page(
+                [
+                    {"started": "2024-01-01T01:00:00+02:00", "ended": "2024-01-01T01:30:00Z"},
+                    {"started": "2024-01-01T02:00:00Z", "ended": "2024-01-01T02:30:00Z"},
+                ]
+            ),
+        )
+
+        # setup
+        c = connect.Client("https://connect.example", "12345")
+
+        # invoke
+        events = c.metrics.usage.find()
+
+        # assert
+        assert [event["started"] for event in events] == [
+            "2024-01-01T01:00:00+02:00",
+            "2024-01-01T00:00:00Z",
+            "2024-01-01T02:00:00Z",
+            "2024-01-01T02:30:00",
+            "2024-01-01T03:00:00Z",
+        ]
+
+    @responses.activate
+    def test_iter_find_fetches_sources_concurrently(self):
+        # behavior
+        def page(results):
+            return json.dumps({"paging": {"cursors": {"next": None}}, "results": results})
+
+        shiny_requested = threading.Event()
+        waited = []
+
+        def visits_callback(request):
+            # the first visits page is only returned once shiny usage was requested too
+            waited.append(shiny_requested.wait(timeout=5))
+            return (200, {}, page([{"time": "2024-01-01T00:00:00Z"}]))
+
+        def shiny_callback(request):
+            shiny_requested.set()
+            return (200, {}, page([{"started": "2024-01-01T01:00:00Z"}]))
+
+        responses.add_callback(
+            responses.GET,
+            "https://connect.example/__api__/v1/instrumentation/content/visits",
+            callback=visits_callback,
+        )
+        responses.add_callback(
+            responses.GET,
+            "https://connect.example/__api__/v1/instrumentation/shiny/usage",
+            callback=shiny_callback,
+        )
+
+        # setup
+        c = connect.Client("https://connect.example", "12345")
+
+        # invoke
+        events = list(c.metrics.usage.iter_find(prefetch=1))
+
+        # assert
+        assert waited == [True]
+        assert [event["started"] for event in events] == [
+            "2024-01-01T00:00:00Z",
+            "2024-01-01T01:00:00Z",
+        ]
+
+    @responses.activate
+    def test_iter_find_without_prefetch_uses_no_threads(self):
+        # behavior
+        for path in ("content/visits", "shiny/usage"):
+            responses.get(
+                f"https://connect.example/__api__/v1/instrumentation/{path}",
+                json={"paging": {"cursors": {"next": None}}, "results": []},
+            )
+
+        # setup
+        c = connect.Client("https://connect.example", "12345")
+
+        # invoke
+        with mock.patch.object(threading.Thread, "start") as start:
+            assert list(c.metrics.usage.iter_find()) == []
+
+        # assert
+        start.assert_not_called()
+
+    @responses.activate
+    def test_iter_find_propagates_errors(self):
+        # behavior
+        responses.get(
+            "https://connect.example/__api__/v1/instrumentation/shiny/usage",
+            json=load_mock("v1/instrumentation/shiny/usage?limit=500&next=23948901087.json"),
+        )
+
+        # setup
+        c = connect.Client("https://connect.example", "12345")
+        patch = mock.patch.object(visits.Visits, "_iter_results", side_effect=RuntimeError)
+
+        # invoke
+        with patch, pytest.raises(RuntimeError):
+            list(c.metrics.usage.iter_find())
+
+    @responses.activate
+    def test_iter_records(self):
+        # behavior
+        for path in ("content/visits", "shiny/usage"):
+            responses.get(
+                f"https://connect.example/__api__/v1/instrumentation/{path}",
+                json=load_mock(f"v1/instrumentation/{path}?limit=500.json"),
+                match=[matchers.query_param_matcher({"limit": 500})],
+            )
+            responses.get(
+                f"https://connect.example/__api__/v1/instrumentation/{path}",
+                json=load_mock(f"v1/instrumentation/{path}?limit=500&next=23948901087.json"),
+                match=[matchers.query_param_matcher({"next": "23948901087", "limit": 500})],
+            )
+
+        # setup
+        c = connect.Client("https://connect.example", "12345")
+
+        # invoke
+        records = list(c.metrics.usage.iter_records())
+        events = c.metrics.usage.find()
+
+        # assert records hold the same fields as the events
+        assert all(isinstance(record, Record) for record in records)
+        assert [record.to_dict() for record in records] == [dict(event) for event in events]
+
+    @responses.activate
+    def test_find_times(self):
+        np = pytest.importorskip("numpy")
+
+        # behavior
+        for path in ("content/visits", "shiny/usage"):
+            responses.get(
+                f"https://connect.example/__api__/v1/instrumentation/{path}",
+                json=load_mock(f"v1/instrumentation/{path}?limit=500.json"),
+                match=[matchers.query_param_matcher({"limit": 500})],
+            )
+            responses.get(
+                f"https://connect.example/__api__/v1/instrumentation/{path}",
+                json=load_mock(f"v1/instrumentation/{path}?limit=500&next=23948901087.json"),
+                match=[matchers.query_param_matcher({"next": "23948901087", "limit": 500})],
+            )
+
+        # setup
+        c = connect.Client("https://connect.example", "12345")
+
+        # invoke
+        times = c.metrics.usage.find_times()
+
+        # assert
+        assert len(times) == 2
+        assert times.started[0] == np.datetime64("2018-09-15T23:00:00")
+        assert list(times.durations) == [np.timedelta64(0, "s"), np.timedelta64(60, "s")]
+
 
 class TestUsageFindOne:
     @responses.activate
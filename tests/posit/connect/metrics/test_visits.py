@@ -89,6 +89,35 @@ class TestVisitsFind:
         assert mock_get[1].call_count == 1
         assert len(events) == 1
 
+    @responses.activate
+    def test_prefetch(self):
+        # behavior
+        mock_get = [
+            responses.get(
+                "https://connect.example/__api__/v1/instrumentation/content/visits",
+                json=load_mock("v1/instrumentation/content/visits?limit=500.json"),
+                match=[matchers.query_param_matcher({"limit": 500})],
+            ),
+            responses.get(
+                "https://connect.example/__api__/v1/instrumentation/content/visits",
+                json=load_mock(
+                    "v1/instrumentation/content/visits?limit=500&next=23948901087.json"
+                ),
+                match=[matchers.query_param_matcher({"next": "23948901087", "limit": 500})],
+            ),
+        ]
+
+        # setup
+        c = connect.Client("https://connect.example", "12345")
+
+        # invoke
+        events = visits.Visits(c._ctx).find(prefetch=2)
+
+        # assert
+        assert mock_get[0].call_count == 1
+        assert mock_get[1].call_count == 1
+        assert len(events) == 1
+
 
 class TestVisitsFindOne:
     @responses.activate
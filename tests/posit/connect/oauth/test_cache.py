@@ -0,0 +1,212 @@
+import threading
+import time
+from unittest.mock import Mock
+
+import pytest
+import responses
+
+from posit.connect import Client
+from posit.connect.oauth.cache import CredentialsCache, cache_key
+
+CLOCK = ["posit.connect.oauth.cache.time.monotonic"]
+KEY = cache_key("urn:posit:connect:user-session-token", "cit")
+
+
+class TestCacheKey:
+    def test_hashes_subject_token(self):
+        key = cache_key("type", "secret", "requested", "audience")
+        assert "secret" not in key
+        assert key == cache_key("type", "secret", "requested", "audience")
+        assert key != cache_key("type", "other", "requested", "audience")
+        assert key != cache_key("type", "secret", None, "audience")
+
+
+class TestCredentialsCache:
+    def test_invalid_options(self):
+        with pytest.raises(ValueError):
+            CredentialsCache(maxsize=0)
+        with pytest.raises(ValueError):
+            CredentialsCache(skew=-1)
+
+    def test_serves_until_skew(self, clock):
+        cache = CredentialsCache(skew=60)
+        exchange = Mock(return_value={"access_token": "a", "expires_in": 3600})
+        assert cache.get_or_exchange(KEY, exchange) == {"access_token": "a", "expires_in": 3600}
+
+        clock.now += 1000
+        assert cache.get_or_exchange(KEY, exchange) == {"access_token": "a", "expires_in": 2600}
+        assert exchange.call_count == 1
+
+        clock.now += 2541
+        cache.get_or_exchange(KEY, exchange)
+        assert exchange.call_count == 2
+
+    def test_without_expiry_is_not_cached(self, clock):
+        cache = CredentialsCache()
+        exchange = Mock(return_value={"access_token": "a"})
+        cache.get_or_exchange(KEY, exchange)
+        cache.get_or_exchange(KEY, exchange)
+        assert exchange.call_count == 2
+        assert len(cache) == 0
+
+    def test_lifetime_without_expiry(self, clock):
+        cache = CredentialsCache()
+        cache.set_lifetime("requested", lambda credentials: 3600)
+        key = cache_key("type", "cit", "requested")
+        exchange = Mock(return_value={"access_token": "a"})
+        cache.get_or_exchange(key, exchange)
+        clock.now += 1000
+        assert cache.get_or_exchange(key, exchange) == {"access_token": "a", "expires_in": 2600}
+        assert exchange.call_count == 1
+        # the lifetime only applies to its requested token type
+        cache.get_or_exchange(KEY, exchange)
+        cache.get_or_exchange(KEY, exchange)
+        assert exchange.call_count == 3
+
+    def test_lru_eviction(self, clock):
+        cache = CredentialsCache(maxsize=2)
+        keys = [cache_key("type", token) for token in ("a", "b", "c")]
+        cache.put(keys[0], {"access_token": "a", "expires_in": 3600})
+        cache.put(keys[1], {"access_token": "b", "expires_in": 3600})
+        assert cache.get(keys[0]) is not None
+        cache.put(keys[2], {"access_token": "c", "expires_in": 3600})
+        assert cache.get(keys[1]) is None
+        assert cache.get(keys[0]) is not None
+        assert len(cache) == 2
+
+    def test_clear(self, clock):
+        cache = CredentialsCache()
+        cache.put(KEY, {"access_token": "a", "expires_in": 3600})
+        cache.clear()
+        assert cache.get(KEY) is None
+
+    def test_refresh_ahead(self, clock):
+        cache = CredentialsCache()
+        exchange = Mock(
+            side_effect=[
+                {"access_token": "a", "expires_in": 3600},
+                {"access_token": "b", "expires_in": 3600},
+            ]
+        )
+        assert cache.get_or_exchange(KEY, exchange, refresh_ahead=True).get("access_token") == "a"
+        clock.now += 1000
+        assert cache.get_or_exchange(KEY, exchange, refresh_ahead=True).get("access_token") == "a"
+        assert exchange.call_count == 1
+
+        # past half the lifetime, the cached credentials are served while they are refreshed
+        clock.now += 1000
+        assert cache.get_or_exchange(KEY, exchange, refresh_ahead=True).get("access_token") == "a"
+        for _ in range(100):
+            cached = cache.get(KEY)
+            if cached is not None and cached.get("access_token") == "b":
+                break
+            time.sleep(0.01)
+        assert cache.get(KEY) == {"access_token": "b", "expires_in": 3600}
+        assert exchange.call_count == 2
+
+    def test_concurrent_exchanges_collapse(self):
+        cache = CredentialsCache()
+        started = threading.Event()
+
+        def exchange():
+            started.set()
+            time.sleep(0.05)
+            return {"access_token": "a", "expires_in": 3600}
+
+        spy = Mock(side_effect=exchange)
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(cache.get_or_exchange(KEY, spy)))
+            for _ in range(5)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert spy.call_count == 1
+        assert [result["access_token"] for result in results] == ["a"] * 5
+
+    def test_lock_kept_for_waiters(self):
+        cache = CredentialsCache()
+        released = [threading.Event(), threading.Event(), threading.Event()]
+        released[2].set()
+        calls = []
+
+        def exchange():
+            calls.append(None)
+            released[len(calls) - 1].wait(5)
+            # Credentials without an expiry are not cached, so every waiter exchanges.
+            return {"access_token": "a"}
+
+        def get():
+            cache.get_or_exchange(KEY, Mock(side_effect=exchange))
+
+        def wait_for(condition):
+            for _ in range(500):
+                if condition():
+                    return
+                time.sleep(0.01)
+            raise AssertionError("timed out")
+
+        first, second, third = (threading.Thread(target=get) for _ in range(3))
+        first.start()
+        wait_for(lambda: len(calls) == 1)
+        second.start()
+        # give the second thread time to wait on the lock of the first
+        time.sleep(0.05)
+        released[0].set()
+        first.join()
+        wait_for(lambda: len(calls) == 2)
+
+        # the second exchange still holds the lock, so the third waits for it
+        third.start()
+        time.sleep(0.05)
+        assert len(calls) == 2
+        released[1].set()
+        second.join()
+        third.join()
+        assert len(calls) == 3
+        assert cache._exchanges == {}
+
+
+class TestOAuthCredentialsCache:
+    @responses.activate
+    def test_get_credentials_is_cached(self):
+        mock_post = responses.post(
+            "https://connect.example/__api__/v1/oauth/integrations/credentials",
+            json={"access_token": "viewer-token", "token_type": "Bearer", "expires_in": 3600},
+        )
+        c = Client(api_key="12345", url="https://connect.example/")
+        c._ctx.version = None
+        assert c.oauth.get_credentials("cit").get("access_token") == "viewer-token"
+        assert c.oauth.get_credentials("cit").get("access_token") == "viewer-token"
+        assert mock_post.call_count == 1
+
+        # a different subject token, token type or audience is a separate exchange
+        c.oauth.get_credentials("other")
+        c.oauth.get_credentials("cit", requested_token_type="urn:posit:connect:api-key")
+        c.oauth.get_content_credentials("cit")
+        assert mock_post.call_count == 4
+
+        c.oauth.credentials_cache.clear()
+        c.oauth.get_credentials("cit")
+        assert mock_post.call_count == 5
+
+    @responses.activate
+    def test_get_content_credentials_refresh_ahead(self, clock):
+        mock_post = responses.post(
+            "https://connect.example/__api__/v1/oauth/integrations/credentials",
+            json={"access_token": "service-token", "token_type": "Bearer", "expires_in": 3600},
+        )
+        c = Client(api_key="12345", url="https://connect.example/")
+        c._ctx.version = None
+        c.oauth.get_content_credentials("cit", refresh_ahead=True)
+        clock.now += 2000
+        credentials = c.oauth.get_content_credentials("cit", refresh_ahead=True)
+        assert credentials is not None
+        assert credentials.get("access_token") == "service-token"
+        for _ in range(100):
+            if mock_post.call_count == 2:
+                break
+            time.sleep(0.01)
+        assert mock_post.call_count == 2
@@ -1,4 +1,5 @@
 import logging
+import os
 from unittest.mock import patch
 
 import responses
@@ -44,6 +45,33 @@ class TestGetContentSessionToken:
         ):
             assert _get_content_session_token() == "env-token"
 
+    def test_token_file_is_read_once(self, tmp_path):
+        token_file = tmp_path / "token"
+        token_file.write_text("file-token")
+        with patch.dict("os.environ", {"CONNECT_CONTENT_SESSION_TOKEN_FILE": str(token_file)}):
+            with patch("builtins.open", wraps=open) as mock_open:
+                assert _get_content_session_token() == "file-token"
+                assert _get_content_session_token() == "file-token"
+            assert mock_open.call_count == 1
+
+    def test_token_file_rotation(self, tmp_path):
+        token_file = tmp_path / "token"
+        token_file.write_text("file-token")
+        with patch.dict("os.environ", {"CONNECT_CONTENT_SESSION_TOKEN_FILE": str(token_file)}):
+            assert _get_content_session_token() == "file-token"
+
+            # rotated by replacing the file
+            rotated = tmp_path / "rotated"
+            rotated.write_text("rotated-token")
+            os.replace(rotated, token_file)
+            assert _get_content_session_token() == "rotated-token"
+
+            # rewritten in place
+            stat = token_file.stat()
+            token_file.write_text("written-token")
+            os.utime(token_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+            assert _get_content_session_token() == "written-token"
+
     def test_token_file_empty(self, tmp_path, caplog):
         token_file = tmp_path / "token"
         token_file.write_text("")
@@ -0,0 +1,176 @@
+from unittest.mock import patch
+
+import pytest
+import requests
+import responses
+from responses import matchers
+
+from posit.connect.caches import ResponseCache, cache_key
+from posit.connect.client import Client
+
+URL = "https://connect.example.com/__api__/v1/content/f2f37341"
+
+
+def _key(client, url):
+    prepared = client.session.prepare_request(requests.Request("GET", url))
+    return cache_key(url, prepared.headers)
+
+
+def _not_modified(etag='"abc"'):
+    return responses.get(
+        URL,
+        status=304,
+        match=[matchers.header_matcher({"If-None-Match": etag})],
+    )
+
+
+class TestResponseCache:
+    def test_invalid_options(self):
+        with pytest.raises(ValueError):
+            ResponseCache(maxsize=0)
+        with pytest.raises(ValueError):
+            ResponseCache(ttl=0)
+
+    @responses.activate
+    def test_serves_not_modified_from_cache(self):
+        responses.get(URL, json={"guid": "f2f37341"}, headers={"ETag": '"abc"'})
+        client = Client("https://connect.example.com", "12345", cache=True)
+        assert client.get("v1/content/f2f37341").json() == {"guid": "f2f37341"}
+
+        responses.reset()
+        not_modified = _not_modified()
+        response = client.get("v1/content/f2f37341")
+        assert not_modified.call_count == 1
+        assert response.status_code == 200
+        assert response.reason == "OK"
+        assert response.json() == {"guid": "f2f37341"}
+        assert response.headers["ETag"] == '"abc"'
+        assert response.url == URL
+        assert client.session.cache is not None
+        assert client.session.cache.hits == 1
+        assert client.session.cache.misses == 1
+
+    @responses.activate
+    def test_last_modified(self):
+        last_modified = "Wed, 21 Oct 2015 07:28:00 GMT"
+        responses.get(URL, json={}, headers={"Last-Modified": last_modified})
+        client = Client("https://connect.example.com", "12345", cache=True)
+        client.get("v1/content/f2f37341")
+
+        responses.reset()
+        not_modified = responses.get(
+            URL,
+            status=304,
+            match=[matchers.header_matcher({"If-Modified-Since": last_modified})],
+        )
+        assert client.get("v1/content/f2f37341").json() == {}
+        assert not_modified.call_count == 1
+
+    @responses.activate
+    def test_replaces_modified_response(self):
+        responses.get(URL, json={"title": "old"}, headers={"ETag": '"1"'})
+        client = Client("https://connect.example.com", "12345", cache=True)
+        client.get("v1/content/f2f37341")
+
+        responses.reset()
+        responses.get(URL, json={"title": "new"}, headers={"ETag": '"2"'})
+        assert client.get("v1/content/f2f37341").json() == {"title": "new"}
+
+        responses.reset()
+        _not_modified('"2"')
+        assert client.get("v1/content/f2f37341").json() == {"title": "new"}
+
+    @responses.activate
+    def test_keyed_by_params(self):
+        one = responses.get(
+            URL, json=1, headers={"ETag": '"1"'}, match=[matchers.query_param_matcher({"n": "1"})]
+        )
+        two = responses.get(
+            URL, json=2, headers={"ETag": '"2"'}, match=[matchers.query_param_matcher({"n": "2"})]
+        )
+        client = Client("https://connect.example.com", "12345", cache=True)
+        assert client.get("v1/content/f2f37341", params={"n": 1}).json() == 1
+        assert client.get("v1/content/f2f37341", params={"n": 2}).json() == 2
+        assert "If-None-Match" not in two.calls[0].request.headers
+        assert "If-None-Match" not in one.calls[0].request.headers
+
+    @responses.activate
+    def test_keyed_by_headers(self):
+        csv = responses.get(
+            URL,
+            body="guid",
+            headers={"ETag": '"csv"'},
+            match=[matchers.header_matcher({"Accept": "text/csv"})],
+        )
+        responses.get(URL, json={"guid": "f2f37341"}, headers={"ETag": '"json"'})
+        client = Client("https://connect.example.com", "12345", cache=True)
+        client.get("v1/content/f2f37341")
+        response = client.get("v1/content/f2f37341", headers={"Accept": "text/csv"})
+        assert response.text == "guid"
+        assert "If-None-Match" not in csv.calls[0].request.headers
+
+    def test_key_ignores_validators(self):
+        headers = {"Accept": "application/json", "Authorization": "Key 12345"}
+        key = cache_key(URL, headers)
+        assert "12345" not in key
+        assert key == cache_key(URL, {**headers, "If-None-Match": '"abc"'})
+        assert key != cache_key(URL, {**headers, "Authorization": "Key 67890"})
+
+    @responses.activate
+    def test_skips_vary_star(self):
+        responses.get(URL, json={}, headers={"ETag": '"abc"', "Vary": "*"})
+        client = Client("https://connect.example.com", "12345", cache=True)
+        client.get("v1/content/f2f37341")
+        assert client.session.cache is not None
+        assert len(client.session.cache) == 0
+
+    @responses.activate
+    def test_skips_responses_without_validators(self):
+        mock = responses.get(URL, json={})
+        client = Client("https://connect.example.com", "12345", cache=True)
+        client.get("v1/content/f2f37341")
+        client.get("v1/content/f2f37341")
+        assert "If-None-Match" not in mock.calls[1].request.headers
+        assert client.session.cache is not None
+        assert len(client.session.cache) == 0
+
+    @responses.activate
+    def test_skips_other_methods(self):
+        responses.get(URL, json={}, headers={"ETag": '"abc"'})
+        mock = responses.patch(URL, json={})
+        client = Client("https://connect.example.com", "12345", cache=True)
+        client.get("v1/content/f2f37341")
+        client.patch("v1/content/f2f37341", json={})
+        assert "If-None-Match" not in mock.calls[0].request.headers
+
+    @responses.activate
+    def test_evicts_least_recently_used(self):
+        for n in range(3):
+            responses.get(f"{URL}/{n}", json=n, headers={"ETag": f'"{n}"'})
+        cache = ResponseCache(maxsize=2)
+        client = Client("https://connect.example.com", "12345", cache=cache)
+        client.get("v1/content/f2f37341/0")
+        client.get("v1/content/f2f37341/1")
+        client.get("v1/content/f2f37341/0")
+        client.get("v1/content/f2f37341/2")
+        assert len(cache) == 2
+        assert cache.validators(_key(client, f"{URL}/0")) == {"If-None-Match": '"0"'}
+        assert cache.validators(_key(client, f"{URL}/1")) == {}
+
+    @responses.activate
+    def test_expires_after_ttl(self):
+        responses.get(URL, json={}, headers={"ETag": '"abc"'})
+        cache = ResponseCache(ttl=60)
+        client = Client("https://connect.example.com", "12345", cache=cache)
+        with patch("posit.connect.caches.time.monotonic", return_value=0):
+            client.get("v1/content/f2f37341")
+        with patch("posit.connect.caches.time.monotonic", return_value=59):
+            assert cache.validators(_key(client, URL)) == {"If-None-Match": '"abc"'}
+        with patch("posit.connect.caches.time.monotonic", return_value=60):
+            assert cache.validators(_key(client, URL)) == {}
+        assert len(cache) == 0
+
+    @responses.activate
+    def test_disabled_by_default(self):
+        client = Client("https://connect.example.com", "12345")
+        assert client.session.cache is None
@@ -6,6 +6,7 @@ import responses
 from requests.exceptions import HTTPError
 
 from posit.connect import Client
+from posit.connect.caches import ResponseCache
 
 from .api import load_mock
 
@@ -70,6 +71,18 @@ class TestClientInit:
         Client(api_key=api_key, url=url)
         MockConfig.assert_called_once_with(api_key=api_key, url=url)
 
+    def test_pool_options(
+        self,
+        MockAuth: MagicMock,
+        MockConfig: MagicMock,
+        MockSession: MagicMock,
+    ):
+        url = "https://connect.example.com"
+        api_key = "12345"
+        Client(url, api_key, pool_maxsize=32, pool_block=True)
+        MockConfig.assert_called_once_with(api_key=api_key, url=url)
+        MockSession.assert_called_once_with(pool_maxsize=32, pool_block=True)
+
 
 class TestClient:
     def test_init(
@@ -142,6 +155,40 @@ class TestClient:
         assert visitor_client.cfg.url == "https://connect.example.com/__api__"
         assert visitor_client.cfg.api_key == "api-key"
 
+    @responses.activate
+    @patch.dict(
+        "os.environ",
+        {
+            "RSTUDIO_PRODUCT": "CONNECT",
+            "CONNECT_CONTENT_GUID": "f2f37341-e21d-3d80-c698-a935ad614066",
+        },
+    )
+    def test_with_user_session_token_response_cache(self):
+        url = "https://connect.example.com"
+        client = Client(api_key="12345", url=url, cache=ResponseCache(maxsize=10, ttl=60))
+        client._ctx.version = None
+
+        responses.post(
+            "https://connect.example.com/__api__/v1/oauth/integrations/credentials",
+            json={"access_token": "api-key", "token_type": "Key"},
+        )
+        responses.get(
+            "https://connect.example.com/__api__/v1/content/f2f37341-e21d-3d80-c698-a935ad614066",
+            json=load_mock("v1/content/f2f37341-e21d-3d80-c698-a935ad614066.json"),
+        )
+        responses.get(
+            "https://connect.example.com/__api__/v1/content/f2f37341-e21d-3d80-c698-a935ad614066/oauth/integrations/associations",
+            json=[],
+        )
+
+        visitor_client = client.with_user_session_token("cit")
+
+        # the visitor does not share the responses cached for the client's credentials
+        cache = visitor_client.session.cache
+        assert cache is not None
+        assert cache is not client.session.cache
+        assert (cache.maxsize, cache.ttl, len(cache)) == (10, 60, 0)
+
     @responses.activate
     @patch.dict(
         "os.environ",
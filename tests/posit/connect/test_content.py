@@ -1,9 +1,12 @@
+import json
+from unittest import mock
+
 import pytest
 import responses
 from responses import matchers
 
 from posit.connect.client import Client
-from posit.connect.content import ContentItem
+from posit.connect.content import Content, ContentItem
 from posit.connect.resources import _Resource
 
 from .api import load_mock, load_mock_dict
@@ -411,6 +414,79 @@ class TestContentsCount:
         count = con.content.count()
         assert count == 3
 
+    @responses.activate
+    def test_does_not_create_items(self):
+        responses.get(
+            "https://connect.example/__api__/v1/content",
+            json=load_mock("v1/content.json"),
+        )
+        con = Client(api_key="12345", url="https://connect.example/")
+        with mock.patch("posit.connect.content.ContentItem") as ContentItem:
+            assert con.content.count() == 3
+        ContentItem.assert_not_called()
+
+    @responses.activate
+    def test_reuses_recent_count(self):
+        mock_get = responses.get(
+            "https://connect.example/__api__/v1/content",
+            json=load_mock("v1/content.json"),
+        )
+        con = Client(api_key="12345", url="https://connect.example/")
+        assert con.content.count(max_age=10) == 3
+        assert con.content.count(max_age=10) == 3
+        assert mock_get.call_count == 1
+        assert con.content.count() == 3
+        assert mock_get.call_count == 2
+
+    @responses.activate
+    def test_owner_guid(self):
+        owner_guid = "87c12c08-11cd-4de1-8da3-12a7579c4998"
+        responses.get(
+            "https://connect.example/__api__/v1/content",
+            json=load_mock("v1/content.json"),
+            match=[matchers.query_param_matcher({})],
+        )
+        responses.get(
+            "https://connect.example/__api__/v1/content",
+            json=[],
+            match=[matchers.query_param_matcher({"owner_guid": owner_guid})],
+        )
+        con = Client(api_key="12345", url="https://connect.example/")
+        assert con.content.count() == 3
+        assert Content(con._ctx, owner_guid=owner_guid).count() == 0
+
+    @responses.activate
+    def test_invalidated_by_create(self):
+        mock_get = responses.get(
+            "https://connect.example/__api__/v1/content",
+            json=load_mock("v1/content.json"),
+        )
+        responses.post(
+            "https://connect.example/__api__/v1/content",
+            json={"guid": "f2f37341-e21d-3d80-c698-a935ad614066"},
+        )
+        con = Client(api_key="12345", url="https://connect.example/")
+        con.content.count(max_age=10)
+        con.content.create(name="example")
+        con.content.count(max_age=10)
+        assert mock_get.call_count == 2
+
+    @responses.activate
+    def test_count_fetched_before_a_change_is_not_reused(self):
+        con = Client(api_key="12345", url="https://connect.example/")
+
+        def callback(request):
+            # content is created while the count is being fetched
+            con._ctx.content_counts.clear()
+            return (200, {}, json.dumps(load_mock("v1/content.json")))
+
+        responses.add_callback(
+            responses.GET, "https://connect.example/__api__/v1/content", callback=callback
+        )
+        assert con.content.count(max_age=10) == 3
+        assert con.content.count(max_age=10) == 3
+        assert len(responses.calls) == 2
+
 
 class TestRender:
     @responses.activate
@@ -1,3 +1,4 @@
+from concurrent.futures import ThreadPoolExecutor
 from email.contentmanager import ContentManager
 from unittest.mock import MagicMock, Mock
 
@@ -85,3 +86,14 @@ class TestContextVersion:
         ctx = Context(Mock())
         ctx.version = "2024.09.24"
         assert ctx.version == "2024.09.24"
+
+
+class TestContextState:
+    def test_shared_across_threads(self):
+        ctx = Context(Mock())
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            memberships = set(executor.map(lambda _: id(ctx.group_memberships), range(32)))
+        assert memberships == {id(ctx.group_memberships)}
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            caches = set(executor.map(lambda _: id(ctx.oauth_credentials), range(32)))
+        assert caches == {id(ctx.oauth_credentials)}
@@ -0,0 +1,70 @@
+import time
+from unittest.mock import Mock
+
+import pytest
+
+from posit.connect.cursors import CursorPaginator
+
+
+def _ctx(count, fail_at=None):
+    """Create a context whose client serves `count` cursor pages."""
+
+    def get(path, params):
+        index = int(params["next"] or 0)
+        if index == fail_at:
+            raise RuntimeError("boom")
+        response = Mock()
+        next_page = str(index + 1) if index + 1 < count else None
+        response.json.return_value = {
+            "paging": {"cursors": {"next": next_page}},
+            "results": [index],
+        }
+        return response
+
+    ctx = Mock()
+    ctx.client.get = Mock(side_effect=get)
+    return ctx
+
+
+class TestCursorPaginatorFetchPages:
+    def test_default(self):
+        ctx = _ctx(3)
+        paginator = CursorPaginator(ctx, "v1/things")
+        assert paginator.fetch_results() == [0, 1, 2]
+        assert ctx.client.get.call_count == 3
+
+    @pytest.mark.parametrize("prefetch", [1, 2, 5])
+    def test_prefetch(self, prefetch):
+        ctx = _ctx(10)
+        paginator = CursorPaginator(ctx, "v1/things", prefetch=prefetch)
+        assert paginator.fetch_results() == list(range(10))
+        assert ctx.client.get.call_count == 10
+
+    def test_prefetch_depth(self):
+        ctx = _ctx(100)
+        paginator = CursorPaginator(ctx, "v1/things", prefetch=2)
+        pages = paginator.fetch_pages()
+        assert next(pages).results == [0]
+        # give the producer time to fetch up to the prefetch depth
+        time.sleep(0.1)
+        assert ctx.client.get.call_count == 3
+        pages.close()
+
+    def test_prefetch_stops_when_closed(self):
+        ctx = _ctx(100)
+        paginator = CursorPaginator(ctx, "v1/things", prefetch=1)
+        pages = paginator.fetch_pages()
+        assert next(pages).results == [0]
+        pages.close()
+        time.sleep(0.1)
+        assert ctx.client.get.call_count <= 2
+
+    def test_prefetch_raises(self):
+        ctx = _ctx(10, fail_at=3)
+        paginator = CursorPaginator(ctx, "v1/things", prefetch=2)
+        with pytest.raises(RuntimeError, match="boom"):
+            paginator.fetch_results()
+
+    def test_invalid_prefetch(self):
+        with pytest.raises(ValueError):
+            CursorPaginator(Mock(), "v1/things", prefetch=-1)
@@ -0,0 +1,152 @@
+import sys
+
+import pytest
+import responses
+from responses import matchers
+
+from posit import connect
+from posit.connect.frames import _columns, to_arrow, to_pandas, to_polars
+
+from .api import load_mock
+
+RESULTS = [
+    {"guid": "a", "count": 1, "started": "2024-01-01T10:00:00Z"},
+    {"guid": "b", "started": "2024-01-01T12:30:00.5-02:00", "ended": None},
+    {"guid": "c", "count": 3, "started": None, "ended": "2024-01-02T00:00:00Z"},
+]
+
+
+def test_columns():
+    columns, rows = _columns(iter(RESULTS))
+    assert rows == 3
+    assert columns == {
+        "guid": ["a", "b", "c"],
+        "count": [1, None, 3],
+        "started": [
+            "2024-01-01T10:00:00Z",
+            "2024-01-01T12:30:00.5-02:00",
+            None,
+        ],
+        "ended": [None, None, "2024-01-02T00:00:00Z"],
+    }
+
+
+def test_missing_package_names_extra(monkeypatch):
+    monkeypatch.setitem(sys.modules, "polars", None)
+    with pytest.raises(ImportError, match=r"posit-sdk\[polars\]"):
+        to_polars(RESULTS)
+
+
+def test_to_arrow():
+    pa = pytest.importorskip("pyarrow")
+    table = to_arrow(RESULTS, ("started", "ended", "missing"))
+    assert table.column_names == ["guid", "count", "started", "ended"]
+    assert table.schema.field("started").type == pa.timestamp("us", tz="UTC")
+    started = table.column("started").to_pylist()
+    assert [value.isoformat() if value else None for value in started] == [
+        "2024-01-01T10:00:00+00:00",
+        "2024-01-01T14:30:00.500000+00:00",
+        None,
+    ]
+    assert table.column("count").to_pylist() == [1, None, 3]
+
+
+def test_to_pandas():
+    pd = pytest.importorskip("pandas")
+    frame = to_pandas(RESULTS, ("started", "ended"))
+    assert list(frame.columns) == ["guid", "count", "started", "ended"]
+    assert str(frame["started"].dt.tz) == "UTC"
+    assert frame["started"][1] == pd.Timestamp("2024-01-01T14:30:00.5Z")
+    assert pd.isna(frame["started"][2])
+
+
+def test_to_polars():
+    pl = pytest.importorskip("polars")
+    frame = to_polars(RESULTS, ("started", "ended"))
+    assert frame.columns == ["guid", "count", "started", "ended"]
+    assert frame.schema["started"] == pl.Datetime("us", "UTC")
+    assert frame["started"].null_count() == 1
+    assert frame["count"].to_list() == [1, None, 3]
+
+
+def test_null_timestamps():
+    # e.g. the end times of Shiny sessions which are still open
+    results = [{"started": "2024-01-01T10:00:00Z", "ended": None}, {"ended": None}]
+    pa = pytest.importorskip("pyarrow")
+    assert to_arrow(results, ("ended",)).schema.field("ended").type == pa.timestamp("us", tz="UTC")
+    pd = pytest.importorskip("pandas")
+    dtype = to_pandas(results, ("ended",))["ended"].dtype
+    assert isinstance(dtype, pd.DatetimeTZDtype)
+    assert str(dtype).endswith(", UTC]")
+    pl = pytest.importorskip("polars")
+    assert to_polars(results, ("ended",)).schema["ended"] == pl.Datetime("us", "UTC")
+
+
+def test_nanosecond_timestamps():
+    results = [{"started": "2024-01-01T10:00:00.123456789Z"}]
+    pytest.importorskip("pyarrow")
+    started = to_arrow(results, ("started",)).column("started").to_pylist()
+    assert started[0].isoformat() == "2024-01-01T10:00:00.123456+00:00"
+    pd = pytest.importorskip("pandas")
+    assert to_pandas(results, ("started",))["started"][0] == pd.Timestamp(
+        "2024-01-01T10:00:00.123456789Z"
+    )
+    pl = pytest.importorskip("polars")
+    started = to_polars(results, ("started",))["started"].to_list()
+    assert started[0].isoformat() == "2024-01-01T10:00:00.123456+00:00"
+
+
+def test_empty():
+    pytest.importorskip("pyarrow")
+    assert to_arrow([], ("started",)).num_rows == 0
+
+
+class TestFinders:
+    @responses.activate
+    def test_users(self):
+        pytest.importorskip("pyarrow")
+        responses.get(
+            "https://connect.example/__api__/v1/users",
+            json=load_mock("v1/users?page_number=1&page_size=500.jsonc"),
+            match=[matchers.query_param_matcher({"page_size": 500, "page_number": 1})],
+        )
+        responses.get(
+            "https://connect.example/__api__/v1/users",
+            json=load_mock("v1/users?page_number=2&page_size=500.jsonc"),
+            match=[matchers.query_param_matcher({"page_size": 500, "page_number": 2})],
+        )
+        c = connect.Client("https://connect.example", "12345")
+        table = c.users.to_arrow()
+        assert table.column("guid").to_pylist() == [user["guid"] for user in c.users.find()]
+        assert str(table.schema.field("created_time").type) == "timestamp[us, tz=UTC]"
+
+    @responses.activate
+    def test_usage(self):
+        pd = pytest.importorskip("pandas")
+        for path in ("content/visits", "shiny/usage"):
+            responses.get(
+                f"https://connect.example/__api__/v1/instrumentation/{path}",
+                json=load_mock(f"v1/instrumentation/{path}?limit=500.json"),
+                match=[matchers.query_param_matcher({"limit": 500})],
+            )
+            responses.get(
+                f"https://connect.example/__api__/v1/instrumentation/{path}",
+                json=load_mock(f"v1/instrumentation/{path}?limit=500&next=23948901087.json"),
+                match=[matchers.query_param_matcher({"next": "23948901087", "limit": 500})],
+            )
+        c = connect.Client("https://connect.example", "12345")
+        frame = c.metrics.usage.to_pandas()
+        events = c.metrics.usage.find()
+        assert list(frame["content_guid"]) == [event.content_guid for event in events]
+        assert list(frame["started"]) == [pd.Timestamp(event.started) for event in events]
+
+    @responses.activate
+    def test_content(self):
+        pytest.importorskip("polars")
+        responses.get(
+            "https://connect.example/__api__/v1/content",
+            json=load_mock("v1/content.json"),
+        )
+        c = connect.Client("https://connect.example", "12345")
+        frame = c.content.to_polars()
+        assert frame["guid"].to_list() == [item["guid"] for item in c.content.find()]
@@ -1,12 +1,14 @@
+import threading
+import time
 from unittest import mock
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
 import pytest
 import responses
 
 from posit.connect.client import Client
 from posit.connect.context import Context
-from posit.connect.groups import Group
+from posit.connect.groups import Group, GroupMemberships, _MembershipIndex
 from posit.connect.users import User
 
 from .api import load_mock_dict
@@ -63,6 +65,17 @@ class TestGroupMembers:
         for user in group_users:
             assert isinstance(user, User)
 
+    @responses.activate
+    def test_members_iter_find(self):
+        responses.get(
+            f"https://connect.example/__api__/v1/groups/{self.group['guid']}/members",
+            json=load_mock_dict(f"v1/groups/{self.group['guid']}/members.json"),
+        )
+
+        group_users = self.group.members.iter_find()
+        assert not isinstance(group_users, list)
+        assert all(isinstance(user, User) for user in group_users)
+
     @responses.activate
     def test_members_add(self):
         user_guid = "user-guid"
@@ -114,3 +127,118 @@ class TestGroupMembers:
 
         with pytest.raises(ValueError):
             self.group.members.delete(user_guid="")
+
+
+class TestGroupMemberships:
+    base = "https://connect.example/__api__"
+
+    def _page(self, results):
+        return {"results": results, "current_page": 1, "total": len(results)}
+
+    def _setup(self):
+        self.groups = responses.get(
+            f"{self.base}/v1/groups",
+            json=self._page([{"guid": "g1", "name": "One"}, {"guid": "g2", "name": "Two"}]),
+        )
+        self.g1 = responses.get(
+            f"{self.base}/v1/groups/g1/members",
+            json=self._page([{"guid": "u1"}, {"guid": "u2"}]),
+        )
+        self.g2 = responses.get(
+            f"{self.base}/v1/groups/g2/members",
+            json=self._page([{"guid": "u2"}]),
+        )
+        self.client = Client("https://connect.example", "12345")
+
+    @responses.activate
+    def test_lookups(self):
+        self._setup()
+        memberships = self.client.groups.memberships
+        assert [group["name"] for group in memberships.groups_for("u1")] == ["One"]
+        assert [group["name"] for group in memberships.groups_for("u2")] == ["One", "Two"]
+        assert memberships.groups_for("u3") == []
+        assert [user["guid"] for user in memberships.users_for("g1")] == ["u1", "u2"]
+        assert memberships.users_for("g3") == []
+        assert {
+            user_guid: [group["guid"] for group in groups]
+            for user_guid, groups in memberships.groups_by_user().items()
+        } == {"u1": ["g1"], "u2": ["g1", "g2"]}
+
+        # the index is built once
+        assert self.groups.call_count == 1
+        assert self.g1.call_count == 1
+        assert self.g2.call_count == 1
+
+    @responses.activate
+    def test_shared_by_client(self):
+        self._setup()
+        assert self.client.groups.memberships is self.client.groups.memberships
+        User(self.client._ctx, guid="u1").groups.find(max_age=60)
+        User(self.client._ctx, guid="u2").groups.find(max_age=60)
+        assert self.groups.call_count == 1
+
+    @responses.activate
+    def test_find_is_current_by_default(self):
+        self._setup()
+        user = User(self.client._ctx, guid="u1")
+        user.groups.find()
+        user.groups.find()
+        assert self.groups.call_count == 2
+
+    @responses.activate
+    def test_expires(self):
+        self._setup()
+        memberships = self.client.groups.memberships
+        memberships.groups_for("u1")
+        memberships.ttl = 0
+        memberships.groups_for("u1")
+        assert self.groups.call_count == 2
+
+    @responses.activate
+    def test_refresh(self):
+        self._setup()
+        memberships = self.client.groups.memberships
+        memberships.groups_for("u1")
+        memberships.refresh()
+        assert self.groups.call_count == 2
+        memberships.groups_for("u1")
+        assert self.groups.call_count == 2
+
+    @responses.activate
+    def test_invalidated_by_membership_changes(self):
+        self._setup()
+        responses.post(f"{self.base}/v1/groups/g2/members")
+        responses.delete(f"{self.base}/v1/groups/g1/members/u1")
+        user = User(self.client._ctx, guid="u1")
+        user.groups.find(max_age=60)
+        user.groups.add(Group(self.client._ctx, guid="g2"))
+        user.groups.find(max_age=60)
+        assert self.groups.call_count == 2
+        user.groups.delete(Group(self.client._ctx, guid="g1"))
+        user.groups.find(max_age=60)
+        assert self.groups.call_count == 3
+
+    def test_invalidate_does_not_wait_for_build(self):
+        memberships = GroupMemberships(Mock())
+        building = threading.Event()
+        release = threading.Event()
+
+        def build():
+            building.set()
+            release.wait(5)
+            return _MembershipIndex(
+                groups={}, members={}, user_groups={}, started=time.monotonic()
+            )
+
+        with patch.object(memberships, "_build", side_effect=build):
+            thread = threading.Thread(target=memberships.refresh)
+            thread.start()
+            assert building.wait(5)
+            # invalidated while the build is in flight, so its index is not kept
+            invalidated = threading.Thread(target=memberships.invalidate)
+            invalidated.start()
+            invalidated.join(1)
+            assert not invalidated.is_alive()
+            release.set()
+            thread.join()
+        assert memberships._index is None
@@ -0,0 +1,145 @@
+from unittest.mock import Mock
+
+import pytest
+import responses
+
+from posit.connect.client import Client
+from posit.connect.errors import ClientError
+from posit.connect.instrumentation import (
+    Instrumentation,
+    RequestEvent,
+    normalize_route,
+)
+
+GUID = "f2f37341-be58-4c32-a5a6-0a8d4e8a3d7f"
+
+
+@pytest.mark.parametrize(
+    ("path", "route"),
+    [
+        ("/__api__/v1/content", "v1/content"),
+        (f"/__api__/v1/content/{GUID}", "v1/content/{guid}"),
+        (f"/__api__/v1/content/{GUID}/permissions", "v1/content/{guid}/permissions"),
+        (f"/__api__/v1/content/{GUID}/bundles/101", "v1/content/{guid}/bundles/{id}"),
+        ("/__api__/v1/tasks/jXhOhdm5OOSkGhJw", "v1/tasks/{id}"),
+        ("/__api__/server_settings", "server_settings"),
+        ("/rsc/__api__/v1/users", "v1/users"),
+        ("v1/users", "v1/users"),
+    ],
+)
+def test_normalize_route(path, route):
+    assert normalize_route(path) == route
+
+
+def _event(**kwargs):
+    defaults = {
+        "method": "GET",
+        "route": "v1/content",
+        "url": "https://connect.example.com/__api__/v1/content",
+        "status": 200,
+        "seconds": 0.02,
+        "bytes": 10,
+        "retries": 0,
+    }
+    return RequestEvent(**{**defaults, **kwargs})
+
+
+class TestInstrumentation:
+    def test_record(self):
+        instrumentation = Instrumentation(buckets=[0.1, 1])
+        instrumentation.record(_event(seconds=0.05))
+        instrumentation.record(_event(seconds=0.5, status=404, bytes=5, retries=2))
+        instrumentation.record(_event(seconds=5))
+        instrumentation.record(_event(method="POST"))
+
+        snapshot = instrumentation.snapshot()
+        assert set(snapshot) == {"GET v1/content", "POST v1/content"}
+        stats = snapshot["GET v1/content"]
+        assert stats.count == 3
+        assert stats.seconds == pytest.approx(5.55)
+        assert stats.mean_seconds == pytest.approx(1.85)
+        assert stats.bytes == 25
+        assert stats.retries == 2
+        assert stats.statuses == {200: 2, 404: 1}
+        assert stats.latency == {0.1: 1, 1: 1, float("inf"): 1}
+
+    def test_snapshot_is_a_copy(self):
+        instrumentation = Instrumentation()
+        instrumentation.record(_event())
+        snapshot = instrumentation.snapshot()
+        instrumentation.record(_event())
+        assert snapshot["GET v1/content"].count == 1
+        assert instrumentation.snapshot()["GET v1/content"].count == 2
+
+    def test_reset(self):
+        instrumentation = Instrumentation()
+        instrumentation.record(_event())
+        instrumentation.reset()
+        assert instrumentation.snapshot() == {}
+
+    def test_exporters(self):
+        exporter = Mock()
+        failing = Mock(side_effect=RuntimeError)
+        instrumentation = Instrumentation(exporters=[failing])
+        instrumentation.add_exporter(exporter)
+        event = _event()
+        instrumentation.record(event)
+        failing.assert_called_once_with(event)
+        exporter.assert_called_once_with(event)
+
+    def test_hook_counts_retries(self):
+        response = Mock()
+        response.status_code = 200
+        response.content = b"[]"
+        response.elapsed.total_seconds.return_value = 0.1
+        response.request.method = "GET"
+        response.request.url = "https://connect.example.com/__api__/v1/users?page_number=1"
+        response.raw.retries.history = (Mock(), Mock())
+        instrumentation = Instrumentation()
+        assert instrumentation.hook(response) is response
+        stats = instrumentation.snapshot()["GET v1/users"]
+        assert stats.retries == 2
+        assert stats.bytes == 2
+        assert stats.seconds >= 0.1
+
+
+class TestClientInstrumentation:
+    @responses.activate
+    def test_records_requests(self):
+        responses.get(f"https://connect.example.com/__api__/v1/content/{GUID}", body="{}")
+        responses.get(
+            "https://connect.example.com/__api__/v1/content/missing",
+            status=404,
+            json={"code": 4, "error": "not found"},
+        )
+        instrumentation = Instrumentation()
+        client = Client("https://connect.example.com", "12345", instrumentation=instrumentation)
+        assert client.instrumentation is instrumentation
+        client.get(f"v1/content/{GUID}")
+        client.get(f"v1/content/{GUID}", params={"include": "owner"})
+        with pytest.raises(ClientError):
+            client.get("v1/content/missing")
+
+        snapshot = instrumentation.snapshot()
+        stats = snapshot["GET v1/content/{guid}"]
+        assert stats.count == 2
+        assert stats.bytes == 4
+        assert stats.statuses == {200: 2}
+        assert snapshot["GET v1/content/missing"].statuses == {404: 1}
+
+    @responses.activate
+    def test_streamed_response(self):
+        responses.get(
+            "https://connect.example.com/__api__/v1/content/bundle/download",
+            body=b"x" * 100,
+            headers={"Content-Length": "100"},
+        )
+        instrumentation = Instrumentation()
+        client = Client("https://connect.example.com", "12345", instrumentation=instrumentation)
+        response = client.get("v1/content/bundle/download", stream=True)
+        assert instrumentation.snapshot()["GET v1/content/bundle/download"].bytes == 100
+        assert response.raw.read() == b"x" * 100
+
+    def test_disabled_by_default(self):
+        client = Client("https://connect.example.com", "12345")
+        assert client.instrumentation is None
@@ -0,0 +1,77 @@
+from unittest.mock import Mock
+
+import pytest
+
+from posit.connect.paginator import Paginator
+
+
+def _ctx(pages: dict):
+    """Create a context whose client responds with the given page numbers."""
+
+    def get(path, params):
+        response = Mock()
+        response.json.return_value = pages.get(
+            params["page_number"],
+            {"current_page": params["page_number"], "total": 0, "results": []},
+        )
+        return response
+
+    ctx = Mock()
+    ctx.client.get = Mock(side_effect=get)
+    return ctx
+
+
+def _page(page_number: int, total: int, results: list):
+    return {"current_page": page_number, "total": total, "results": results}
+
+
+class TestPaginatorFetchPages:
+    def test_sequential(self):
+        ctx = _ctx({1: _page(1, 3, [1, 2]), 2: _page(2, 3, [3])})
+        paginator = Paginator(ctx, "v1/things", page_size=2)
+        assert paginator.fetch_results() == [1, 2, 3]
+        assert ctx.client.get.call_count == 2
+
+    @pytest.mark.parametrize("max_workers", [2, 3, 10])
+    def test_concurrent_preserves_order(self, max_workers):
+        pages = {n: _page(n, 20, [n * 2 - 1, n * 2]) for n in range(1, 11)}
+        ctx = _ctx(pages)
+        paginator = Paginator(ctx, "v1/things", page_size=2, max_workers=max_workers)
+        assert [page.current_page for page in paginator.fetch_pages()] == list(range(1, 11))
+        assert ctx.client.get.call_count == 10
+
+    def test_concurrent_uses_server_page_size(self):
+        # the server caps the page size at 2 even though 500 was requested
+        ctx = _ctx({1: _page(1, 5, [1, 2]), 2: _page(2, 5, [3, 4]), 3: _page(3, 5, [5])})
+        paginator = Paginator(ctx, "v1/things", max_workers=4)
+        assert paginator.fetch_results() == [1, 2, 3, 4, 5]
+
+    def test_concurrent_total_shrinks(self):
+        ctx = _ctx({1: _page(1, 6, [1, 2]), 2: _page(2, 3, [3])})
+        paginator = Paginator(ctx, "v1/things", page_size=2, max_workers=2)
+        assert paginator.fetch_results() == [1, 2, 3]
+
+    def test_concurrent_total_grows(self):
+        ctx = _ctx({1: _page(1, 4, [1, 2]), 2: _page(2, 6, [3, 4]), 3: _page(3, 6, [5, 6])})
+        paginator = Paginator(ctx, "v1/things", page_size=2, max_workers=2)
+        assert paginator.fetch_results() == [1, 2, 3, 4, 5, 6]
+
+    def test_concurrent_empty(self):
+        ctx = _ctx({})
+        paginator = Paginator(ctx, "v1/things", max_workers=2)
+        assert paginator.fetch_results() == []
+        assert ctx.client.get.call_count == 1
+
+    def test_concurrent_stops_early(self):
+        ctx = _ctx({n: _page(n, 200, [n * 2 - 1, n * 2]) for n in range(1, 101)})
+        paginator = Paginator(ctx, "v1/things", page_size=2, max_workers=2)
+        pages = paginator.fetch_pages()
+        assert next(pages).results == [1, 2]
+        assert next(pages).results == [3, 4]
+        pages.close()
+        # at most one window of pages is in flight beyond what was consumed
+        assert ctx.client.get.call_count <= 1 + 2 + 2
+
+    def test_invalid_max_workers(self):
+        with pytest.raises(ValueError):
+            Paginator(Mock(), "v1/things", max_workers=0)
@@ -0,0 +1,90 @@
+from unittest.mock import patch
+
+import pytest
+import responses
+
+from posit.connect.client import Client
+from posit.connect.rate_limits import RateLimiter
+
+CLOCK = ["posit.connect.rate_limits.time.monotonic", "posit.connect.rate_limits.time.sleep"]
+
+
+class TestRateLimiter:
+    def test_invalid_options(self):
+        with pytest.raises(ValueError):
+            RateLimiter(0)
+        with pytest.raises(ValueError):
+            RateLimiter(1, burst=0)
+
+    def test_default_burst(self):
+        assert RateLimiter(0.5).burst == 1
+        assert RateLimiter(2.5).burst == 3
+
+    def test_burst_then_rate(self, clock):
+        limiter = RateLimiter(2, burst=3)
+        assert [limiter.acquire() for _ in range(3)] == [0, 0, 0]
+        assert limiter.acquire() == 0.5
+        assert limiter.acquire() == 0.5
+        assert clock.now == 1.0
+
+    def test_refills_while_idle(self, clock):
+        limiter = RateLimiter(2, burst=2)
+        limiter.acquire()
+        limiter.acquire()
+        clock.now += 10
+        # the bucket never holds more than the burst
+        assert [limiter.acquire() for _ in range(3)] == [0, 0, 0.5]
+
+    def test_concurrent_callers_queue(self, clock):
+        limiter = RateLimiter(1, burst=1)
+        limiter.acquire()
+        # reservations made before any sleep completes are spaced one interval apart
+        with patch("posit.connect.rate_limits.time.sleep"):
+            assert [limiter.acquire() for _ in range(3)] == [1, 2, 3]
+
+
+class TestClientRateLimit:
+    url = "https://connect.example.com/__api__/v1/content"
+
+    @responses.activate
+    def test_limits_all_requests(self, clock):
+        responses.get(self.url, json=[])
+        responses.post(self.url, json={})
+        client = Client("https://connect.example.com", "12345", rate_limit=RateLimiter(1))
+        client.get("v1/content")
+        client.post("v1/content", json={})
+        client.get("v1/content")
+        assert clock.now == 2
+
+    @responses.activate
+    def test_limits_writes_separately(self, clock):
+        responses.get(self.url, json=[])
+        responses.delete(self.url)
+        client = Client(
+            "https://connect.example.com",
+            "12345",
+            rate_limit=RateLimiter(100, burst=100),
+            write_rate_limit=0.5,
+        )
+        for _ in range(10):
+            client.get("v1/content")
+        assert clock.now == 0
+        client.delete("v1/content")
+        client.delete("v1/content")
+        assert clock.now == 2
+
+    @responses.activate
+    def test_limits_retries(self, clock):
+        responses.get(self.url, status=429)
+        responses.get(self.url, status=429)
+        responses.get(self.url, json=[])
+        client = Client("https://connect.example.com", "12345", rate_limit=RateLimiter(1))
+        with patch("posit.connect.retries.Retry.sleep"):
+            assert client.get("v1/content").status_code == 200
+        assert client.session.retry_count == 2
+        assert clock.now == 2
+
+    def test_unlimited_by_default(self):
+        client = Client("https://connect.example.com", "12345")
+        assert client.session.rate_limit is None
+        assert client.session.write_rate_limit is None
@@ -0,0 +1,49 @@
+import pickle
+
+import pytest
+
+from posit.connect.records import Record, to_record
+
+
+class TestRecord:
+    def test_mapping(self):
+        record = to_record({"guid": "abc", "name": "One", "count": 2})
+        assert isinstance(record, Record)
+        assert record["guid"] == "abc"
+        assert record.get("count") == 2
+        assert record.get("missing") is None
+        assert "name" in record
+        assert "abc" not in record
+        assert list(record) == ["guid", "name", "count"]
+        assert len(record) == 3
+        assert dict(record) == {"guid": "abc", "name": "One", "count": 2}
+        assert record == {"guid": "abc", "name": "One", "count": 2}
+        with pytest.raises(KeyError):
+            record["missing"]
+
+    def test_read_only(self):
+        record = to_record({"guid": "abc"})
+        with pytest.raises(TypeError):
+            record["guid"] = "def"  # pyright: ignore[reportIndexIssue]
+
+    def test_compact(self):
+        record = to_record({"guid": "abc"})
+        assert not hasattr(record, "__dict__")
+
+    def test_shared_schema(self):
+        one = to_record({"guid": "abc", "name": "One"})
+        two = to_record({"guid": "def", "name": "Two"})
+        other = to_record({"name": "Three", "guid": "ghi"})
+        assert type(one) is type(two)
+        assert type(one) is not type(other)
+
+    def test_to_dict(self):
+        result = {"guid": "abc", "tags": ["a"]}
+        assert to_record(result).to_dict() == result
+
+    def test_repr(self):
+        assert repr(to_record({"guid": "abc"})) == "Record({'guid': 'abc'})"
+
+    def test_pickle(self):
+        record = to_record({"guid": "abc", "count": 2})
+        assert pickle.loads(pickle.dumps(record)) == record
@@ -4,11 +4,14 @@ from unittest.mock import Mock
 
 from typing_extensions import Optional
 
+from posit.connect.records import Record
 from posit.connect.resources import (
     BaseResource,
     _contains_dict_key_values,
     _matches_exact,
     _matches_pattern,
+    _PaginatedResourceSequence,
+    _ResourceSequence,
 )
 
 config = Mock()
@@ -69,6 +72,99 @@ class TestResource:
         assert r.foo == v
 
 
+def _sequence_ctx(*pages):
+    """Create a context whose client responds with the given lists of results."""
+
+    def get(path, params):
+        response = Mock()
+        if "page_number" in params:
+            results = (
+                pages[params["page_number"] - 1] if params["page_number"] <= len(pages) else []
+            )
+            response.json.return_value = {
+                "current_page": params["page_number"],
+                "total": sum(len(page) for page in pages),
+                "results": results,
+            }
+        else:
+            response.json.return_value = pages[0]
+        return response
+
+    ctx = Mock()
+    ctx.client.get = Mock(side_effect=get)
+    return ctx
+
+
+class TestResourceSequenceSnapshot:
+    def test_live_by_default(self):
+        ctx = _sequence_ctx([{"key": "a"}, {"key": "b"}])
+        sequence = _ResourceSequence(ctx, "v1/content/1/jobs", uid="key")
+        for i in range(len(sequence)):
+            assert sequence[i]["key"] in ("a", "b")
+        assert ctx.client.get.call_count == 3
+
+    def test_snapshot(self):
+        ctx = _sequence_ctx([{"key": "a"}, {"key": "b"}])
+        sequence = _ResourceSequence(ctx, "v1/content/1/jobs", uid="key").snapshot()
+        assert [sequence[i]["key"] for i in range(len(sequence))] == ["a", "b"]
+        assert [job["key"] for job in sequence] == ["a", "b"]
+        assert "'key': 'a'" in repr(sequence)
+        assert ctx.client.get.call_count == 1
+
+    def test_snapshot_does_not_modify_original(self):
+        ctx = _sequence_ctx([{"key": "a"}])
+        sequence = _ResourceSequence(ctx, "v1/content/1/jobs", uid="key")
+        sequence.snapshot()
+        len(sequence)
+        len(sequence)
+        assert ctx.client.get.call_count == 2
+
+    def test_refresh(self):
+        ctx = _sequence_ctx([{"key": "a"}])
+        sequence = _ResourceSequence(ctx, "v1/content/1/jobs", uid="key").snapshot()
+        len(sequence)
+        sequence.refresh()
+        len(sequence)
+        assert ctx.client.get.call_count == 2
+
+    def test_max_age(self):
+        ctx = _sequence_ctx([{"key": "a"}])
+        sequence = _ResourceSequence(ctx, "v1/content/1/jobs", uid="key").snapshot(max_age=60)
+        with mock.patch("posit.connect.resources.time.monotonic", return_value=0):
+            len(sequence)
+        with mock.patch("posit.connect.resources.time.monotonic", return_value=59):
+            len(sequence)
+        assert ctx.client.get.call_count == 1
+        with mock.patch("posit.connect.resources.time.monotonic", return_value=60):
+            len(sequence)
+        assert ctx.client.get.call_count == 2
+
+    def test_create_invalidates_snapshot(self):
+        ctx = _sequence_ctx([{"key": "a"}])
+        ctx.client.post.return_value.json.return_value = {"key": "b"}
+        sequence = _ResourceSequence(ctx, "v1/content/1/jobs", uid="key").snapshot()
+        len(sequence)
+        sequence.create(key="b")
+        len(sequence)
+        assert ctx.client.get.call_count == 2
+
+    def test_paginated(self):
+        ctx = _sequence_ctx([{"name": "a"}, {"name": "b"}], [{"name": "c"}])
+        sequence = _PaginatedResourceSequence(ctx, "v1/packages", uid="name").snapshot()
+        assert len(sequence) == 3
+        assert sequence[2]["name"] == "c"
+        assert [package["name"] for package in sequence] == ["a", "b", "c"]
+        assert ctx.client.get.call_count == 2
+
+
+def test_paginated_fetch_records():
+    ctx = _sequence_ctx([{"name": "a"}, {"name": "b"}], [{"name": "c"}])
+    sequence = _PaginatedResourceSequence(ctx, "v1/packages", uid="name")
+    records = list(sequence.fetch_records())
+    assert all(isinstance(record, Record) for record in records)
+    assert [record["name"] for record in records] == ["a", "b", "c"]
+
+
 class TestContainsDictKeyValues:
     def test_empty_value_dict(self):
         r = FakeResource(mock.Mock(), foo={"a": 1, "b": 2})
@@ -0,0 +1,108 @@
+from unittest.mock import Mock, patch
+
+import pytest
+import responses
+from requests import HTTPError
+from urllib3.response import HTTPResponse
+
+from posit.connect.client import Client
+from posit.connect.errors import ClientError
+from posit.connect.retries import Retry
+
+
+class TestRetry:
+    def test_defaults(self):
+        retry = Retry()
+        assert retry.total == 3
+        assert retry.status_forcelist == {429, 502, 503, 504}
+        assert not retry.raise_on_status
+        assert retry.is_retry("GET", 503)
+        assert not retry.is_retry("POST", 503)
+        assert not retry.is_retry("GET", 500)
+
+    def test_new_preserves_options(self):
+        on_retry = Mock()
+        retry = Retry(backoff_max=7, on_retry=on_retry).new(total=1)
+        assert isinstance(retry, Retry)
+        assert retry.total == 1
+        assert retry.backoff_max == 7
+        assert retry.on_retry is on_retry
+
+    def test_backoff_is_jittered_and_bounded(self):
+        retry = Retry(total=10, backoff_factor=1, backoff_max=4)
+        for _ in range(3):
+            retry = retry.increment("GET", "/", HTTPResponse(status=503))
+        # 1 * 2 ** 2 = 4 seconds, jittered over the second half of the window
+        for _ in range(100):
+            assert 2 <= retry.get_backoff_time() <= 4
+        for _ in range(3):
+            retry = retry.increment("GET", "/", HTTPResponse(status=503))
+        for _ in range(100):
+            assert 2 <= retry.get_backoff_time() <= 4
+
+    def test_on_retry(self):
+        on_retry = Mock()
+        retry = Retry(on_retry=on_retry)
+        retry = retry.increment("GET", "https://connect.example", HTTPResponse(status=503))
+        on_retry.assert_called_once_with("GET", "https://connect.example")
+        retry.increment("GET", "https://connect.example", HTTPResponse(status=503))
+        assert on_retry.call_count == 2
+
+    @patch("time.sleep")
+    def test_sleep_honours_retry_after(self, sleep: Mock):
+        retry = Retry().increment(
+            "GET", "/", HTTPResponse(status=429, headers={"Retry-After": "7"})
+        )
+        retry.sleep(HTTPResponse(status=429, headers={"Retry-After": "7"}))
+        sleep.assert_called_once_with(7)
+
+
+class TestClientRetry:
+    @responses.activate
+    def test_retries_idempotent_requests(self):
+        mock_get = responses.get(
+            "https://connect.example/__api__/v1/users",
+            status=503,
+            json={"code": 1, "error": "unavailable"},
+        )
+        client = Client("https://connect.example", "12345")
+        with pytest.raises(ClientError):
+            client.get("v1/users")
+        assert mock_get.call_count == 4
+        assert client.session.retry_count == 3
+
+    @responses.activate
+    def test_recovers(self):
+        responses.get("https://connect.example/__api__/v1/users", status=502)
+        responses.get("https://connect.example/__api__/v1/users", json={"ok": True})
+        client = Client("https://connect.example", "12345")
+        assert client.get("v1/users").json() == {"ok": True}
+        assert client.session.retry_count == 1
+
+    @responses.activate
+    def test_does_not_retry_post(self):
+        mock_post = responses.post("https://connect.example/__api__/v1/users", status=503)
+        client = Client("https://connect.example", "12345")
+        with pytest.raises(HTTPError):
+            client.post("v1/users")
+        assert mock_post.call_count == 1
+        assert client.session.retry_count == 0
+
+    @responses.activate
+    def test_disabled(self):
+        mock_get = responses.get("https://connect.example/__api__/v1/users", status=503)
+        client = Client("https://connect.example", "12345", retry=False)
+        with pytest.raises(HTTPError):
+            client.get("v1/users")
+        assert mock_get.call_count == 1
+
+    @responses.activate
+    def test_custom(self):
+        on_retry = Mock()
+        mock_get = responses.get("https://connect.example/__api__/v1/users", status=429)
+        client = Client("https://connect.example", "12345", retry=Retry(1, on_retry=on_retry))
+        with pytest.raises(HTTPError):
+            client.get("v1/users")
+        assert mock_get.call_count == 2
+        on_retry.assert_called_once()
+        assert client.session.retry_count == 1
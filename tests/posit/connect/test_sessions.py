@@ -1,7 +1,12 @@
+import threading
+import time
+
 import pytest
+import requests
 import responses
+from requests.adapters import HTTPAdapter
 
-from posit.connect.sessions import Session
+from posit.connect.sessions import PoolStats, Session
 
 
 @responses.activate
@@ -132,3 +137,108 @@ def test_post_redirect_location_none_explicit():
     # The redirect loop should break since location is None.
     assert len(responses.calls) == 1
     assert response.status_code == 302
+
+
+def test_pool_options():
+    session = Session(pool_connections=2, pool_maxsize=32, pool_block=True)
+    for prefix in ("http://", "https://"):
+        adapter = session.get_adapter(prefix + "connect.example.com")
+        assert isinstance(adapter, HTTPAdapter)
+        assert adapter.poolmanager.connection_pool_kw["maxsize"] == 32
+        assert adapter.poolmanager.connection_pool_kw["block"] is True
+
+
+def test_pool_stats():
+    session = Session(pool_maxsize=4)
+    assert session.pool_stats() == {}
+
+    adapter = session.get_adapter("https://connect.example.com")
+    assert isinstance(adapter, HTTPAdapter)
+    adapter.poolmanager.connection_from_url("https://connect.example.com")
+
+    assert session.pool_stats() == {
+        "https://connect.example.com:443": PoolStats(
+            maxsize=4, in_use=0, idle=0, connections=0, requests=0
+        ),
+    }
+
+
+class TestSingleFlight:
+    url = "https://connect.example.com/__api__/server_settings"
+
+    def _fan_out(self, session: Session, n: int, results: list, errors: list):
+        def get():
+            try:
+                results.append(session.get(self.url))
+            except requests.ConnectionError as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=get) for _ in range(n)]
+        for thread in threads:
+            thread.start()
+        return threads
+
+    @responses.activate
+    def test_shares_in_flight_request(self):
+        release = threading.Event()
+        started = threading.Event()
+
+        def callback(request):
+            started.set()
+            release.wait(5)
+            return (200, {}, '{"version": "2025.01.0"}')
+
+        responses.add_callback(responses.GET, self.url, callback=callback)
+        session = Session(single_flight=True)
+        results, errors = [], []
+        leader = self._fan_out(session, 1, results, errors)
+        assert started.wait(5)
+        followers = self._fan_out(session, 4, results, errors)
+        # give the followers time to join the in-flight request
+        time.sleep(0.1)
+        release.set()
+        for thread in leader + followers:
+            thread.join(5)
+
+        assert len(responses.calls) == 1
+        assert errors == []
+        assert len(results) == 5
+        assert all(result is results[0] for result in results)
+        assert results[0].json() == {"version": "2025.01.0"}
+
+    @responses.activate
+    def test_shares_exception(self):
+        release = threading.Event()
+        started = threading.Event()
+
+        def callback(request):
+            started.set()
+            release.wait(5)
+            raise requests.ConnectionError("boom")
+
+        responses.add_callback(responses.GET, self.url, callback=callback)
+        session = Session(single_flight=True, retry=False)
+        results, errors = [], []
+        leader = self._fan_out(session, 1, results, errors)
+        assert started.wait(5)
+        followers = self._fan_out(session, 2, results, errors)
+        time.sleep(0.1)
+        release.set()
+        for thread in leader + followers:
+            thread.join(5)
+
+        assert len(responses.calls) == 1
+        assert results == []
+        assert len(errors) == 3
+        assert all(isinstance(error, requests.ConnectionError) for error in errors)
+
+    @responses.activate
+    def test_sequential_requests_are_not_shared(self):
+        responses.get(self.url, json={})
+        session = Session(single_flight=True)
+        assert session.get(self.url) is not session.get(self.url)
+        assert len(responses.calls) == 2
+
+    @responses.activate
+    def test_disabled_by_default(self):
+        assert Session()._flights is None
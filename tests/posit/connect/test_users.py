@@ -7,6 +7,7 @@ from responses import matchers
 
 from posit.connect.client import Client
 from posit.connect.groups import Group
+from posit.connect.records import Record
 from posit.connect.users import User
 
 from .api import load_mock, load_mock_dict
@@ -393,6 +394,66 @@ class TestUsersFind:
             "guid": "a01792e3-2e67-402e-99af-be04a48da074",
         }
 
+    @responses.activate
+    def test_max_workers(self):
+        # validate pages are fetched concurrently and returned in order
+        responses.get(
+            "https://connect.example/__api__/v1/users",
+            match=[responses.matchers.query_param_matcher({"page_size": 500, "page_number": 1})],
+            json=load_mock("v1/users?page_number=1&page_size=500.jsonc"),
+        )
+        mock_page_2 = responses.get(
+            "https://connect.example/__api__/v1/users",
+            match=[responses.matchers.query_param_matcher({"page_size": 500, "page_number": 2})],
+            json=load_mock("v1/users?page_number=2&page_size=500.jsonc"),
+        )
+        con = Client(api_key="12345", url="https://connect.example/")
+        users = con.users.find(max_workers=4)
+        assert mock_page_2.call_count == 1
+        assert [user["username"] for user in users] == ["al", "robert", "carlos12"]
+
+    @responses.activate
+    def test_iter_find(self):
+        # validate pages are only fetched as results are consumed
+        mock_page_1 = responses.get(
+            "https://connect.example/__api__/v1/users",
+            match=[responses.matchers.query_param_matcher({"page_size": 500, "page_number": 1})],
+            json=load_mock("v1/users?page_number=1&page_size=500.jsonc"),
+        )
+        mock_page_2 = responses.get(
+            "https://connect.example/__api__/v1/users",
+            match=[responses.matchers.query_param_matcher({"page_size": 500, "page_number": 2})],
+            json=load_mock("v1/users?page_number=2&page_size=500.jsonc"),
+        )
+        con = Client(api_key="12345", url="https://connect.example/")
+        users = con.users.iter_find()
+        assert next(users)["username"] == "al"
+        assert next(users)["username"] == "robert"
+        assert mock_page_1.call_count == 1
+        assert mock_page_2.call_count == 0
+        assert [user["username"] for user in users] == ["carlos12"]
+        assert mock_page_2.call_count == 1
+
+    @responses.activate
+    def test_iter_records(self):
+        for page_number in (1, 2):
+            responses.get(
+                "https://connect.example/__api__/v1/users",
+                match=[
+                    responses.matchers.query_param_matcher(
+                        {"page_size": 500, "page_number": page_number}
+                    )
+                ],
+                json=load_mock(f"v1/users?page_number={page_number}&page_size=500.jsonc"),
+            )
+        con = Client(api_key="12345", url="https://connect.example/")
+        records = list(con.users.iter_records())
+        assert all(isinstance(record, Record) for record in records)
+        assert [record["username"] for record in records] == ["al", "robert", "carlos12"]
+        assert [record.to_dict() for record in records] == [
+            dict(user) for user in con.users.find()
+        ]
+
     @responses.activate
     def test_params(self):
         # validate input params are propagated to the query params
@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+import os
+from unittest.mock import patch
+
 import pytest
 
 from posit.workbench.external.databricks import (
@@ -31,3 +34,20 @@ class TestPositCredentialsHelpers:
 
         # token from the Config is passed through to the auth header
         assert cp() == {"Authorization": "Bearer token"}
+
+    def test_workbench_strategy_reloads_refreshed_token(self, tmp_path):
+        config_file = tmp_path / "databrickscfg"
+        config_file.write_text("[workbench]\nhost = https://databricks.com\ntoken = first\n")
+        with patch.dict("os.environ", {"DATABRICKS_CONFIG_FILE": str(config_file)}):
+            cp = WorkbenchStrategy()()
+            assert cp() == {"Authorization": "Bearer first"}
+
+            # Workbench rewrites the file when it refreshes the token
+            config_file.write_text("[workbench]\nhost = https://databricks.com\ntoken = second\n")
+            stat = config_file.stat()
+            os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+            # the header is reused until the reload interval has passed
+            assert cp() == {"Authorization": "Bearer first"}
+            with patch("posit.workbench.external.databricks._RELOAD_INTERVAL", 0):
+                assert cp() == {"Authorization": "Bearer second"}